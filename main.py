@@ -21,20 +21,29 @@ from PySide6.QtWidgets import QApplication
 from snest import UI
 
 if __name__ == "__main__":
-    mp.set_start_method("spawn")
     mp.freeze_support()  # needed for Windows
+    if sys.platform == "win32":
+        mp.set_start_method("spawn")
+    else:
+        # Workers are started from the nesting QThread, so plain fork is
+        # unsafe. A forkserver keeps the algorithm modules imported once
+        # and forks cheap workers from it instead of booting new interpreters.
+        mp.set_start_method("forkserver")
+        mp.set_forkserver_preload([
+            "numpy",
+            "shapely",
+            "snest.algorithm.GA",
+            "snest.export",
+        ])
     app = QApplication([])
 
     if getattr(sys, "frozen", False):
         # Path to the exe itself
         application_path = os.path.dirname(sys.executable)
-        # Path to the folder containing all the backend files for the exe
-        internal_dir = sys._MEIPASS
     else:
         application_path = os.path.dirname(os.path.abspath(__file__))
-        internal_dir = application_path
 
-    window = UI.UIWrapper(application_path, internal_dir, app)
+    window = UI.UIWrapper(application_path, app)
     window.show()
 
     sys.exit(app.exec())
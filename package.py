@@ -27,8 +27,24 @@ PyInstaller.__main__.run([
     '--icon',
     'logo.ico',
     '--noconfirm',
-    '--add-data',
-    'logo.ico:.',
+    # Only QtCore, QtGui and QtWidgets are used, keep the rest of Qt out
+    '--exclude-module',
+    'PySide6.QtWebEngineCore',
+    '--exclude-module',
+    'PySide6.QtWebEngineWidgets',
+    '--exclude-module',
+    'PySide6.QtQml',
+    '--exclude-module',
+    'PySide6.QtQuick',
+    '--exclude-module',
+    'PySide6.Qt3DCore',
+    '--exclude-module',
+    'PySide6.QtMultimedia',
+    '--exclude-module',
+    'PySide6.QtPdf',
+    # No GUI toolkit besides Qt is used
+    '--exclude-module',
+    'tkinter',
     '--add-data',
     'LICENSE:.'
 ])
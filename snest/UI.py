@@ -15,7 +15,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
-from PySide6.QtCore import Qt, QUrl
+import time
+from PySide6.QtCore import Qt, QUrl, QTimer
 from PySide6.QtGui import QIcon, QCursor, QDesktopServices
 from PySide6.QtWidgets import (
     QApplication,
@@ -31,12 +32,34 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QStackedWidget,
 )
-from snest.nest_thread import NestThread
 from snest.config import ConfigPage
 from snest.amounts import AmountsPage
+from snest import resources_rc  # noqa: F401 registers the :/ resources
 
-VALID_TYPES = ["png", "webp", "tiff", "tif", "bmp"]
+VALID_TYPES = frozenset({".png", ".webp", ".tiff", ".tif", ".bmp"})
+# Skip per-entry icon and symlink lookups, slow on network filesystems
+DIALOG_OPTIONS = (
+    QFileDialog.Option.DontUseCustomDirectoryIcons
+    | QFileDialog.Option.DontResolveSymlinks
+)
 GITHUB_URL = QUrl("https://github.com/4FCG/StickerNest")
+# Minimum seconds between progress bar repaints
+PROGRESS_INTERVAL = 0.05
+# Seconds an output directory check stays valid
+ISDIR_TTL = 2.0
+# Milliseconds to wait after the last keystroke before validating
+VALIDATE_DELAY = 150
+
+_LOGO_ICON = None
+
+
+def _get_logo() -> QIcon:
+    """Return the app icon, only decoding logo.ico the first time."""
+    global _LOGO_ICON
+    if _LOGO_ICON is None:
+        # Compiled into resources_rc, no file access needed
+        _LOGO_ICON = QIcon(":/logo.ico")
+    return _LOGO_ICON
 
 
 class MainPage(QWidget):
@@ -154,14 +177,13 @@ class MainPage(QWidget):
 
 
 class UIWrapper(QMainWindow):
-    def __init__(self, application_path: str, internal_dir: str,
-                 app: QApplication) -> None:
+    def __init__(self, application_path: str, app: QApplication) -> None:
         super().__init__()
 
         self.app = app
 
         self.setWindowTitle("Sticker Nest")
-        self.setWindowIcon(QIcon(os.path.join(internal_dir, "logo.ico")))
+        self.setWindowIcon(_get_logo())
         self.setFixedWidth(300)
         self.setFixedHeight(350)
 
@@ -186,6 +208,7 @@ class UIWrapper(QMainWindow):
         # Amounts Page
         self.amounts_page = AmountsPage(self)
         self.amounts_page.back_button.clicked.connect(self._back_button)
+        self.amounts_page.total_changed.connect(self._invalidate)
 
         # Main widget stack
 
@@ -196,10 +219,29 @@ class UIWrapper(QMainWindow):
         self.widgets.setCurrentWidget(self.main_page)
         self.setCentralWidget(self.widgets)
 
+        # Progress bar throttling
+        self._last_paint = 0.0
+
+        # Output dir validity per path, as (is_dir, checked_at)
+        self._isdir_cache: dict[str, tuple[bool, float]] = {}
+        # Whether all selected files have a supported extension
+        self._files_valid = True
+
+        # Validation of typed input waits until typing pauses
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(VALIDATE_DELAY)
+        self._validate_timer.timeout.connect(self._ready_for_nest)
+        # Set when any input changed since the last validation
+        self._validation_dirty = True
+
         # Defaults
         self.output_path = os.getcwd()
         self._ready_for_nest()
 
+    def _invalidate(self, *args):
+        self._validation_dirty = True
+
     def _open_settings(self):
         self.widgets.setCurrentWidget(self.config_page)
 
@@ -219,9 +261,11 @@ class UIWrapper(QMainWindow):
             "Select images",
             "",
             "Images (*.png *.webp *.tiff *.tif *.bmp);; All Files (*.*)",
+            options=DIALOG_OPTIONS | QFileDialog.Option.ReadOnly,
         )
 
-        file_paths = [os.path.abspath(file) for file in file_paths]
+        # The dialog already returns absolute paths, only normalise separators
+        file_paths = [os.path.normpath(file) for file in file_paths]
         self.main_page._select_label.setText(
             f"{len(file_paths)} images selected"
         )
@@ -230,7 +274,12 @@ class UIWrapper(QMainWindow):
             self.main_page._amounts_button.setEnabled(True)
         else:
             self.main_page._amounts_button.setEnabled(False)
+        self._invalidate()
         self.amounts_page.files = file_paths
+        self._files_valid = all(
+            os.path.splitext(file)[1].lower() in VALID_TYPES
+            for file in file_paths
+        )
 
         self._ready_for_nest()
 
@@ -242,34 +291,56 @@ class UIWrapper(QMainWindow):
     def output_path(self, value):
         self.main_page._output_textbox.setText(value)
         self._output_path = value
+        self._invalidate()
         self._ready_for_nest()
 
     def _update_output_path(self, value):
-        self.output_path = value
+        # The textbox already shows the typed value, skip the setter's setText
+        self._output_path = value
+        self._invalidate()
+        # Don't allow nesting on a path that has not been validated yet
+        self.main_page._nest_button.setEnabled(False)
+        self._validate_timer.start()
 
     def _select_output_dir(self):
         dir = QFileDialog.getExistingDirectory(
             self, "Select Output Directory",
-            "", QFileDialog.Option.ShowDirsOnly
+            "", DIALOG_OPTIONS | QFileDialog.Option.ShowDirsOnly
         )
 
+        # A directory was just confirmed, forget previous checks
+        self._isdir_cache.clear()
         self.output_path = os.path.abspath(dir)
 
+    def _isdir_cached(self, path: str) -> bool:
+        """Cached os.path.isdir, avoids a stat per keystroke
+            on slow (network) filesystems."""
+        now = time.monotonic()
+        cached = self._isdir_cache.get(path)
+        if cached is None or now - cached[1] >= ISDIR_TTL:
+            cached = (os.path.isdir(path), now)
+            self._isdir_cache[path] = cached
+        return cached[0]
+
     # Check for input error before enabling nest button
     def _ready_for_nest(self):
+        # Validating now, a pending debounced check is no longer needed
+        self._validate_timer.stop()
+        # Nothing changed, the buttons and status already reflect the inputs
+        if not self._validation_dirty:
+            return
+        self._validation_dirty = False
+
         error = ""
 
-        if not os.path.isdir(self.output_path):
+        if not self._isdir_cached(self.output_path):
             error += "Output dir is invalid.\n"
-        total_amounts = sum([v["amount"] for v in self.amounts_page.amounts])
         if len(self.amounts_page.files) <= 0:
             error += "Please select images.\n"
-        elif total_amounts < 1:
+        elif self.amounts_page.total_amount < 1:
             error += "The total amount must be greater than 0."
-        for file in self.amounts_page.files:
-            if file.lower().split(".")[-1] not in VALID_TYPES:
-                error += "Please select valid image files (png, webp).\n"
-                break
+        if not self._files_valid:
+            error += "Please select valid image files (png, webp).\n"
 
         if error == "":
             self.main_page._nest_button.setEnabled(True)
@@ -290,15 +361,27 @@ class UIWrapper(QMainWindow):
 
         self.app.setOverrideCursor(QCursor(Qt.WaitCursor))
 
+        # Imported here as it pulls in the whole scientific stack,
+        # which is not needed to show the window
+        from snest.nest_thread import NestThread
+
         self._nest_thread = NestThread(
             self.amounts_page.amounts,
             self.output_path,
             self.config_page.config,
             parent=self,
         )
-        self._nest_thread.completed.connect(self._completed)
-        self._nest_thread.update_progress.connect(self._update)
-        self._nest_thread.new_loading.connect(self._new_loading)
+        # These are emitted from the worker thread,
+        # always deliver them through the GUI event loop
+        self._nest_thread.completed.connect(
+            self._completed, Qt.QueuedConnection
+        )
+        self._nest_thread.update_progress.connect(
+            self._update, Qt.QueuedConnection
+        )
+        self._nest_thread.new_loading.connect(
+            self._new_loading, Qt.QueuedConnection
+        )
         self._nest_thread.start()
 
     def _new_loading(self, args):
@@ -306,14 +389,29 @@ class UIWrapper(QMainWindow):
         self.main_page._progress_bar.setValue(initial)
         self.main_page._progress_bar.setMaximum(maximum)
         self.main_page._progress_label.setText(label)
+        self._last_paint = 0.0
 
     def _update(self, value):
-        self.main_page._progress_bar.setValue(value + 1)
+        progress_bar = self.main_page._progress_bar
+        # Drop queued values that are older than what is already shown
+        if value + 1 <= progress_bar.value():
+            return
+
+        now = time.monotonic()
+        # Only repaint a few times per second, but never skip the last step
+        if (
+            now - self._last_paint >= PROGRESS_INTERVAL
+            or value + 1 >= progress_bar.maximum()
+        ):
+            progress_bar.setValue(value + 1)
+            self._last_paint = now
 
     def _completed(self):
         self.main_page._select_button.setEnabled(True)
         self.main_page._select_label.setText("0 images selected")
+        self._invalidate()
         self.amounts_page.files = []
+        self._files_valid = True
         self.main_page._output_button.setEnabled(True)
         self.main_page._output_textbox.setEnabled(True)
         self.main_page.settings_button.setEnabled(True)
@@ -16,12 +16,20 @@
 
 import multiprocessing as mp
 import copy
+import itertools
+import math
+import time
 import random
 from typing import Self, Callable
 from shapely import Polygon
+import shapely
 from tqdm import tqdm
 import numpy as np
-from snest.algorithm.nest import nest, FitPoly, calc_nfps
+from snest.algorithm.nest import nest, FitPoly, NfpKey, calc_nfps
+
+# Minimum amount of fitting work (in seconds) per task sent to the pool,
+# smaller batches spend relatively too much time on IPC
+MIN_BATCH_TIME = 0.05
 
 
 class Solution:
@@ -29,53 +37,157 @@ class Solution:
         With a unique order and rotations."""
 
     def __init__(
-        self, polys: list[FitPoly], mutation_rate: int,
-        bin: FitPoly, rotations: int
+        self, polys: list[FitPoly], mutation_rate: int, rotations: int
     ):
-        self.polys = copy.deepcopy(polys)
+        # Polys are shared between solutions, they are only ever replaced
+        # with rotated copies, and copied before fitting moves them
+        self.polys = list(polys)
         self.mutation_rate = mutation_rate
-        self.bin = bin
         self.fitness = None
         self.fitted = None
         self.rotations = rotations
 
     def random_angle(self) -> float:
         """Return a random angle from the allowed rotations."""
-        angle = random.choice(
-            [i * (360 / self.rotations) for i in range(self.rotations)]
-        )
-        return angle
+        # Same as choosing from the list of all allowed angles,
+        # without building that list on every call
+        return random.randrange(self.rotations) * (360 / self.rotations)
 
     def mutate(self) -> Self:
         """Randomly mutate this solution's order and rotations."""
-        for i in range(len(self.polys)):
+        # Flip all coins at once, a swap and a rotation flag per poly
+        flags = np.random.random((len(self.polys), 2)) < (
+            0.01 * self.mutation_rate
+        )
+        # Going through the flagged polys in order has the same effect
+        # as checking every poly one after another
+        for i in np.flatnonzero(flags.any(axis=1)):
+            swap, rotate = flags[i]
             # Order mutation: swap current with next poly
-            if (
-                random.random() < 0.01 * self.mutation_rate
-                and i + 1 < len(self.polys)
-            ):
+            if swap and i + 1 < len(self.polys):
                 old = self.polys[i + 1], self.polys[i]
                 self.polys[i], self.polys[i + 1] = old
             # Rotation mutation
-            if random.random() < 0.01 * self.mutation_rate:
-                self.polys[i].rotate(self.random_angle())
+            if rotate:
+                self.polys[i] = self.polys[i].rotated(self.random_angle())
 
         return self
 
-    def fit(self, cache: dict[str, Polygon]) -> Self:
+    def fit(self, bin: FitPoly, cache: dict[NfpKey, Polygon]) -> Self:
         """Run the fitting algorithm on the solution,
             after which it's polys are arranged in a possible fit."""
         if not self.fitted:
-            fitness, result = nest(self.bin.polygon, self.polys, cache)
+            # Nesting moves the polys, give this solution its own copies
+            self.polys = [poly.copy() for poly in self.polys]
+            fitness, result = nest(bin.polygon, self.polys, cache)
             self.fitness = fitness
             self.fitted = result
         return self
 
 
-def run_fit(tasks: list[Solution],
-            cache: dict[str, Polygon]) -> list[Solution]:
-    """Helper function to run fit with multiprocessing."""
-    return [solution.fit(cache) for solution in tasks]
+class SolutionBatch:
+    """Wraps the solutions sent to or from a worker in one task.
+        Every unique moving polygon is pickled once, as one batch of WKB.
+        The original polygons are not sent at all, nor are moving polygons
+        that still are the original,
+        after unpickling they must be attached from a polygon table."""
+
+    def __init__(self, solutions: list[Solution]):
+        self.solutions = solutions
+        self.shells = []
+
+    def __getstate__(self) -> dict:
+        # Polys are shared between solutions, send shells without
+        # the polygon instead of touching the originals
+        shells = {}
+        moved = []
+        polygons = []
+        for solution in self.solutions:
+            for poly in solution.polys:
+                if id(poly) not in shells:
+                    shell = poly.copy()
+                    shell.polygon = None
+                    shell.original_polygon = None
+                    shells[id(poly)] = shell
+                    if poly.polygon is not poly.original_polygon:
+                        moved.append(shell)
+                        polygons.append(poly.polygon)
+
+        solutions = []
+        for solution in self.solutions:
+            solution = copy.copy(solution)
+            solution.polys = [shells[id(poly)] for poly in solution.polys]
+            # The fitted pages hold the same polys, point at the shells too
+            if solution.fitted:
+                solution.fitted = [
+                    [shells[id(poly)] for poly in page]
+                    for page in solution.fitted
+                ]
+            solutions.append(solution)
+
+        return {
+            "solutions": solutions,
+            "shells": list(shells.values()),
+            "moved": moved,
+            "wkbs": shapely.to_wkb(polygons).tolist(),
+        }
+
+    def __setstate__(self, state: dict):
+        self.solutions = state["solutions"]
+        self.shells = state["shells"]
+        polygons = shapely.from_wkb(state["wkbs"])
+        for shell, polygon in zip(state["moved"], polygons):
+            shell.polygon = polygon
+
+    def attach(self, poly_table: dict[int, Polygon]) -> Self:
+        """Restores the original polygons of the unpickled polys."""
+        for shell in self.shells:
+            shell.original_polygon = poly_table[shell.polygon_id]
+            if shell.polygon is None:
+                shell.polygon = shell.original_polygon
+        self.shells = []
+        return self
+
+
+# Worker process state, every worker keeps its own copy of the nfp cache
+# and pulls new entries from the shared log only when it falls behind
+_worker_cache: dict[NfpKey, Polygon] = {}
+_cache_log = None
+# The bin and original polygons never change,
+# so they are sent once instead of with every task
+_worker_bin: FitPoly = None
+_worker_polys: dict[int, Polygon] = {}
+
+
+def init_worker(
+    cache_log, bin: FitPoly, poly_table: dict[int, Polygon]
+):
+    """Pool initializer, attaches the worker to the shared cache log
+        and stores the bin and original polygons."""
+    global _cache_log, _worker_bin, _worker_polys
+    _cache_log = cache_log
+    _worker_bin = bin
+    _worker_polys = poly_table
+
+
+def sync_cache(cache_size: int):
+    """Fetches the cache entries this worker has not seen yet."""
+    if len(_worker_cache) < cache_size:
+        _worker_cache.update(_cache_log[len(_worker_cache):cache_size])
+
+
+def run_fit(
+    input: tuple[SolutionBatch, int]
+) -> tuple[SolutionBatch, float]:
+    """Helper function to run fit with multiprocessing.
+        Also returns the time spent fitting, used to size the batches."""
+    batch, cache_size = input
+    batch.attach(_worker_polys)
+    sync_cache(cache_size)
+    start = time.perf_counter()
+    for solution in batch.solutions:
+        solution.fit(_worker_bin, _worker_cache)
+    return (batch, time.perf_counter() - start)
 
 
 class Fitter_GA:
@@ -110,24 +222,51 @@ class Fitter_GA:
         self.n_processes = n_processes
         self.rotations = rotations
         self.callback = callback
+        # Random generator for drawing the parents of each generation
+        self.rng = np.random.default_rng()
         self.pool = None
+        # Original polygon of every image, by polygon id
+        self.poly_table = {}
+        # Average seconds to fit one solution, measured by the workers
+        self.fit_time = None
 
     def __enter__(self):  # TODO Forcing use of With is not clean
+        # The nfp cache lives as long as the pool,
+        # so repeated calculate_fit calls keep reusing it
+        self.cache = {}
+        # The cache is shared with the workers as an append only log,
+        # so each entry is only sent to each worker once
+        self.manager = mp.Manager()
+        self.cache_log = self.manager.list()
         # Set the worker pool
-        self.pool = mp.Pool(self.n_processes)
+        self.pool = mp.Pool(
+            self.n_processes, initializer=init_worker,
+            initargs=(self.cache_log, self.bin, self.poly_table)
+        )
         return self
 
     def __exit__(self, exception_type, exception_value, exception_traceback):
         # Close pool on With exit
         self.pool.close()
+        self.manager.shutdown()
+
+    def __share_cache(self):
+        """Appends the cache entries added since the last call to the log."""
+        shared = len(self.cache_log)
+        if len(self.cache) > shared:
+            # The cache only ever grows, new keys are at the end
+            self.cache_log.extend(
+                itertools.islice(self.cache.items(), shared, None)
+            )
 
     # TODO This function is probably best not kept here
     def set_polygons(self, files: dict[int, dict]):
         """Helper function to turn polygons into
-            FitPolys"""
+            FitPolys, must be called before entering the fitter."""
         new_polygons = []
 
         for poly_id, file in files.items():
+            self.poly_table[poly_id] = file['polygon']
             for i in range(file['amount']):
                 new_polygons.append(
                     FitPoly(file['polygon'], polygon_id=poly_id)
@@ -135,8 +274,8 @@ class Fitter_GA:
 
         self.polygons = new_polygons
 
-    def __mate(self, male: Solution,
-               female: Solution) -> tuple[Solution, Solution]:
+    def __mate(self, male: Solution, female: Solution,
+               cutoff_point: int) -> tuple[Solution, Solution]:
         """Function that applies single point crossover
             to two parent solutions, creating 2 new children."""
         # In the edge case that only 1 image is being fitted,
@@ -146,25 +285,25 @@ class Fitter_GA:
             female.fitted = None
             return (male, female)
 
-        cutoff_point = random.randint(1, len(male.polys) - 1)
-
         child_1 = male.polys[:cutoff_point]
         child_2 = female.polys[:cutoff_point]
 
         # Every solution must contain each polygon
         # Append to the end of each child,
         # the polys they are missing from the other
+        child_1_ids = {poly.id for poly in child_1}
         for poly in female.polys:
-            if not any(x.id == poly.id for x in child_1):
+            if poly.id not in child_1_ids:
                 child_1.append(poly)
 
+        child_2_ids = {poly.id for poly in child_2}
         for poly in male.polys:
-            if not any(x.id == poly.id for x in child_2):
+            if poly.id not in child_2_ids:
                 child_2.append(poly)
 
         return (
-            Solution(child_1, self.mutation_rate, self.bin, self.rotations),
-            Solution(child_2, self.mutation_rate, self.bin, self.rotations),
+            Solution(child_1, self.mutation_rate, self.rotations),
+            Solution(child_2, self.mutation_rate, self.rotations),
         )
 
     def __new_generation(self, population: list[Solution]) -> list[Solution]:
@@ -175,16 +314,27 @@ class Fitter_GA:
         # Keep the best
         new_pop = [population[0]]  # Elitism
 
-        while len(new_pop) < len(population):
-            # Assign weights to each solution, with decreasing chances
-            weights = [1 / (idx + 1) for idx in range(len(population))]
-            sw = sum(weights)
-            weights = [w / sw for w in weights]  # Ensure weights sum to 1
-
-            # Draw 2 at random (with weights), without replacing
-            draw = np.random.choice(population, 2, p=weights, replace=False)
-
-            children = self.__mate(draw[0], draw[1])
+        # Assign weights to each solution, with decreasing chances
+        weights = 1 / np.arange(1, len(population) + 1)
+        weights /= weights.sum()  # Ensure weights sum to 1
+
+        # Each pair of parents makes 2 children
+        n_pairs = math.ceil((len(population) - 1) / 2)
+        # Draw all parent pairs at once, 2 at random (with weights),
+        # without replacing. Taking the 2 largest log weights plus gumbel
+        # noise is the same as drawing one after the other.
+        keys = np.log(weights) + self.rng.gumbel(
+            size=(n_pairs, len(population))
+        )
+        parents = np.argsort(-keys, axis=1)[:, :2]
+        # Single point crossover positions for every pair
+        n_polys = len(population[0].polys)
+        cutoffs = self.rng.integers(1, max(n_polys, 2), size=n_pairs)
+
+        for (male, female), cutoff_point in zip(parents, cutoffs):
+            children = self.__mate(
+                population[male], population[female], cutoff_point
+            )
             # Mutate and add the children
             new_pop.append(children[0].mutate())
             # Skip second child if target size already met
@@ -193,6 +343,17 @@ class Fitter_GA:
 
         return new_pop
 
+    def __batch_size(self, population_size: int) -> int:
+        """Returns the amount of solutions per pool task.
+            Batches are made big enough to be worth the IPC,
+            but never bigger than an even split across the processes."""
+        even_split = math.ceil(population_size / self.n_processes)
+        if not self.fit_time:
+            return even_split
+        return max(1, min(
+            even_split, math.ceil(MIN_BATCH_TIME / self.fit_time)
+        ))
+
     def calculate_fit(self) -> Solution:
         """Function that starts the genetic algorithm, going through
             the set amount of generations and returning the best Solution."""
@@ -202,24 +363,19 @@ class Fitter_GA:
                 "use with statement."
             )
 
-        self.cache = {}
-
         # Initial order heuristic is descending area size
         ordered_polygons = copy.copy(self.polygons)
         ordered_polygons.sort(key=lambda x: x.polygon.area, reverse=True)
 
         # Start with an unmutated solution
         population = [
-            Solution(
-                ordered_polygons, self.mutation_rate,
-                self.bin, self.rotations
-            )
+            Solution(ordered_polygons, self.mutation_rate, self.rotations)
         ]
 
         # Fill the generation to the desired size with mutated solutions
         for i in range(self.population_size - 1):
             mutant = Solution(
-                ordered_polygons, self.mutation_rate, self.bin, self.rotations
+                ordered_polygons, self.mutation_rate, self.rotations
             ).mutate()
             population.append(mutant)
 
@@ -230,23 +386,28 @@ class Fitter_GA:
         ):
             calc_nfps(population, self.bin, self.cache,
                       self.pool, self.n_processes)
+            self.__share_cache()
+
+            batch_size = self.__batch_size(len(population))
+            parts = [
+                SolutionBatch(population[start:start + batch_size])
+                for start in range(0, len(population), batch_size)
+            ]
+            # Ordered imap keeps the population order reproducible
+            results = []
+            fit_time = 0.0
+            for batch, elapsed in self.pool.imap(
+                run_fit, [(x, len(self.cache)) for x in parts]
+            ):
+                results.append(batch.attach(self.poly_table).solutions)
+                fit_time += elapsed
+            self.fit_time = fit_time / len(population)
 
-            # TODO currently this uses a heuristic to avoid
-            # splitting up small populations into really tiny splits
-            # But is this the correct way to go about it.
-            parts = np.array_split(
-                population, min(self.n_processes, self.population_size // 5)
-            )
-            results = list(
-                self.pool.starmap(run_fit, [(x, self.cache) for x in parts])
-            )
-
-            # If the algorithm is not finished, make a new generation,
-            # otherwise just merge results
+            # Merge the results of all batches
+            population = list(itertools.chain.from_iterable(results))
+            # If the algorithm is not finished, make a new generation
             if i < self.num_generations - 1:
-                population = self.__new_generation(sum(results, []))
-            else:
-                population = sum(results, [])
+                population = self.__new_generation(population)
 
             if self.callback:
                 self.callback(i)
@@ -14,7 +14,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from PIL import Image
+import shapely
 from shapely import Polygon, buffer, concave_hull
 from shapely.ops import unary_union
 import numpy as np
@@ -24,31 +24,50 @@ import cv2
 def load_image(path: str, margin: int) -> Polygon:
     """Loads image file and returns outline Polygon
         by removing transparent pixels."""
-    # Flip y coordinates as they are inverted in images
-    # TODO Can this be replaced by cv2?
-    image = (
-        Image.open(path).transpose(method=Image.FLIP_TOP_BOTTOM)
-        .convert("RGBA")
+    # Decode from a buffer, cv2.imread can't open non-ascii paths on Windows
+    img_array = cv2.imdecode(
+        np.fromfile(path, dtype=np.uint8), cv2.IMREAD_UNCHANGED
     )
-    img_array = np.asarray(image)
+    if img_array is None:
+        raise ValueError(f"Could not decode image {path}")
 
-    mask = img_array[:, :, 3] != 0  # transparent pixels = False
+    if img_array.ndim == 3 and img_array.shape[2] == 4:
+        # Single pass to a black-white uint8 mask, for 8 and 16 bit images
+        # transparent pixels = 0
+        mask = cv2.compare(
+            cv2.extractChannel(img_array, 3), 0, cv2.CMP_GT
+        )
+        # Flip y coordinates as they are inverted in images
+        mask = cv2.flip(mask, 0)
+    else:
+        # No alpha channel, the whole image is opaque
+        mask = np.ones(img_array.shape[:2], dtype=np.uint8)
 
-    polygons = []
-
-    # Convert mask to black-white image and finds contours
+    # Find the contours of the black-white mask
+    # Only the outer contours are needed, anything inside them
+    # (holes and islands within holes) disappears in the union below.
+    # The points are not reduced with CHAIN_APPROX_SIMPLE or approxPolyDP,
+    # concave_hull needs this point density to follow the outline
     contours, _ = cv2.findContours(
-        mask.astype(np.uint8), cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE
+        mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE
     )
 
-    # Turn all contours into polygons
-    for contour in contours:
-        # TODO Could skipping this cause issues?
-        if (
-            contour.shape[0] > 2
-        ):  # skip if not at least 3 points, likely some floating pixels
-            # Apply 0 buffer to close any holes present
-            polygons.append(buffer(Polygon(contour[:, 0, :]), 0))
+    # TODO Could skipping this cause issues?
+    # skip if not at least 3 points, likely some floating pixels
+    contours = [contour[:, 0, :] for contour in contours
+                if contour.shape[0] > 2]
+    if not contours:
+        return Polygon()  # Nothing visible in the image
+
+    # Turn all contours into polygons at once,
+    # every coordinate is tagged with the index of its contour
+    coords = np.concatenate(contours).astype(np.float64)
+    ring_ids = np.repeat(
+        np.arange(len(contours)), [len(contour) for contour in contours]
+    )
+    polygons = shapely.polygons(shapely.linearrings(coords, indices=ring_ids))
+    # Apply 0 buffer to close any holes present
+    polygons = buffer(polygons, 0)
 
     # Unary union to remove overlaps
     # Concave hull to join separate parts
@@ -14,27 +14,28 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from shapely import Polygon, affinity, MultiPoint
+from shapely import Polygon, affinity, multipoints, get_coordinates
 import numpy as np
 
 
 # https://cse442-17f.github.io/Gilbert-Johnson-Keerthi-Distance-Algorithm/
 def minkowski_diff_nfp(A: Polygon, B: Polygon) -> Polygon:
     """Return the no fit polygon of B around A using the minkowsi difference"""
-    A_inv = affinity.scale(A, -1, -1, origin=(0, 0))
-    new_points = []
-
-    # For x then y
-    for i in range(2):  # TODO this loop is redundant
-        coord_A = A_inv.exterior.xy[i]
-        coord_B = B.exterior.xy[i]
-        # Add up all combinations of x/y and flatten
-        new_coords = np.add(*np.meshgrid(coord_A, coord_B)).reshape(-1)
-        new_points.append(new_coords)
-
-    # Stack x and y together,
-    # then get the convex_hull of the resulting MultiPoint structure
-    hull = MultiPoint(np.stack(new_points, 1)).convex_hull
+    # Only the convex hull vertices of A and B can end up on the hull
+    # of their sum, skip all the other points
+    A_inv = affinity.scale(A, -1, -1, origin=(0, 0)).convex_hull
+    B_hull = B.convex_hull
+
+    # Drop the closing coordinate, it repeats the first one
+    coord_A = get_coordinates(A_inv.exterior)[:-1]
+    coord_B = get_coordinates(B_hull.exterior)[:-1]
+    # Add up all combinations of points, x and y together
+    new_points = (coord_A[:, None, :] + coord_B[None, :, :]).reshape(-1, 2)
+
+    # Get the convex_hull of the resulting MultiPoint structure
+    # multipoints builds it straight from the array, MultiPoint() would
+    # create a separate Point for every coordinate first
+    hull = multipoints(new_points).convex_hull
 
     ref_point = B.exterior.coords[0]
 
@@ -45,8 +46,11 @@ def minkowski_diff_nfp(A: Polygon, B: Polygon) -> Polygon:
 
 
 # Since the bin is always a rectangle this is sufficient
-def rectangle_ifp(rect: Polygon, poly: Polygon) -> Polygon:
-    """Return the inner fit polygon of poly in rect"""
+def rectangle_ifp(
+    rect: Polygon, poly: Polygon
+) -> tuple[float, float, float, float] | None:
+    """Return the inner fit polygon of poly in rect,
+        as the (minx, miny, maxx, maxy) bounds of the rectangle."""
     rect_width = rect.bounds[2] - rect.bounds[0]
     rect_height = rect.bounds[3] - rect.bounds[1]
 
@@ -69,13 +73,4 @@ def rectangle_ifp(rect: Polygon, poly: Polygon) -> Polygon:
     )
     bounds = rect.bounds + offsets
 
-    new_square = [
-        (bounds[0], bounds[1]),
-        (bounds[0], bounds[3]),
-        (bounds[2], bounds[3]),
-        (bounds[2], bounds[1]),
-    ]
-
-    ifp = Polygon(new_square)
-
-    return ifp
+    return tuple(bounds.tolist())
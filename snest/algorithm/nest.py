@@ -16,20 +16,84 @@
 
 from typing import Self
 import copy
+import heapq
+import math
+from functools import lru_cache
 from itertools import count
 from multiprocessing.pool import Pool
-from shapely import (Polygon, affinity, MultiLineString,
+from shapely import (Polygon, affinity,
                      MultiPolygon, GeometryCollection)
 import numpy as np
+import shapely
 from snest.algorithm.minkowski import minkowski_diff_nfp, rectangle_ifp
 
 TOL = 10**-9
+# Rotations are rounded to this many decimals for nfp caching,
+# so float drift from stacking rotations maps onto the same nfp.
+# Steps this small keep every rotation alphabet exact
+ROTATION_DECIMALS = 6
+# Amount of placements remembered by every process
+PLACEMENT_CACHE_SIZE = 4096
+# Amount of moved nfps remembered by every process
+MOVED_NFP_CACHE_SIZE = 16384
+# Amount of nfp task parts handed to each process
+NFP_PARTS_PER_PROCESS = 4
 
 
 def almost_equal(a, b, tolerance=TOL):
     return abs(a - b) < tolerance
 
 
+def bounds_overlap(bounds: np.ndarray, box: tuple) -> np.ndarray:
+    """Returns which rows of an (n, 4) bounds array overlap the box bounds."""
+    return (
+        (bounds[:, 0] <= box[2]) & (bounds[:, 2] >= box[0])
+        & (bounds[:, 1] <= box[3]) & (bounds[:, 3] >= box[1])
+    )
+
+
+def affine_transform_each(geometries, matrices) -> np.ndarray:
+    """Returns the geometries each transformed by their own matrix,
+        given in the same order as for affinity.affine_transform."""
+    matrices = np.asarray(matrices, dtype=float)
+    # One matrix row per coordinate, coordinates are listed geometry by
+    # geometry so the matrices can be repeated by the coordinate count
+    per_coord = np.repeat(
+        matrices, shapely.get_num_coordinates(geometries), axis=0
+    )
+    a, b, d, e, x_off, y_off = per_coord.T
+
+    def transform(coords: np.ndarray) -> np.ndarray:
+        x, y = coords[:, 0], coords[:, 1]
+        return np.column_stack((a * x + b * y + x_off, d * x + e * y + y_off))
+
+    return shapely.transform(geometries, transform)
+
+
+def merge_bounds(a: tuple, b: tuple) -> tuple:
+    """Returns the bounds containing both bounds."""
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def normalize_rotation(rotation: float) -> int:
+    """Returns the rotation in the range [0, 360),
+        as a whole number of rotation steps for exact comparing."""
+    steps = 10**ROTATION_DECIMALS
+    return round(rotation * steps) % (360 * steps)
+
+
+# Polygon A's id, polygon B's id and the normalized relative rotation
+NfpKey = tuple[int, int, int]
+
+
+def nfp_key(A_id: int, B_id: int, rotation: float) -> NfpKey:
+    """Returns the cache key for the nfp of polygon B around polygon A,
+        with rotation being B's rotation relative to A.
+        The nfp only depends on the relative rotation,
+        so any pair of rotations with the same difference shares a key."""
+    return (A_id, B_id, normalize_rotation(rotation))
+
+
 class FitPoly:
     """Helper class for each polygon that must be fit.
         Keeps track of the original polygon,
@@ -46,8 +110,13 @@ class FitPoly:
         self.original_polygon = polygon
         # Keeps track of total degrees rotated for nfp caching purposes
         self.rotation = rotation
-        # This one will be moved around and rotated
-        self.polygon = copy.deepcopy(polygon)
+        # This one will be moved around and rotated,
+        # geometries are immutable so every move assigns a new one
+        # and the original can be shared until then
+        self.polygon = polygon
+        # Rotations are centered on the centroid of the exterior,
+        # which only moves with translations
+        self.center = polygon.exterior.centroid.coords[0]
 
         # Defaults
         self.fit = False  # Flag representing if it has been placed or not
@@ -55,143 +124,174 @@ class FitPoly:
         # Keeps track of all transforms applied,
         # which is used later to get the images to their final fit position
         self.transformation = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        self.__update_derived()
+
+    def __update_derived(self):
+        """Caches the values read from the polygon and transformation
+            in the nesting loops, must be called after every change."""
+        # Reference point the nfps are calculated relative to
+        self.ref_point = self.polygon.exterior.coords[0]
+        self.bounds = self.polygon.bounds
+        # The transformation in shapely's affine_transform order
+        t = self.transformation
+        self.affine = (t[0][0], t[0][1], t[1][0], t[1][1], t[0][2], t[1][2])
+
+    def copy(self) -> Self:
+        """Return a shallow copy sharing the same (immutable) polygons.
+            Transformations always assign new objects,
+            so the copy can be moved and rotated independently."""
+        return copy.copy(self)
+
+    def rotated(self, rotation: float) -> Self:
+        """Return a rotated copy, leaving this FitPoly untouched."""
+        return self.copy().rotate(rotation)
 
     def rotate(self, rotation: float) -> Self:
         """Function to apply rotation to the polygon."""
         if rotation == 0:
             return self
 
-        self.rotation += rotation
-
-        self.transformation = copy.copy(self.transformation)
+        # Keep the total snapped to the steps of the nfp cache keys,
+        # so all polys sharing a key also share the exact same angle
+        self.rotation = (
+            normalize_rotation(self.rotation + rotation)
+            / 10**ROTATION_DECIMALS
+        )
 
         # Change rotation do rad for calculation purposes
-        rotation = np.deg2rad(rotation)
+        rotation = math.radians(rotation)
+        cos, sin = math.cos(rotation), math.sin(rotation)
 
         # Build rotation matrix with rotation centered
         # on the centroid of the polygon
-        center = self.polygon.exterior.centroid.coords[0]
-        x_off = (center[0] - center[0] * np.cos(rotation)
-                 + center[1] * np.sin(rotation))
-        y_off = (center[1] - center[0] * np.sin(rotation)
-                 - center[1] * np.cos(rotation))
+        center = self.center
+        x_off = center[0] - center[0] * cos + center[1] * sin
+        y_off = center[1] - center[0] * sin - center[1] * cos
 
         rotation_matrix = np.array(
             [
-                [np.cos(rotation), -np.sin(rotation), x_off],
-                [np.sin(rotation), np.cos(rotation), y_off],
+                [cos, -sin, x_off],
+                [sin, cos, y_off],
                 [0, 0, 1],
             ]
         )
 
         # Add rotation to the transformation
-        self.transformation = np.matmul(rotation_matrix, self.transformation)
-        # Apply the rotation
-        self.polygon = affinity.affine_transform(
-            self.polygon,
-            [
-                np.cos(rotation),
-                -np.sin(rotation),
-                np.sin(rotation),
-                np.cos(rotation),
-                x_off,
-                y_off,
-            ],
+        self.transformation = rotation_matrix @ self.transformation
+        # Apply the rotation straight to the coordinates
+        linear, offset = rotation_matrix[:2, :2].T, rotation_matrix[:2, 2]
+        self.polygon = shapely.transform(
+            self.polygon, lambda coords: coords @ linear + offset
         )
+        self.__update_derived()
         return self
 
     def translate(self, translation: tuple[float, float]) -> Self:
         """Function to apply translation to the polygon."""
-        # Add translation to the transformation
-        self.transformation = np.matmul(
-            np.array([
-                [1, 0, translation[0]],
-                [0, 1, translation[1]],
-                [0, 0, 1]
-            ]),
-            self.transformation,
-        )
+        # Add translation to the transformation, which only shifts
+        # its offset column. Copies share the matrix, so make a new one
+        self.transformation = self.transformation.astype(float)
+        self.transformation[:2, 2] += translation
         # Apply the translation
-        self.polygon = affinity.translate(
-            self.polygon, xoff=translation[0], yoff=translation[1]
+        offset = np.array(translation, dtype=float)
+        self.polygon = shapely.transform(
+            self.polygon, lambda coords: coords + offset
         )
+        self.center = (
+            self.center[0] + translation[0], self.center[1] + translation[1]
+        )
+        self.__update_derived()
         return self
 
 
 # Place where bounding box smallest using brute force
 # Uses min bounding box as heuristic with double weight to the width
 def place_poly(
-    valid_nfp, placed: list[FitPoly], current_poly: FitPoly
+    valid_nfp, placed_bounds: tuple, current_poly: FitPoly
 ) -> tuple[float, float] | None:
     """Returns the position of all valid_nfp positions where the polygon
-        can be placed that adds the least amount of bin area used."""
-    current_poly = copy.deepcopy(current_poly)
-
+        can be placed that adds the least amount of bin area used.
+        placed_bounds are the combined bounds of the placed polygons."""
     # Check what kind of nfp we have
     if not valid_nfp:
         return None  # No valid points
-    if isinstance(valid_nfp, MultiLineString) or isinstance(
-        valid_nfp, GeometryCollection
-    ):
-        valid_coords = []
-        for line in valid_nfp.geoms:
-            valid_coords += line.coords
-    else:
-        valid_coords = list(valid_nfp.coords)
-
-    minarea = None
-    position = None
-    minx = None
-
-    placed_polys = [fitpoly.polygon for fitpoly in placed]
-
-    # Brute force try every valid point along valid_nfp
-    # Place the polygon there and calculate the area used
-    for nfp_coord in valid_coords:
-        shift_vector = (
-            nfp_coord[0] - current_poly.polygon.exterior.coords[0][0],
-            nfp_coord[1] - current_poly.polygon.exterior.coords[0][1],
-        )
-
-        translated_poly = affinity.translate(
-            current_poly.polygon, xoff=shift_vector[0], yoff=shift_vector[1]
-        )
-
-        allpoints = MultiPolygon(placed_polys + [translated_poly])
-        bounds = allpoints.bounds
-
-        # weigh width more, to help compress in direction of gravity
-        area = (bounds[2] - bounds[0]) * 2 + (bounds[3] - bounds[1])
-
-        if (
-            minarea is None
-            or area < minarea
-            or (
-                almost_equal(minarea, area)
-                and (minx is None or shift_vector[0] < minx)
-            )
-        ):
-            minarea = area
-            position = shift_vector
-            minx = shift_vector[0]
-
-    return position
-
-
-def calc_nfp(tasks) -> dict[str, Polygon]:
+    # All points of the lines (or loose points) in one flat array,
+    # in the same order as going through each part's coords
+    valid_coords = shapely.get_coordinates(valid_nfp)
+
+    # The placed polygons don't move, so their combined bounds are the same
+    # for every candidate, and moving the polygon just shifts its bounds.
+    # The same placements recur between generations,
+    # the result only depends on these exact values
+    return _best_position(
+        valid_coords.tobytes(),
+        placed_bounds,
+        current_poly.bounds,
+        current_poly.ref_point,
+    )
+
+
+@lru_cache(maxsize=PLACEMENT_CACHE_SIZE)
+def _best_position(
+    valid_coords: bytes, placed_box: tuple, poly_bounds: tuple,
+    ref_point: tuple
+) -> tuple[float, float]:
+    """Returns the shift of the polygon to the valid point
+        that adds the least amount of bin area used."""
+    valid_coords = np.frombuffer(valid_coords).reshape(-1, 2)
+
+    # Try every valid point along valid_nfp at once,
+    # calculating the area used with the polygon placed there.
+    # Only the spans are needed, so work per axis without
+    # building the full shifted bounds
+    shift_x = valid_coords[:, 0] - ref_point[0]
+    shift_y = valid_coords[:, 1] - ref_point[1]
+    width = np.maximum(shift_x + poly_bounds[2], placed_box[2])
+    width -= np.minimum(shift_x + poly_bounds[0], placed_box[0])
+    height = np.maximum(shift_y + poly_bounds[3], placed_box[3])
+    height -= np.minimum(shift_y + poly_bounds[1], placed_box[1])
+
+    # weigh width more, to help compress in direction of gravity
+    areas = width * 2 + height
+
+    # Of the smallest areas, pick the leftmost (first one on a tie),
+    # by hiding every other candidate from a single argmin
+    best = np.argmin(np.where(areas < areas.min() + TOL, shift_x, np.inf))
+    return (float(shift_x[best]), float(shift_y[best]))
+
+
+def balanced_split(task_list: list, n_parts: int) -> list[list]:
+    """Splits the nfp tasks in parts of about equal amount of work.
+        The work of a task is estimated by the vertex counts of its pair,
+        the biggest tasks are handed out first to the least loaded part."""
+    costs = shapely.get_num_coordinates(
+        [A for _, _, A, _, _ in task_list]
+    ) * shapely.get_num_coordinates([B for _, _, _, _, B in task_list])
+    parts = [[] for _ in range(n_parts)]
+    loads = [(0, i) for i in range(n_parts)]
+    for task in np.argsort(-costs, kind="stable"):
+        load, i = heapq.heappop(loads)
+        parts[i].append(task_list[task])
+        heapq.heappush(loads, (load + costs[task], i))
+    return parts
+
+
+def calc_nfp(tasks) -> dict[NfpKey, Polygon]:
     """Helper function to calculate nfps
-        for a list of polygon pairs with multiprocessing."""
+        for a list of polygon pairs with multiprocessing.
+        Each task holds the key, A's id, original polygon and rotation,
+        and B's polygon."""
     new_cache = {}
 
     for task in tasks:
-        key, A, B = task
-        if A.polygon_id == 0:  # Inside fit for bin
+        key, A_id, A, A_rotation, B = task
+        if A_id == 0:  # Inside fit for bin
             # Bin is never rotated, no rotations need to be done
-            nfp_poly = rectangle_ifp(A.polygon, B.polygon)
+            nfp_poly = rectangle_ifp(A, B)
         else:
             # Account for A's rotation
-            rev_rotate = affinity.rotate(B.polygon, -A.rotation)
-            nfp_poly = minkowski_diff_nfp(A.original_polygon, rev_rotate)
+            rev_rotate = affinity.rotate(B, -A_rotation)
+            nfp_poly = minkowski_diff_nfp(A, rev_rotate)
 
         new_cache[key] = nfp_poly
 
@@ -202,59 +302,95 @@ def calc_nfp(tasks) -> dict[str, Polygon]:
 def calc_nfps(
     population,
     bin: FitPoly,
-    cache: dict[str, Polygon],
+    cache: dict[NfpKey, Polygon],
     worker_pool: Pool,
     n_processes: int,
 ):
     """Calculates all nfps not yet cached and add them to the cache."""
-    tasks = {}
+    # Keys that are cached or already queued,
+    # so each key needs a single lookup
+    seen = set(cache)
+    task_list = []
 
     # The cache key represents a unique combination between
     # polygon A, polygon B and its rotation
     # If this key is not in the cache, it must be calculated
     for solution in population:
         polygons = solution.polys
-        for i in range(0, len(polygons)):
-            # The rotations keep stacking, remove all unnecessary 360's
-            B_rotation = (polygons[i].rotation - 360 *
-                          (polygons[i].rotation // 360))
-
-            # Every polygon will need to get an ifp with the bin
-            cache_key = (
-                f"{bin.polygon_id},"
-                f"{polygons[i].polygon_id}-{B_rotation}"
-            )
-            if (cache_key not in cache) and (cache_key not in tasks):
-                tasks[cache_key] = (bin, polygons[i])
-
-            # Each polygon will need an nfp with those before it in the order
-            for previous_poly in polygons[:i]:
-                A_rotation = previous_poly.rotation - 360 * (
-                    previous_poly.rotation // 360
-                )
-                cache_key = (
-                    f"{previous_poly.polygon_id},"
-                    f"{polygons[i].polygon_id}-{B_rotation - A_rotation}"
+        for i, poly in enumerate(polygons):
+            # Every polygon will need to get an ifp with the bin,
+            # and an nfp with those before it in the order.
+            # The bin is never rotated, so its key works out the same
+            for previous_poly in (bin, *polygons[:i]):
+                cache_key = nfp_key(
+                    previous_poly.polygon_id,
+                    poly.polygon_id,
+                    poly.rotation - previous_poly.rotation,
                 )
-                if (cache_key not in cache) and (cache_key not in tasks):
-                    tasks[cache_key] = (previous_poly, polygons[i])
-
-    task_list = [(x[0], x[1][0], x[1][1]) for x in tasks.items()]
-    # Split the tasks and run them parallel
-    parts = np.array_split(
-        task_list, n_processes
-    )  # TODO is this split worth it if the amount of work per split is small?
-
-    results = list(worker_pool.starmap(calc_nfp, [(x,) for x in parts]))
-    # Add the new keys from each parallel result to the main cache
-    for result in results:
+                if cache_key not in seen:
+                    seen.add(cache_key)
+                    # Only send what calc_nfp uses, not the whole FitPolys
+                    task_list.append((
+                        cache_key,
+                        previous_poly.polygon_id,
+                        previous_poly.original_polygon,
+                        previous_poly.rotation,
+                        poly.polygon,
+                    ))
+
+    # Split the tasks in more parts than processes and run them parallel,
+    # so a worker that finishes early picks up the next part
+    parts = balanced_split(task_list, n_processes * NFP_PARTS_PER_PROCESS)
+
+    # Add the new keys from each parallel result to the main cache,
+    # in whatever order they finish
+    for result in worker_pool.imap_unordered(
+        calc_nfp, [part for part in parts if part]
+    ):
         cache.update(result)
 
 
+# Nfps already moved to a placed polygon's position, in this process
+_moved_nfps: dict[tuple[NfpKey, tuple], Polygon] = {}
+
+
+def placed_nfps(
+    cache: dict[NfpKey, Polygon], placed: list[FitPoly], poly: FitPoly
+) -> np.ndarray:
+    """Returns the nfps of poly around each placed polygon,
+        translated + rotated to where that polygon is placed.
+        The same placements recur between generations,
+        so the moved nfps are remembered instead of moved again."""
+    keys = [
+        (
+            nfp_key(
+                placed_poly.polygon_id,
+                poly.polygon_id,
+                poly.rotation - placed_poly.rotation,
+            ),
+            placed_poly.affine,
+        )
+        for placed_poly in placed
+    ]
+
+    missing = [key for key in keys if key not in _moved_nfps]
+    if missing:
+        if len(_moved_nfps) + len(missing) > MOVED_NFP_CACHE_SIZE:
+            _moved_nfps.clear()
+        # Move all missing nfps at once
+        moved = affine_transform_each(
+            [cache[key] for key, _ in missing],
+            [affine for _, affine in missing],
+        )
+        _moved_nfps.update(zip(missing, moved))
+
+    return np.array([_moved_nfps[key] for key in keys], dtype=object)
+
+
 # TODO implement bin limit feature
 def nest(
     bin: Polygon, polygons: list[FitPoly],
-    cache: dict[str, Polygon], bin_limit: int = 0
+    cache: dict[NfpKey, Polygon], bin_limit: int = 0
 ) -> tuple[float, list[list[FitPoly]]]:
     """Places the given polygons in the given order,
         adding new bins should a polygon not fit anymore.
@@ -279,9 +415,9 @@ def nest(
         while (
             polygon_nfp is None and len(to_place) > 0
         ):  # Skip until a polygon that fits the bin is found
-            B_rotation = (to_place[0].rotation - 360 *
-                          (to_place[0].rotation // 360))
-            ifp = cache[f"0,{to_place[0].polygon_id}-{B_rotation}"]
+            ifp = cache[nfp_key(
+                0, to_place[0].polygon_id, to_place[0].rotation
+            )]
             if ifp:
                 polygon_nfp = ifp
             else:
@@ -291,73 +427,47 @@ def nest(
         if polygon_nfp:
             # The first placement is just the bottom left of the bin
             # position is the offset to be applied to the polygon
-            position = None
-            for i in range(len(polygon_nfp.exterior.coords) - 1):
-                if (
-                    position is None
-                    or polygon_nfp.exterior.coords[i][0]
-                    - to_place[0].polygon.exterior.coords[0][0]
-                    < position[0]
-                ):
-                    position = (
-                        polygon_nfp.exterior.coords[i][0]
-                        - to_place[0].polygon.exterior.coords[0][0],
-                        polygon_nfp.exterior.coords[i][1]
-                        - to_place[0].polygon.exterior.coords[0][1],
-                    )
+            ref_point = to_place[0].ref_point
+            position = (
+                polygon_nfp[0] - ref_point[0],
+                polygon_nfp[1] - ref_point[1],
+            )
 
             first = to_place[0].translate((position[0], position[1]))
 
             placed.append(first)
             first.bin_n = bin_n
             first.fit = True
+            # Combined bounds of everything placed in this bin
+            placed_bounds = first.bounds
 
         # After the first placement we need to start taking into account
         # previously placed polygons
         for i in range(1, len(to_place)):
-            B_rotation = (to_place[i].rotation - 360 *
-                          (to_place[i].rotation // 360))
-
             # Get the inner fit of the polygon with the bin
-            inner_poly = cache[f"0,{to_place[i].polygon_id}-{B_rotation}"]
+            inner_bounds = cache[nfp_key(
+                0, to_place[i].polygon_id, to_place[i].rotation
+            )]
 
-            if not inner_poly:
+            if not inner_bounds:
                 continue  # It doesn't fit the bin
 
-            full_nfp = None
-            # For all previously placed ones
-            for placed_poly in placed:
+            # Get the nfps around all previously placed ones
+            nfps = placed_nfps(cache, placed, to_place[i])
 
-                A_rotation = (placed_poly.rotation - 360 *
-                              (placed_poly.rotation // 360))
+            # An nfp that doesn't reach the ifp can't change
+            # which positions inside the ifp are valid, skip their unions
+            nfps = nfps[bounds_overlap(shapely.bounds(nfps), inner_bounds)]
+            if len(nfps) == 0:
+                continue  # No nfp edge to place against
 
-                cache_key = (
-                    f"{placed_poly.polygon_id},"
-                    f"{to_place[i].polygon_id}-{B_rotation - A_rotation}"
-                )
-
-                # Get cached nfp and translate +
-                # rotate it to the current position
-                nfp_poly = cache[cache_key]
-                nfp_poly = affinity.affine_transform(
-                    nfp_poly,
-                    [
-                        placed_poly.transformation[0][0],
-                        placed_poly.transformation[0][1],
-                        placed_poly.transformation[1][0],
-                        placed_poly.transformation[1][1],
-                        placed_poly.transformation[0][2],
-                        placed_poly.transformation[1][2],
-                    ],
-                )
+            inner_poly = shapely.box(*inner_bounds)
 
-                # Join the new nfp with the previous ones
-                if full_nfp is None:
-                    full_nfp = nfp_poly
-                else:
-                    full_nfp = full_nfp.union(
-                        nfp_poly
-                    )  # TODO This can fail with invalid geom
+            # Join all nfps in one cascaded union,
+            # instead of growing the union one nfp at a time
+            full_nfp = shapely.union_all(
+                nfps
+            )  # TODO This can fail with invalid geom
 
             # Calculate the valid placements by
             # intersecting the nfp with the ifp
@@ -380,7 +490,7 @@ def nest(
 
             # Find the best placement for the polygon
             # in all the valid placements
-            placement = place_poly(valid, placed, to_place[i])
+            placement = place_poly(valid, placed_bounds, to_place[i])
             if placement:
                 # Apply the translation and place the polygon,
                 # if a placement was found
@@ -388,15 +498,15 @@ def nest(
                 placed.append(to_place[i])
                 to_place[i].fit = True
                 to_place[i].bin_n = bin_n
+                placed_bounds = merge_bounds(placed_bounds, to_place[i].bounds)
 
-        for poly in placed:
-            to_place.pop(to_place.index(poly))
+        # Keep the polys not placed in this bin, in order
+        placed_ids = {poly.id for poly in placed}
+        to_place = [poly for poly in to_place if poly.id not in placed_ids]
 
         if len(placed) > 0:
-            # merge all placed polygons to calculate space used
-            allpoints = MultiPolygon([fitpoly.polygon for fitpoly in placed])
-            bounds = allpoints.bounds
-            width = bounds[2] - bounds[0]
+            # The space used is the bounds of all placed polygons
+            width = placed_bounds[2] - placed_bounds[0]
             # Small punishment for width used, to incentivize better fits
             fitness += width / bin.area
 
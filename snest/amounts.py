@@ -15,66 +15,95 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIntValidator, QPixmap
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QPushButton,
-    QToolButton,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
     QLabel,
-    QLineEdit,
     QHBoxLayout,
     QScrollArea,
-    QLayout,
 )
 
+# Width and height of the image previews
+THUMBNAIL_SIZE = 50
+# Width the image names are elided to
+NAME_WIDTH = 120
 
-class AmountEditor(QWidget):
-    def __init__(self, parent: QWidget = None) -> None:
-        super().__init__(parent)
 
-        self.amount = 1
+def thumbnail_key(file_path: str) -> str:
+    """Returns the QPixmapCache key for the preview of an image.
+        Previews are cached by path and modification time,
+        so reselecting an unchanged image doesn't decode it again."""
+    try:
+        modified = os.stat(file_path).st_mtime_ns
+    except OSError:
+        modified = None
+    return f"thumbnail:{THUMBNAIL_SIZE}:{modified}:{file_path}"
 
-        layout = QHBoxLayout()
-        layout.setSpacing(0)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSizeConstraint(QLayout.SetFixedSize)
-
-        self.left_button = QToolButton(self)
-        self.left_button.setArrowType(Qt.LeftArrow)
-        self.left_button.clicked.connect(self.down_amount)
-        layout.addWidget(self.left_button)
-
-        self.amount_edit = QLineEdit(self)
-        self.amount_edit.setValidator(QIntValidator(0, 99, self.amount_edit))
-        self.amount_edit.setText("1")
-        self.amount_edit.editingFinished.connect(self.update_amount)
-        self.amount_edit.setFixedWidth(self.amount_edit.height())
-        layout.addWidget(self.amount_edit)
 
-        self.right_button = QToolButton(self)
-        self.right_button.setArrowType(Qt.RightArrow)
-        self.right_button.clicked.connect(self.up_amount)
-        layout.addWidget(self.right_button)
+class ThumbnailSignals(QObject):
+    # Emits the cache key and the scaled preview
+    loaded = Signal(str, QImage)
 
-        self.setLayout(layout)
 
-    def update_amount(self):
-        self.amount = int(self.amount_edit.text())
+class ThumbnailLoader(QRunnable):
+    """Decodes and scales an image preview on a worker thread.
+        QPixmap only lives on the GUI thread, so this sends a QImage."""
 
-    def up_amount(self):
-        self.amount = min(99, self.amount + 1)
-        self.amount_edit.setText(str(self.amount))
+    def __init__(self, file_path: str, key: str) -> None:
+        super().__init__()
+        self.file_path = file_path
+        self.key = key
+        self.signals = ThumbnailSignals()
+
+    def run(self) -> None:
+        reader = QImageReader(self.file_path)
+        size = reader.size()
+        if size.isValid():
+            # Let the decoder produce the preview size directly,
+            # formats that can't are scaled down after reading
+            reader.setScaledSize(
+                size.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE, Qt.KeepAspectRatio)
+            )
+            image = reader.read()
+        else:
+            image = QImage(self.file_path).scaled(
+                THUMBNAIL_SIZE, THUMBNAIL_SIZE,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+        self.signals.loaded.emit(self.key, image)
+
+
+class AmountEditor(QSpinBox):
+    # Emits the difference between the new and old amount
+    amount_changed = Signal(int)
+
+    def __init__(self, parent: QWidget = None) -> None:
+        super().__init__(parent)
+
+        self.amount = 1
 
-    def down_amount(self):
-        self.amount = max(0, self.amount - 1)
-        self.amount_edit.setText(str(self.amount))
+        self.setRange(0, 99)
+        self.setValue(1)
+        # Like the arrows, typing only counts once editing is finished
+        self.setKeyboardTracking(False)
+        self.valueChanged.connect(self._set_amount)
+
+    @Slot(int)
+    def _set_amount(self, value: int):
+        difference = value - self.amount
+        self.amount = value
+        if difference != 0:
+            self.amount_changed.emit(difference)
 
 
 class AmountBar(QWidget):
-    def __init__(self, file_path: str,
-                 image_name: str, parent: QWidget) -> None:
+    def __init__(self, file_path: str, image_name: str,
+                 elided_name: str, parent: QWidget) -> None:
         super().__init__(parent)
 
         self.file_path = file_path
@@ -84,40 +113,53 @@ class AmountBar(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         self.img_label = QLabel(self)
-        self.img_label.setFixedWidth(50)
-        self.img_label.setFixedHeight(50)
-        pixmap = QPixmap(self.file_path)
-        pixmap = pixmap.scaled(
-            50, 50,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        self.img_label.setPixmap(pixmap)
+        self.img_label.setFixedWidth(THUMBNAIL_SIZE)
+        self.img_label.setFixedHeight(THUMBNAIL_SIZE)
+        key = thumbnail_key(self.file_path)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            # Leave the label empty until the preview is loaded,
+            # instead of decoding every image on the GUI thread
+            loader = ThumbnailLoader(self.file_path, key)
+            loader.signals.loaded.connect(
+                self._set_thumbnail, Qt.QueuedConnection
+            )
+            QThreadPool.globalInstance().start(loader)
+        else:
+            self.img_label.setPixmap(pixmap)
         layout.addWidget(self.img_label)
 
-        self.name_label = QLabel(self)
+        self.name_label = QLabel(elided_name, self)
         layout.addWidget(self.name_label)
 
         self.amount_edit = AmountEditor(self)
         layout.addWidget(self.amount_edit)
 
-        space = 120
-        metrics = self.name_label.fontMetrics()
-        elided = metrics.elidedText(self.image_name, Qt.ElideRight, space)
-        self.name_label.setText(elided)
-
         self.setLayout(layout)
 
+    @Slot(str, QImage)
+    def _set_thumbnail(self, key: str, image: QImage):
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        self.img_label.setPixmap(pixmap)
+
     @property
     def amount(self) -> int:
         return self.amount_edit.amount
 
 
 class AmountsPage(QWidget):
+    # Emits the new total whenever the files or any amount change
+    total_changed = Signal(int)
+
     def __init__(self, parent: QWidget = None) -> None:
         super().__init__(parent)
 
         self._files = []
+        # The bar of each listed file, by file path in listed order
+        self._bars: dict[str, AmountBar] = {}
+        # Running sum of all amounts, kept up to date by the editors
+        self._total_amount = 0
 
         page_layout = QVBoxLayout()
         # page_layout.setSizeConstraint(QLayout.SetFixedSize)
@@ -145,16 +187,56 @@ class AmountsPage(QWidget):
         self.setLayout(page_layout)
 
     def _refresh_list(self):
-        for i in reversed(range(self.list_layout.count())):
-            self.list_layout.itemAt(i).widget().deleteLater()
-
-        for file in self.files:
-            amount_editor = AmountBar(
-                file,
-                os.path.basename(file),
-                self.list_box
-            )
-            self.list_layout.addWidget(amount_editor)
+        # Reuse the bars of files that are still listed,
+        # only create bars for new files and delete the rest
+        old_bars = self._bars
+        self._bars = {}
+
+        # The bars inherit the font of the list, so names can be
+        # elided with the same metrics for all of them
+        metrics = self.list_box.fontMetrics()
+
+        # Lay out and repaint the list once after all changes,
+        # instead of for every added, moved or removed bar
+        self.list_box.setUpdatesEnabled(False)
+        self.list_layout.setEnabled(False)
+        for index, file in enumerate(self.files):
+            amount_bar = old_bars.pop(file, None)
+            if amount_bar is None:
+                image_name = os.path.basename(file)
+                amount_bar = AmountBar(
+                    file,
+                    image_name,
+                    metrics.elidedText(image_name, Qt.ElideRight, NAME_WIDTH),
+                    self.list_box
+                )
+                amount_bar.amount_edit.amount_changed.connect(
+                    self._update_total
+                )
+            self._bars[file] = amount_bar
+
+            # Keep the layout in the same order as the files
+            if self.list_layout.indexOf(amount_bar) != index:
+                self.list_layout.removeWidget(amount_bar)
+                self.list_layout.insertWidget(index, amount_bar)
+
+        for amount_bar in old_bars.values():
+            self.list_layout.removeWidget(amount_bar)
+            amount_bar.deleteLater()
+        self.list_layout.setEnabled(True)
+        self.list_layout.update()
+        self.list_box.updateGeometry()
+        self.list_box.setUpdatesEnabled(True)
+
+        self._total_amount = sum(
+            amount_bar.amount for amount_bar in self._bars.values()
+        )
+        self.total_changed.emit(self._total_amount)
+
+    @Slot(int)
+    def _update_total(self, difference: int):
+        self._total_amount += difference
+        self.total_changed.emit(self._total_amount)
 
     @property
     def files(self) -> list[str]:
@@ -166,13 +248,13 @@ class AmountsPage(QWidget):
         self._refresh_list()
 
     @property
-    def amounts(self) -> list[dict]:
-        selected_amounts = []
+    def total_amount(self) -> int:
+        return self._total_amount
 
-        for i in range(self.list_layout.count()):
-            amount_bar: AmountBar = self.list_layout.itemAt(i).widget()
-            selected_amounts.append(
-                {"path": amount_bar.file_path, "amount": amount_bar.amount}
-            )
-
-        return selected_amounts
+    @property
+    def amounts(self) -> list[dict]:
+        # The bars are stored in the same order as the layout
+        return [
+            {"path": amount_bar.file_path, "amount": amount_bar.amount}
+            for amount_bar in self._bars.values()
+        ]
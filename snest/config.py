@@ -18,14 +18,15 @@ import os
 import multiprocessing
 import json
 from typing import TypedDict
-from PySide6.QtCore import QLocale, Qt
-from PySide6.QtGui import QDoubleValidator, QIntValidator, QFont
+from PySide6.QtCore import QLocale, Qt, Slot
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QPushButton,
     QVBoxLayout,
     QWidget,
     QLabel,
-    QLineEdit,
+    QSpinBox,
+    QDoubleSpinBox,
     QHBoxLayout,
     QScrollArea,
 )
@@ -33,6 +34,19 @@ from PySide6.QtWidgets import (
 A4_width = 210.0
 A4_height = 297.0
 
+# Type, minimum and maximum of the value entered in each config box
+FIELD_RANGES: dict[str, tuple[type, float, float]] = {
+    "mm_width": (float, 1.0, 99999.0),
+    "mm_height": (float, 1.0, 99999.0),
+    "dpi": (float, 1.0, 99999.0),
+    "margin": (int, 0, 99999),
+    "padding": (int, 0, 99999),
+    "num_generations": (int, 1, 999),
+    "population_size": (int, 2, 999),
+    "mutation_rate": (int, 1, 100),
+    "rotations": (int, 1, 360),
+}
+
 
 class Config(TypedDict):
     num_generations: int  # Number of generations.
@@ -61,6 +75,9 @@ class ConfigPage(QWidget):
         super().__init__(parent)
 
         self.config_file = os.path.join(application_path, "config.json")
+        # Last parsed config and the modification time it was read at
+        self._cached_config: Config | None = None
+        self._cached_mtime: int | None = None
 
         self.defaults = {
             "num_generations": 50,
@@ -75,6 +92,10 @@ class ConfigPage(QWidget):
             "padding": 5,
         }
 
+        # Create the config file once, instead of checking on every load
+        if not os.path.isfile(self.config_file):
+            self.init_config()
+
         # self.setFixedWidth(width)
         # self.setFixedHeight(height)
 
@@ -94,129 +115,65 @@ class ConfigPage(QWidget):
         config_widget.setLayout(layout)
         scroll_area.setWidget(config_widget)
 
-        # Output settings
-
-        output_label = QLabel(config_widget)
-        output_label.setText("Output settings")
-        output_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        layout.addWidget(output_label)
-
-        layout.addSpacing(5)
+        # Label, config key and tooltip of each box
+        output_fields = [
+            ("Output width (millimeter)", "mm_width", None),
+            ("Output height (millimeter)", "mm_height", None),
+            ("Output dpi", "dpi", None),
+            (
+                "Sticker margin", "margin",
+                "Space between the cutting line and other lines."
+            ),
+            (
+                "Sticker padding", "padding",
+                "Space between the sticker and its cutting line."
+            ),
+        ]
+        algorithm_fields = [
+            (
+                "Number of generations", "num_generations",
+                "The total amount of generations the optimizer does."
+            ),
+            (
+                "Population size", "population_size",
+                "The amount of random solutions created for each generation."
+            ),
+            (
+                "Mutation rate", "mutation_rate",
+                "The percentage rate (1-100) at which changes are randomly "
+                "added."
+            ),
+            (
+                "Rotations", "rotations",
+                "The amount of different rotations to try, "
+                "1 for none, 4 for 90 degree angles, etc.."
+            ),
+        ]
+
+        # The box of each config key, in the order they are shown
+        self._boxes: dict[str, QSpinBox | QDoubleSpinBox] = {}
 
-        width_label = QLabel(config_widget)
-        width_label.setText("Output width (millimeter)")
-        layout.addWidget(width_label)
-        self.width_box = QLineEdit(config_widget)
-        width_validator = QDoubleValidator(1.0, 99999.0, 2, self.width_box)
-        width_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
-        width_validator.setLocale(QLocale("en_US"))
-        self.width_box.setValidator(width_validator)
-        self.width_box.setMinimumHeight(20)
-        layout.addWidget(self.width_box)
-
-        notation = QDoubleValidator.Notation.StandardNotation
-
-        height_label = QLabel(config_widget)
-        height_label.setText("Output height (millimeter)")
-        layout.addWidget(height_label)
-        self.height_box = QLineEdit(config_widget)
-        height_validator = QDoubleValidator(1.0, 99999.0, 2, self.height_box)
-        height_validator.setNotation(notation)
-        height_validator.setLocale(QLocale("en_US"))
-        self.height_box.setValidator(height_validator)
-        self.height_box.setMinimumHeight(20)
-        layout.addWidget(self.height_box)
-
-        dpi_label = QLabel(config_widget)
-        dpi_label.setText("Output dpi")
-        layout.addWidget(dpi_label)
-        self.dpi_box = QLineEdit(config_widget)
-        dpi_validator = QDoubleValidator(1.0, 99999.0, 2, self.dpi_box)
-        dpi_validator.setNotation(notation)
-        dpi_validator.setLocale(QLocale("en_US"))
-        self.dpi_box.setValidator(dpi_validator)
-        self.dpi_box.setMinimumHeight(20)
-        layout.addWidget(self.dpi_box)
-
-        margin_label = QLabel(config_widget)
-        margin_label.setText("Sticker margin")
-        layout.addWidget(margin_label)
-        self.margin_box = QLineEdit(config_widget)
-        self.margin_box.setValidator(QIntValidator(0, 99999, self.margin_box))
-        self.margin_box.setMinimumHeight(20)
-        self.margin_box.setToolTip(
-            "Space between the cutting line and other lines."
-        )
-        layout.addWidget(self.margin_box)
-
-        padding_label = QLabel(config_widget)
-        padding_label.setText("Sticker padding")
-        layout.addWidget(padding_label)
-        self.padding_box = QLineEdit(config_widget)
-        self.padding_box.setValidator(
-            QIntValidator(0, 99999, self.padding_box)
-        )
-        self.padding_box.setMinimumHeight(20)
-        self.padding_box.setToolTip(
-            "Space between the sticker and its cutting line."
+        # Output settings
+        self._add_section(
+            config_widget, layout, "Output settings", output_fields
         )
-        layout.addWidget(self.padding_box)
 
         layout.addSpacing(20)
 
         # Algorithm settings
-
-        algo_label = QLabel(config_widget)
-        algo_label.setText("Algorithm settings")
-        algo_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        layout.addWidget(algo_label)
-
-        layout.addSpacing(5)
-
-        gen_label = QLabel(config_widget)
-        gen_label.setText("Number of generations")
-        layout.addWidget(gen_label)
-        self.gen_box = QLineEdit(config_widget)
-        self.gen_box.setValidator(QIntValidator(1, 999, self.gen_box))
-        self.gen_box.setMinimumHeight(20)
-        self.gen_box.setToolTip(
-            "The total amount of generations the optimizer does."
+        self._add_section(
+            config_widget, layout, "Algorithm settings", algorithm_fields
         )
-        layout.addWidget(self.gen_box)
-
-        pop_label = QLabel(config_widget)
-        pop_label.setText("Population size")
-        layout.addWidget(pop_label)
-        self.pop_box = QLineEdit(config_widget)
-        self.pop_box.setValidator(QIntValidator(2, 999, self.pop_box))
-        self.pop_box.setMinimumHeight(20)
-        self.pop_box.setToolTip(
-            "The amount of random solutions created for each generation."
-        )
-        layout.addWidget(self.pop_box)
-
-        mut_label = QLabel(config_widget)
-        mut_label.setText("Mutation rate")
-        layout.addWidget(mut_label)
-        self.mut_box = QLineEdit(config_widget)
-        self.mut_box.setValidator(QIntValidator(1, 100, self.mut_box))
-        self.mut_box.setMinimumHeight(20)
-        self.mut_box.setToolTip(
-            "The percentage rate (1-100) at which changes are randomly added."
-        )
-        layout.addWidget(self.mut_box)
-
-        rot_label = QLabel(config_widget)
-        rot_label.setText("Rotations")
-        layout.addWidget(rot_label)
-        self.rot_box = QLineEdit(config_widget)
-        self.rot_box.setValidator(QIntValidator(1, 360, self.rot_box))
-        self.rot_box.setMinimumHeight(20)
-        self.rot_box.setToolTip(
-            "The amount of different rotations to try, "
-            "1 for none, 4 for 90 degree angles, etc.."
-        )
-        layout.addWidget(self.rot_box)
+
+        self.width_box = self._boxes["mm_width"]
+        self.height_box = self._boxes["mm_height"]
+        self.dpi_box = self._boxes["dpi"]
+        self.margin_box = self._boxes["margin"]
+        self.padding_box = self._boxes["padding"]
+        self.gen_box = self._boxes["num_generations"]
+        self.pop_box = self._boxes["population_size"]
+        self.mut_box = self._boxes["mutation_rate"]
+        self.rot_box = self._boxes["rotations"]
 
         # Save button
 
@@ -236,18 +193,69 @@ class ConfigPage(QWidget):
 
         self._reload_config()
 
+    def _add_section(
+        self,
+        parent: QWidget,
+        layout: QVBoxLayout,
+        title: str,
+        fields: list[tuple[str, str, str | None]],
+    ) -> None:
+        """Adds a bold section title followed by a labeled box per field.
+            The boxes are stored in self._boxes by their config key,
+            and accept the range given for that key in FIELD_RANGES."""
+        title_label = QLabel(parent)
+        title_label.setText(title)
+        title_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        layout.addWidget(title_label)
+
+        layout.addSpacing(5)
+
+        for text, key, tooltip in fields:
+            label = QLabel(parent)
+            label.setText(text)
+            layout.addWidget(label)
+            value_type, minimum, maximum = FIELD_RANGES[key]
+            if value_type is float:
+                box = QDoubleSpinBox(parent)
+                box.setDecimals(2)
+                box.setLocale(QLocale("en_US"))
+            else:
+                box = QSpinBox(parent)
+            box.setRange(minimum, maximum)
+            box.setMinimumHeight(20)
+            if tooltip is not None:
+                box.setToolTip(tooltip)
+            layout.addWidget(box)
+            self._boxes[key] = box
+
+    def _write_config(self, config: Config) -> None:
+        """Writes the config to a temporary file and then replaces
+            config.json with it, so a crash can't leave a partial file."""
+        data = json.dumps(config, indent=4)
+        temp_file = self.config_file + ".tmp"
+        with open(temp_file, "w") as file:
+            file.write(data)
+        os.replace(temp_file, self.config_file)
+
     def init_config(self):
-        with open(self.config_file, "w") as file:
-            json.dump(self.defaults, file, indent=4)
+        self._write_config(self.defaults)
         print(f"Created config.json at {self.config_file}")
 
     def load_config(self) -> Config:
-        if not os.path.isfile(self.config_file):
+        # Only parse the file again if it changed since the last read
+        try:
+            modified = os.stat(self.config_file).st_mtime_ns
+        except FileNotFoundError:
+            # The file was removed after the page was created
             self.init_config()
-
-        with open(self.config_file, "r") as file:
-            config: Config = json.load(file)
-
+            modified = os.stat(self.config_file).st_mtime_ns
+        if modified != self._cached_mtime:
+            with open(self.config_file, "r") as file:
+                self._cached_config = json.load(file)
+            self._cached_mtime = modified
+
+        # Callers are free to change the returned config
+        config: Config = self._cached_config.copy()
         return config
 
     def save_config(self, changes: Config) -> Config:
@@ -255,8 +263,9 @@ class ConfigPage(QWidget):
 
         config.update(changes)
 
-        with open(self.config_file, "w") as file:
-            json.dump(config, file, indent=4)
+        self._write_config(config)
+        self._cached_config = config.copy()
+        self._cached_mtime = os.stat(self.config_file).st_mtime_ns
 
         print(f"Saved changes to config.json at {self.config_file}")
         return config
@@ -264,30 +273,24 @@ class ConfigPage(QWidget):
     def _reload_config(self):
         self.config = self.load_config()
 
-        self.width_box.setText(str(self.config["mm_width"]))
-        self.height_box.setText(str(self.config["mm_height"]))
-        self.dpi_box.setText(str(self.config["dpi"]))
-        self.margin_box.setText(str(self.config["margin"]))
-        self.padding_box.setText(str(self.config["padding"]))
-        self.gen_box.setText(str(self.config["num_generations"]))
-        self.pop_box.setText(str(self.config["population_size"]))
-        self.mut_box.setText(str(self.config["mutation_rate"]))
-        self.rot_box.setText(str(self.config["rotations"]))
+        # Fill in all boxes with a single repaint at the end
+        self.setUpdatesEnabled(False)
+        for key, box in self._boxes.items():
+            box.blockSignals(True)
+            box.setValue(self.config[key])
+            box.blockSignals(False)
+        self.setUpdatesEnabled(True)
 
+    @Slot()
     def _set_config(self):
-        self.config: Config = {
-            "mm_width": max(float(self.width_box.text()), 1.0),
-            "mm_height": max(float(self.height_box.text()), 1.0),
-            "dpi": max(float(self.dpi_box.text()), 1.0),
-            "margin": int(self.margin_box.text()),
-            "padding": int(self.padding_box.text()),
-            "num_generations": max(int(self.gen_box.text()), 1),
-            "population_size": max(int(self.pop_box.text()), 2),
-            "mutation_rate": max(int(self.mut_box.text()), 1),
-            "rotations": max(int(self.rot_box.text()), 1),
-        }
+        # The boxes already keep their values in range
+        changes = {key: box.value() for key, box in self._boxes.items()}
 
-        self.config = self.save_config(self.config)
+        # Saving without any edits doesn't need to touch the file
+        config = self.load_config()
+        if any(config.get(key) != value for key, value in changes.items()):
+            config = self.save_config(changes)
+        self.config = config
         self._reload_config()
 
     def showEvent(self, event):
@@ -0,0 +1,196 @@
+# This file is part of StickerNest.
+# Copyright (C) 2024 Eliza
+
+# StickerNest is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# StickerNest is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import math
+from typing import TYPE_CHECKING
+import numpy as np
+import shapely
+from PIL import Image
+from shapely import Polygon, buffer
+
+if TYPE_CHECKING:
+    # snest.config loads Qt, which the export workers don't need
+    from snest.config import Config
+
+MM = 1 / 25.4  # mm to inch
+# zlib level of the exported pngs, the pages are only printed or cut,
+# so faster saving is worth the slightly bigger files
+PNG_COMPRESS_LEVEL = 1
+
+# Image path, fitted polygon and transformation of a placed sticker
+Placement = tuple[str, Polygon, np.ndarray]
+
+
+def paste_sticker(
+    canvas: Image.Image,
+    image: Image.Image,
+    origin: tuple[float, float],
+    transformation: np.ndarray
+) -> None:
+    """Draws the image onto the canvas at its fitted position.
+        origin is the bin coordinate of the bottom left page corner."""
+    # Image pixels are centered on the polygon coordinates, which have
+    # their y axis flipped. The fitted position is then turned into
+    # canvas pixels that count y downwards from the top of the page
+    to_polygon = np.array([
+        [1, 0, -0.5],
+        [0, -1, image.height - 0.5],
+        [0, 0, 1]
+    ])
+    to_canvas = np.array([
+        [1, 0, -origin[0]],
+        [0, -1, canvas.height + origin[1]],
+        [0, 0, 1]
+    ])
+    matrix = to_canvas @ transformation @ to_polygon
+
+    # Only resample the part of the page covered by the image
+    corners = matrix[:2, :2] @ np.array([
+        [0, image.width, 0, image.width],
+        [0, 0, image.height, image.height]
+    ]) + matrix[:2, 2:]
+    left = max(math.floor(corners[0].min()), 0)
+    top = max(math.floor(corners[1].min()), 0)
+    right = min(math.ceil(corners[0].max()), canvas.width)
+    bottom = min(math.ceil(corners[1].max()), canvas.height)
+    if right <= left or bottom <= top:
+        return
+
+    # PIL maps every output pixel back onto the image,
+    # so it takes the inverse of the placement
+    offset = np.array([[1, 0, -left], [0, 1, -top], [0, 0, 1]])
+    inverse = np.linalg.inv(offset @ matrix)
+    placed = image.transform(
+        (right - left, bottom - top),
+        Image.AFFINE,
+        tuple(inverse[:2].flatten()),
+        Image.BILINEAR
+    )
+    canvas.alpha_composite(placed, (left, top))
+
+
+def svg_polylines(polygons: list[Polygon]) -> list[str]:
+    """Returns an svg polyline of the exterior of every polygon part,
+        formatted like shapely's svg() of the exterior ring.
+        The coordinates of all rings are fetched in a single call."""
+    rings = shapely.get_exterior_ring(shapely.get_parts(polygons))
+    coords = shapely.get_coordinates(rings)
+    ends = np.cumsum(shapely.get_num_coordinates(rings)).tolist()
+    colors = np.where(shapely.is_valid(rings), "#66cc99", "#ff3333")
+    xs, ys = coords.T.tolist()
+
+    polylines = []
+    start = 0
+    for end, color in zip(ends, colors.tolist()):
+        if end == start:
+            polylines.append("<g />")
+            continue
+        points = " ".join(map("{},{}".format, xs[start:end], ys[start:end]))
+        polylines.append(
+            f'<polyline fill="none" stroke="{color}" stroke-width="2.0" '
+            f'points="{points}" opacity="1.0" />'
+        )
+        start = end
+    return polylines
+
+
+def export_page(
+    input: tuple[int, list[Placement], Polygon, "Config", str]
+) -> tuple[int, str, str]:
+    """Helper function to export pages with multiprocessing.
+        Writes the png and the svg cut lines of one page,
+        and returns the page number with both file paths."""
+    page_id, placements, bin_polygon, config, output_dir = input
+
+    bbox = bin_polygon.bounds
+    # White page of the output size, a bin unit is one pixel
+    canvas = Image.new(
+        "RGBA",
+        (
+            int(config["mm_width"] * MM * config["dpi"]),
+            int(config["mm_height"] * MM * config["dpi"])
+        ),
+        "white"
+    )
+    # Stickers placed more than once are only decoded once,
+    # the images are not changed by pasting them
+    images: dict[str, Image.Image] = {}
+
+    for path, _, transformation in placements:
+        # Fetch the image that belongs to the polygon, its y axis is
+        # flipped to the way we fit polygons while pasting it
+        image = images.get(path)
+        if image is None:
+            image = Image.open(path).convert("RGBA")
+            images[path] = image
+        # Apply the FitPoly transformation to the image,
+        # moving it to its fitted position
+        paste_sticker(canvas, image, bbox[:2], transformation)
+
+    png_output = os.path.join(output_dir, f"export{page_id}.png")
+    # The page is white, so it stays fully opaque after pasting
+    # and the alpha channel can be left out of the file
+    canvas.convert("RGB").save(
+        png_output,
+        dpi=(config["dpi"], config["dpi"]),
+        compress_level=PNG_COMPRESS_LEVEL
+    )
+
+    width = bbox[2] - bbox[0]
+    height = bbox[3] - bbox[1]
+    view_box = (bbox[0], bbox[1], width, height)
+    # Prepare svg file props
+    props = {
+        "version": "1.1",
+        "baseProfile": "full",
+        "width": f'{config["mm_width"]}mm',
+        "height": f'{config["mm_height"]}mm',
+        "viewBox": "%.1f,%.1f,%.1f,%.1f" % view_box,
+        "xmlns": "http://www.w3.org/2000/svg",
+        "xmlns:ev": "http://www.w3.org/2001/xml-events",
+        "xmlns:xlink": "http://www.w3.org/1999/xlink",
+    }
+
+    # Add the bin to the SVG file, so that it can easily
+    # be overlapped with the images. Then remove the margin from
+    # all polygons at once, leaving them padding distance away
+    # from the image
+    cutlines = [
+        bin_polygon,
+        *buffer(
+            [polygon for _, polygon, _ in placements], -config["margin"]
+        )
+    ]
+
+    attrs = " ".join(f'{key}="{val}"' for key, val in props.items())
+
+    # Write the svg file piece by piece
+    svg_output = os.path.join(output_dir, f"export{page_id}.svg")
+
+    with open(svg_output, "w") as f:
+        f.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        f.write(f"<svg {attrs}>\n")
+        # This flips the y axis
+        f.write(f'<g transform="translate(0,{height})">\n')
+        f.write('<g transform="scale(1,-1)">\n\n')
+        # Turn the polygons into svg strings
+        for polyline in svg_polylines(cutlines):
+            f.write(polyline)
+            f.write("\n")
+        f.write("\n</g>\n</g>\n</svg>")
+
+    return (page_id, png_output, svg_output)
@@ -0,0 +1,2253 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.7.1
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x8a\xb4\
+\x00\
+\x00\x01\x00\x08\x00\x10\x10\x00\x00\x01\x00 \x00\xe0\x02\x00\
+\x00\x86\x00\x00\x00\x18\x18\x00\x00\x01\x00 \x00\xcc\x04\x00\
+\x00f\x03\x00\x00  \x00\x00\x01\x00 \x00\xd7\x06\x00\
+\x002\x08\x00\x0000\x00\x00\x01\x00 \x00\xd4\x0a\x00\
+\x00\x09\x0f\x00\x00@@\x00\x00\x01\x00 \x00Q\x0e\x00\
+\x00\xdd\x19\x00\x00``\x00\x00\x01\x00 \x00I\x16\x00\
+\x00.(\x00\x00\x80\x80\x00\x00\x01\x00 \x00\xbf\x1d\x00\
+\x00w>\x00\x00\x00\x00\x00\x00\x01\x00 \x00~.\x00\
+\x006\x5c\x00\x00\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\
+\x0dIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\
+\x00\x00\x1f\xf3\xffa\x00\x00\x02\xa7IDAT8O\
+\x8d\xd2KL\x13A\x18\x00\xe0\x7fv\xb7\xdb--P\
+\x84n\xb7\x22J|D\x89\x8f\xf88`4\xd1\xc4\xb6\
+\xf2\x88D!\x94\x96\xa3&$F\x13\x13O\x9a\x18\x88\
+\x8a\x17\xbd\xe8\xc5\x8b1\xde\xd4mAC\x08\xb4\x8d\xd0\
+\x03\x17\xc3\xc1\x03\x98\x10\x88FT\xd0\xee\xa3M)\xaf\
+\xbew\xc7-\xa4\x0d\xd1\x84:\xc7\xf9g\xbe\x7f\xfe\x7f\
+~\x04\xdar\xfa\xa2\xed\x18\xb2\xcft\xa6\x9a\xdd\x18\xab\
+\x90[\x8d\xcf\xeb\x08\xe2Z\xa0\xcb2\x91\x8fo\xb7P\
+\xcb\x80\xdc\x92#(?\xc9\x18!\xbb\x16\x9fFXU\
+\x0d6\xeeDR\x90F\xc6=\x5c[I\xc0\xc9\x8b\x93\
+\x8c\xcd\xda\x98\x10#/Cn\xb6g\xf3EK\xc7)\
+\x94\xb5\x05\x5cl\xa0$`\xf7\x09sL\x15w0\x15\
+\x93\x87Bnk{\xa9\x0b\x7f\xc7Q\xd3\x80\xf0\x904\
+s\xbdXQ \x13\x8f\xce\xe8h\xfaQ\xb0c\x07\xff\
+\xbf\x10\xc2\x18\xa3\x8b\x83\xc2k\xdal\xeb&\x19\x00%\
+\x03\x90\x89\xc8_i\x93\xbey\xf4\x92y\xbe\xe9\x8dp\
+Xk(5\xe2\xb1NoE\xaf\xf8\xa5}\xb9\x150\
+\xa1\xc2\xa6\xdd\x17n\x06\x95\xec\xa5+\xab\xcf\x90\x0c\x09\
+\xe9\x88<E\x12\xe8\x1e\x18*G)\x03\x0dIY\x0c\
+\x84<\xb6\xd6\xe2y^\xfc\xa1\xaf\xb2\xee)\x02\x85\x80\
+\xc3+\xf6PF\xf3\x0b%\xbd\x0e\xaa\xaa<\xd7\x92\xdf\
+$\x19\x13\x90\x8c\x0e\x94\x98\xe4\x08\xba\xb8P\xfe\xac\x9d\
+\x17\xbfk\xc9\xea\x91\xe3}\xb8a\xbcc\xe7l\x01p\
+\xf9\xb0a\x99^Mh\xb7AU\xd2O\x01\xa3\xdbH\
+U\xe6(\xb3\xe5P.\x1e\x99\x1b\xf3\xd8\x1a6~\x8a\
+\x97\xbe\x10F\xd3\x01\xd4\xec\xcf\xe0\xec\xca\xd2GD\xa8\
+oI\x15\xa5\x14\xc07\xcaj\xf3s Oa\x04\xfd\
+z3\xfb.\x15\x8b\xf6\x01V;\x8du\xec\xb1\xcco\
+\xe9r\xb0\x8b\x1b.\x02v\xaf0a`\xb9s\x94A\
+c1hY\x01\xd6\xc3\xb2\xa87V\x9cV\x13\xcb\xfb\
+\xf5\xb5\xd6\xf1\xe4B\xe4\x16\xd2\x11\xb3\x8c\xadzlm\
+A\xfc\xa9\xf5\xa2\xde\xe1\x93>\x93\x86\xf2\xa3\x1b=\xb8\
+\xc0GNR\x80\xcf\x02\x81\x19\x82@3\xc1N\xd6\x9f\
+\xdfwx\xe5.c\x9d\xc5\x9b\x5c\x14\x1f|p\xdb\xee\
+;x\xe9[\xd9.vo\xe6W\xb4[!r\xd7\x09\
+\xa6\xe2\xfc?M\xdc\xfaUN^v\x95\xd5Y|\x89\
+\xb0\xfcx\xcce\xbd\x9b\x1f{\x8a\xb5\xf8\xb5\xf2\xe6\x11\
+\xc2\x09\xd0\xe9\x8f\x94\x00\x04\x0d\xe0\x8a\xc0\xe6\x98\x0b\x9f\
+\xe8*\xeeT*&\x01h\xca\xb6@\xa1\x84\xb5\xc5\xe8\
+\x93\x90\xdbr'\x0f\xb4\x0eE\x1bU]\xf9\xa4\x92Z\
+\x07\xac\xe4`[\xa0e0\xd2F\xd6\xd4\x0c'\xa5h\
+\x9f\x06\xf4\x17\xcasz\xc5W\x88f\xae\xe2tb\xf1\
+\x0f \x5c' #\x96\x0b\x93\x00\x00\x00\x00IEN\
+D\xaeB`\x82\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\
+\x0dIHDR\x00\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\
+\x00\x00\xe0w=\xf8\x00\x00\x04\x93IDATHK\
+\xadVmh[U\x18~\xcf\xb9_\xe9\xcdW\x93&\
+M\xe2Dl'N\xe6@\x911\x1cl\xcaL\xb3\xad\
+\xb0v\xb8\xad\xed\x06\xee\x87 \xfaCP\x90\xc9~\x08\
+[\x87CpND\xe6DD\xf7Ga\xcd\xad\xd3\xae\
+j\xa5\xcb\xea\xc01\xa7l\xfe\x9c\x0aj\xe9@\x9b\xe6\
+\xa3M\xd2$7\xf7\xf3\x1c\xcf\x89+\xb4\x1b\xd6u\xee\
+\xc0\xe5^\xb8\xef\xfb>\xe7\xbc\xef\xf3<\xf7\x22\xb8\xb1\
+v|\x99{\xa4\xa1\xc3 F\xe4\x09Jq\x98R\x02\
+\x80\xf1_\x08\xd1q\x9f\xa8\xbc>\xf2thj!v\
+%w\xc4\x83SC\xd9>\x90\x14\x0d\xcb\x1e\x00B\x00\
+I2\xf0\x17\x94R\x10<2\x18\x85\xdc\xb5\x89\xbd\xf1\
+u+)\xbc\x10\x8bz\xb4r\x87N\xcdIQ\xf5\x03\
+u,pm\xb3\x86\x11\x1d\xe3\x01\xc4\x85\x0d-\xb1\xd8\
+\xfdF\xb1\x08\xe7\xfb\xa2\xcd\xcd\xact\xa1\xae\xa1\xdc1\
+\xd1\x17|\x95\xd8F\xb3\xb8W\xc1kFwF\xa7\x17\
+\x0a%\xb5\xfc\x00;U\x8a\x9d\xe0\xb9\x95\x16\xe7\xf1(\
+9\x94\x1d\x13<j7\x96<\xe0\xd6\xca\x972\x03\xb1\
+MwR\xe8\xdfrPR\xcb\x0e\x8b\x8ao\x0f\xb1-\
+\xd6s\x02\x8a\x0cO}\xbd3z\xe1n\x81\xa0T\xba\
+\xf8\x8c\xe8\x0f|bUK\x80E\xa9y9F\xe3#\
+/R\xde\x1c\xed\x0f\xfe\xfe\x7f\x81\x9a\x83cm\xfa\xae\
+%\x1e\xdfl\xe4\x0b\x9c\x9a \xfb\xc3\xe0\xe8U\xa0\xb6\
+1\xaa`t\xe0\xab=\xed\xbf\xdd)P\x13\xe0\xf9\xab\
+T\xfdc2?\xa2\xb4\xb6\xa7\x88c\x83S\xaf\x00B\
+\x18\xa4@\x18\xdcF\x0d\x88a\xee\xcf\x0cD>mn\
+F\x9b\xdd(\xca\xd4\x8b-\xc1\xf6A\xeb\xe5\xe1~d\
+\xdd\x0c\xde\xabU\x1e0\xb0\xbd\x8e8\xce\xcc\x12\xeau\
+\x7fV\xe8q\x1c\xe7\x90\xe0\x0f\xafg\x03\x01[\xafP\
+\xd1\xe3CX\x94\x01\x93\xfaj\xb7fo\x10\xe3\x91\xd3\
+\x8en\x83 I`\xcc\xce\x5c\xdf\x1c\x8b?4\xb8\x05\
+\x19\x8bA\x92\xe9\xecOj\x22\xfe\x989Wm\xea\xe9\
+\x96\xd5\xad\x15\x9e\xb4\x88{R\xf2\xb5>\xccA\x94`\
+\x14Y\xf3\xf9S\x02\x08?\x0b\x81\xc8qk~\x96\x9d\
+\x10\xc0\x13i\x03=W<61\x10=\xb8\xb8\x08\x13\
+\xee\x151\xd0\xb6\xde\xe6\x9dX\xae\xb7\x8ca\xbf\x8a\x1e\
+\xff\x1a\xaeh\xda\xa8]\xa5\x98\x8e\x08\x9e\xe0Q\xa7Q\
+\x05,H\x80\xb0\xc0\xc4\xe8@4\x22GOo\x09\x14\
+\x17jui\xb9\xefE5\xb0\xd1\xd6\xe7\xe9\xf2\x00\xe9\
+\xdc\x07r0\xf2\x021\x1bl\x0e\xf5\x1f\x08F\xa3\x92\
+\x1ax\xc3\xae\x96\x0c\x04x\x1aIR\xa7\xe4\x0f\x819\
+\x97\xfbx\xb1\x10\x97\x00$\xb5\x99\x1f\x19\xcahgg\
+\xec\x9d\x0f\xd7#}a\x17\xfb\xce\xd6b\x05\xb3z\x0d\
+Kj\x1b\xb7\x11\xab\x5c|\x9f\x8a\xf4\x9a\xe2\x8b\x9e\xb4\
+K\x05B1y\x99RtBPT&W\x04\xaa^\
+\xeb\x18\xd9\x97\x98\xe2\xf9K\x00\xb6\x8d\xd6\xa9\xd0\xa2\x82\
+U\xcaWX'.\x08\x80\xa6\x00\xbb!\x97\xe2\xdd\x82\
+\xdc\xe2\xe3\x09\xbc\x88X\xb5;uZ\xedQB\xd1w\
+]\xa3\x0e\xaec\xacE\x169\x22\x06\xc3}\x88Q\xdb\
+\xac\x14\xbe\x98\xe8\x8f\xed\xba\x05\x80\xf7\xd9\x13\x8e\xaf\xe1\
+\xee\xcc\x07\xc7\x17\xe5\x97m3M08\xf6\xec\x94g\
+_:\xb7\xb7\xfdD\xd7\x99\xc2a\xd9\x1f\x19\xe4\xaa\x17\
+I\xf9Q\xc3#\x95D\xcb{\x9dX\x06`Y\x01\xc7\
+\x9c[{~\xd7=\xbf\xa4\xd2\xb9\xcb\x827\xf0xs\
+\x06\xc9\xcfi\x1b\xb2\x8a\x07)v\xf6!\x10\xeemZ\
+6C\xa3v\xc3d\xc6}\x09\x0b\xe8Pfw\xec\xd2\
+\x0dA\x1eQ\xc2\xf1C\xc46\x01\xd5k\xc9o\xfa#\
+\xdf\xa6\xb4\xdcY)\x18\xed\xa5\xcc\xe6\x9d\xf9\xc2xf\
+ \xb1\xbdK\xcb^\x14\xd5\xd6M\xb7\x0cy\xdb\x99z\
+\x02$#\xec8\x0d{\xf5}\xab\xfe\x5c<\x13\x0e\xb0\
+5\x9d\x1b\x14C\xed\x879\x00\xa9\xd7\xb7\x9e\xebo\xcb\
+\xf4h\x8d\x0eKq'\xb9\x8f!A\x04\xc9\xac=h\
+\x12z\x5cP\x03\xbd\xff\xc9\xa2\x9b)\xbc\x14`\x96\x01\
+\xac\xca\xf0\x98Tz\xe6\x94\x14\x8a=K,\x93)\xbf\
+\xac\x81K\x11V\x03}\x8eQ[\x9e\xa6\xb7\x0b\xd07\
+F\xa3e}.\x8fD\x11\xa8e\xb8,/O\x01%\
+\x98z\xee\x0e@\xb3}\xc3\x85\xb7\xc4\xd6\xc8\x01\xab\xc4\
+\x0c\x93\xf9\x18\xa5.\xe7\xca\xf2J\xbe\xdd\x13\xf0\xb8\xfd\
+\xe3\xd4;S\xc9W\x90\xdc\x22\xb8V\x83\xb2\xaf`\x93\
+\x93+\xfa\xcen\x1d\xca\x1f\x95\xda\xa2\xaf\x11\xdbaF\
+8\xb7\xfd\xfc\x9e\xd8\xf8\xe2M$\xb5\xe9W<\xa1\xc4\
+\xdbf\x99\xb9F\xf3\xaf\xe4\x1f\x9a\xdf\xf6J\xa5\xb3/\
+\x0a\xde\xd0{\x8e>\xcf\xf2\x95\x0d\x13{\x83WnN\
+\xe6\xb4\x05\x02;\x98\xfd\xda\xec\xf7\xe7\xe2\xdfwG^\
+\x88\xdf\x0b2B\x00\x00\x00\x00IEND\xaeB`\
+\x82\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHD\
+R\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00sz\
+z\xf4\x00\x00\x06\x9eIDATXG\xbdWkl\
+[\xe5\x19~\xbf\xef\x5cl\x1f\xdb'\xbe\x1d\xdbma\
+\x5c\xcb\x8f\x0a4\xa9+L X\x05I\x1a\xda\x06\xd4\
+f8\x09Hc\x7f+\x84\xc6\xaai\x80*\x18\x05V\
+\x09\x89I\xdbT\xed\xc7\xa6J\xa3\x80Fl7\x80Z\
+.M\x9b\x8a2\x10\x9b\xf8\x03HH\xd0i\x80\xc4\xb4\
+\xf8\xf8\x12\xdb\x89\xdd\xf8\xf8\x5c\xbe\x8f\xf7;QB\xd4\
+4ki\xcd\xce\x8f\xc4\xca\xf1y\xbf\xe7\xbc\xefsy\
+C`\xc5u\xef\xfb\xd5\xe8\xc2\x8c\xf3\x0b\xce\xc9\x08\x10\
+\xba\x118\x8f\x02!\x9c\x02\xab1\xa0\x1f\x13Y~e\
+z$\xf9\xd7\x95\xcf\x5c\xeeg\xb2T\xa0\xbfX\x1d\x06\
+\xce^R\xc2}1\xafk\x01wm<\x9f\xf9\xb7\x09\
+\x95\x80*\x01\x90\xd4\x10\xd8\xad\xfa'\xe1\x0d\xe9;\x8e\
+\xdeNZ\x97{\xb8_[\xfc\xd8^hl\x05]?\
+\xcd=\x07\x9cV\x03\x0f\xa4 k}@d\xc5?\x83\
+{.0\xbb\x83\x808\xa8\xd1\x18X\x8d\xfam\xa7F\
+\x93\xff\xe8\x09\x80w\xde\xe1\xf2o\xcb\xe6\xbfU=y\
+\x95;\xdf`\xd8o*\x87tp;\xcd\xf79\x91\xfe\
+.1F8\xf0\x1f\x22\xd4\x015\x91U\x05d\xb7^\
+\xfd\xc9T.\xfd^O\x00\x88\xd6\xcb\x01\xed\x98g\x9d\
+\xc5W\xe5 Gb\xc0\xda\xcd\xa7O\x8ce\xf6\xaf<\
+ W\x98K\xd4\xd9\xc2#@\xe9^\x90C[N\x8d\
+\xe8\xff\xea\x09\x80\xc1b\xe59\xaaj\x8f\xb9V\x1b$\
+%\x88\xb3\xefz1H\x07\x8a\xa3\xc4\xeb\xc5\x01\x17\xaa\
+A\x06\xf2\xa5?\xd1`\xe4!\xd1\x01*\xab\xc8C\x0f\
+\x8cT\xc0x\xe5N\xbdv\xa1\x87{q\x9f\xf4\xe7\xab\
+O\xca!\xed\x19\xb7\x83\xa4\xc6\x11(8\x02o\xa1\xf9\
+\xee5\xd7f\x07\xff\xb2\x858\xbd8\xe4\x7f\xd5 \xfd\
+\x93s7K\x14>d\xa8\x00|{\x0eH:5\x96\
+\x06{\xbef\xca\x0c\x1e\x9b\x1a\xcf\xbc\xf8}\x82\xf0e\
+8\x98\x9f9\xae\xa6\xd6\x0dYU\x13\x90d>\x08Y\
+\xd3A\x0a\x84\xa0;W5e.\xfd\xe1\xaa\xeb\x92\x07\
+\xb1#\x0b\xbd\x06\xe3\x03\xc8\x15\xb8\xd1d\xe6\x19\xd5\xc8\
+\xc6\xbb\xf5\xaa\xd0;\xf7M\x82\x03\x91B\x11$\xbd\x86\
+\xda7;\x94\xf1\xbd'\xc7\xd7\xff\xb9\x97 \x96\x9d0\
+Wh\x19Mh\x17\x95Xv+s\x1dp\xcf\xce\xf9\
+\x06\xe4w\x04\xbdY\x0eEA\x89\x22\x90\x8a\xf9\xe2\xf4\
+\xd8\xba\x9f/\x81\xd8^\xaclw\x5c\x16\xe7\x12\xf5\xd0\
+\xb5\x9d8\x0f\x9e.\x8e\xf6\xd5\xd7\x02\xb9\xeb\xb5\xc6\xd5\
+m\xbb;(\x01\x93\x08%\x9f/\x03Xz`\xdb\x91\
+\xda.\xc6\xbcg\x94H\xe2&a:N\xbb),y\
+\xb1#D\x22\xa1t\x12:\x95\xca\xfe\xe9\x5c\xe6\xe9\xfe\
+b\xe5\x80\x961\xf6\xb9gQ\xb1h\xdbTQ\xc0n\
+T<BC7\x9e\xb8O\xff\xfc| \x06'\xcaS\
+\xda\x95\xe9mv\x8b\x81P\xde*\x00K\x0f\xdd]4\
+\xfb=\xce\x9f\x94\xa3\xa9\xad\x9e\xb5\x00\xbck1Fq\
+$j\x880\xdb\x828\x18\x1a\x8e\xed\xb0\x12\xcf\xe6\xec\
+\xb9\xea\xf2Y\x81\x84\x01\xddZ\xe9\xa3\xe9\xf1\xf5\x9b\xcf\
+\x0b _9.\xeb\x89!\xa75\x8b\xb7\xb1\xe0\x85\xe6\
+9P\x9c\x19\x01P'E>0\xa7+\x92\x09\xd4\xbe\
+\x94\x08\xa5{\xa8\xeb\xee\x94\xfa\x92{\x9cyQl\xf1\
+\x12\xc1\xa5\xc6\x0c`\xf3\xd5\x9d\xc7\xefK\xbfun\xfd\
+\x81\x82\xf9\x86\x1cI\xec\xf4\x9f\xc1\xf1^\x10\x80(0\
+4Q~\x90\xe8\xf1\xc3\xee\xe280\x90\x12\xe0\xcc\xd7\
+\xf7\x22K7b\xb1\x87\x9cV\xdd?\xd8\x07\x89RV\
+\xb4>\xe2\xb4\xe7\xbe85\x9e\xb9\xbe'\x00v\x14\xda\
+YWvK\xc2%\x85_\x08\x00nk\xf6a$\xc6\
+&\x01\xc0]\x98G\xc2\xb22\xa5L\xe1TIp\xcf\
+\x83`\x02\xbd\xa4>\xfb\xb3\x93c\xa9\x97W\x82X\xd5\
+\x81\xa1|u\x0f%\xf2go\x8f\xc6\xdf]k\x1ch\
+\xd7\xa3J4\x99\x17\x84D\xb6\xa1\x1a\x12@\xed\xe6]\
+\xb6\xed\x8eJ\xe1\xe4\x1e\xd6\xc5\xa8\xb6;\x9f\xa2x\xdf\
+\x90\xa3\xb1\xc7E\xa4\xcb\xe1>`\x9d\xb9\xea\x89\x5c6\
+CP\x1eK\xb5W\x01\xe8\xcf\x9b\x5c\x8d&\xc1n\xd7\
+_\x93\x09\xf9\xbd\xce\x8d\x0fV\x06\xd1\xf6B\xed.\x17\
+\x9ccD\xd14\xcf\xb1\xb8 \xa1`\xefu\xd7g\xd5\
+/\xbf0\x0f!\xb0\x07=\xb1+\xd8VI\x81\xf0\xe6\
+.\xb4\xbe\x94\x94P\xc8C\xa2\x06\x93\x19\x8c\xee\xf2/\
+\xa7F\xb3\x7f\x5c\x13\xc0`\xa1d\xa1\xe5\x05\x84\xf31\
+\xdc\x82Xg\xbe\x02\x0c\xbeB\xc8\x1d\x02d\x03\xd5\xc2\
+\x1b9c\xc0\xad\x0e\xee\x0a(\xb0\x8c\x01v\xc5|v\
+*\xb7\xee7\xd8\x99#\x08\xe0\xa7\x9e\xe8\x80\xd3Y8\
+9\x9a\x0d\x0f\xe4+\xcf\xa2\x12\x9e\xb0fM4\xb0\x08\
+\xb8\xddvgS$\x1b?\xb8\x83 \x83\x01Vw\xa0\
+P\xfa\x8f\xaa\x1bW\x88\xb6\x89\x05I\xac^TlB\
+\x84\xf8F\xe4uQ\x82\xf8[\x0ah\x10\x88\xeb\xd0)\
+W\xa6\xa7\xc72\x83\xa2X\x7f\xa1\xfc\xaa\x1a\x89\xef\xf6\
+\xbf\xe3t\xec}F6\x8cs\x94\xdf+\x9b\x1d\xf1}\
+\xf1\xf7`*\x0bnc\x11\xf0y\x01\x0c\x17J\xb7X\
+@\x0f)z\xea&\x9c\x15v\x01CI8 \xceZ\
+H\x8eJ\x0a\x10EF\xd6\xe3\xaa\xc6\xba\xbf;\x91[\
+\xf7\xeb\xa5v\x0eN\x94&e=9\xb2\x04`\x83\x12\
+\xcc\xbc\xb0;\xde\x1c(V\x9f\x0a\xc4S\xfb\xad\x9a\xe9\
+\x03\x17#\x0ao\x90\xf4\xa3\xb7\x1b\xad5e\xb8s\xb2\
+t\xa7\xe3J\xf7z\xdc\xfb\x11\x0at=AF\x13\x06\
+\x0b\xb8\x96~\x85\x0a;\x1d\xea\x93_>\xba\xcd\x98Y\
+I\xd4s\x01\xa8Z(\xfb\xe6p\xac\x91\xe3\x5cm\x16\
+\xcd\x06\x0dD4\xb7\xd3F.d\xa1;[{~z\
+\xdcxt`\xc2<\x86F4\xfc\x9d|`-u\xac\
+\x05`\xb1\xd5\xa5\x87\x03\x89\xecAk\xb6\x8c\xdbt\x10\
+<\xa7\xcb\x9f0\xd2\xea\x81r\xe5\xb0\xa2\xc7\x1f\xb0\xbf\
+\x8b\x11]\x0a\x00\x9f#\x13eS\x0eG3\x22\xd8\x02\
+\xf1\x0cF\xfb\xec\xaf\x80\xf1\x1f(z\xec\x1142l\
+4\xb98'\xbcT\x00w\xe7\xcd\xfb\xa5D\xe6oV\
+\xbd\x82\xe4V\x85\xca\xfeK\x18\xff\x88\x06B\xc3B9\
+\xdf;\x00\x7f\x14\x13\xa53r4q\x83s\xb6\xc9E\
+\x9ar\xbe\xb8u\xf9/u\xb1Yp\xa9\x1d\xf0\x01\x1c\
+)\x0f\xa9z\xfa\xb8\xdd\xc4E\x07\xfdD\xe4\x85\xb0\xf4\
+\xff\x1b\x00\x1fD\xbe\xf4!\xca\xfcfL\xd0o\xdf\xbe\
+'\x1d(V&\xe5pl\xd9\x07\x96dxn\xc7v\
+\xbc^\xfb1\xa6\xd3?\x9dv\xdd\xf7\x99\xe5\x0b}\xe7\
+\xa2\xe2x\xad\x11\x08M+1c\xd8C\xad\x0b3J\
+P-\xb9\xd6:\x86\xdf\x9d\x08\xa42c\xdd\x06\xfe\xbb\
+!VN49t\xbc\xcb\x03\xd0_\x9c9@ip\
+\x9f\xd8\x110\x82?I\x90\xf4\xad\x18dH\xef\xd5W\
+\xee\x03\x1e\xaa\x7fmN\x22\xf1\xee\xc0\xb7F&\x02\x97\
+\x08;\xf4\x0d\xad\x22\xad\x9f\x80\xf6\xd9\x9e\x00\x00\x00\x00\
+IEND\xaeB`\x82\x89PNG\x0d\x0a\x1a\x0a\
+\x00\x00\x00\x0dIHDR\x00\x00\x000\x00\x00\x000\
+\x08\x06\x00\x00\x00W\x02\xf9\x87\x00\x00\x0a\x9bIDA\
+ThC\xcdZ\x0blS\xd7\x19>\xe7>\xfc~\xc5\
+\xf13\xac\x82\xb2j M\xdb\x84\xd4U\xad4\xb4\xb5\
+q\x08\x05F;R;\xe9\x9eb\xad\x90\xd6\x8a\x8e\x82\
+\xb6\x82\xba\x89nC\xd5`]Y\x1fB\xea\x98\xd0\xca\
+T\x918\x19\x14\xba\x02I\x9cE\x9bZ\xb4\xae\xd5V\
+\xedQ\x18\x14J\x11%\xbe\x8e\x9d\xf8\xfd\xb8\xbe\xf7\xdc\
+\xfd\xe7\xdaN\xec$&f8,G\x88\xc4\xd7\xf7\xfe\
+\xe7\xff\xce\xff\xfa\xfe\xff\x06\xa3:k\xcd\x91\xd8m2\
+[\xf03\x0a^C\x14\xbc\x121\x8a\x0b)X\x8f0\
+V0BIEA\x97\x11\x92\xdf\xe5X\xf6\xf4\xd2e\
+\xae\x13\xbf\xbe\x13\x17\xeb\xc9Z\xc8\xeb\xa0K\xed\xf2\x07\
+S\xce\xb8\x92\xd9\x0b\x8a~\x9b\xd1\x99XE\x96\x10\x91\
+\x8b\x88\xfeD\xa05]\x98a\x11f9\xc4p<\xa2\
+W\xe4\x5cV\xe00\xbb\xfft\xa0\xf5\x17\x18c\xb2\x90\
+\x0a\xcf\x94]\x03\xa0\xf3\xf5\xa8\x8f\xe4\xe5A\x8d\xc3\xc5\
+\x88\xc98\x22\xc5\xc2\x94\xd2s+\x85\x01\x0c\x83X\x9d\
+\x01i\xedF\x94\xbb*\xbc<\xdc\xe3\xd9\xfa\x7f\x01\xb0\
+!8vWQo}\x87\x9en151K\x07\xaa\
+(h[\xba\xae\x10\xf8G\xcf\xbed\x11\xbax\xb3\x1d\
+I\xa9\x89\xf3\xa1\x1e\xef\x8a[\x0e`\xebIE{.\
+\x1d\xbe\xc6\x99\x1cv1=\xa1 BJ\x96a \x02\
+\xc0\x978\xa3\x15\xfegTW\x82\xcf\xaa\xfb\xc0\x0f$\
+\x8byD\x0a9\x00##\xce`Ar6\x03\x00\x5c\
+\xb7\x1e@G\xff\xd8\x0f\xb5v\xcf\xde\xdc\xb80}\xaa\
+Ty\xcc`\xce`E\xc5\xf4\xc4(\xe8{D\xc31\
+\xff\xc1HfE\x19-%\x84\xfd2@\xd8\xa0\xb1:\
+\x1d\x0a\x00\xa3\x88\xe4t\xe2\xc2p\x8f\xfb3\xb7\xdc\x02\
+\xed\xc1\xb1s\x9c\xde\xbaB\xca$\xa6\xf6\xa6\xaeDO\
+\x9e\xa4\x12O\x0c\xf5\xb8^\x9aK\xa9\xd1Q\x85\xdb+\
+D\x1f\x92\x91\xbc\xdb\xb8\xcc\xbd2s%\xf2\xfep\xc0\
+\xbd\xea\x96\x02x\xf0\x98\xf0\xe9T\x11]`\x18\x0e\x13\
+I\x9c\xf6iS\x0b\x9ch\xfc\x1d\x08\xca\xbb\x1bQ\xc8\
+w4\xb6\x99\x97\xd8\x8fO\x05l\x7fl\xe4\xfef\xdd\
+\x83\xdb\x83\xb1\xb5\x0c\xc7\x9c\xa2n\xa0\xc8rI.\xc6\
+\x08\x5c\x03\x89\xa9\xd8\xb3#~\xd7\xd3\xcd\xdal!\xe4\
+\xe0\xce\x81k]\x84\xd1\x0f(\x12\x00\x80`\x9c\x06\xe0\
+@\xc5\xc4\xf8\x81P\xb7\xf7\xf1\x85\xd8\xb8Y2K\x16\
+`\xf1)\x85H\xd3\x16\x00\xe9\xac\xd6\x80\x94B.\xa3\
+\xff\x14\xeb=\xf1%g\xaaY\x1b6[\x0e^3\x90\
+\x5c)\xcb\xd9\xb3\x0c\xcb\xa3\xea\x18\xa0)\x947\xb5`\
+9\x19;\xcb3\xe6\xfbN\x06L\xe1fo\xde\x0cy\
+XQ\x14\xc6\xd7\x17\xbe\x04y|\xa9\x94M\xd6\xca\x04\
+\x10\x1a\xb3\x1d\x8b\x89\x89\x22\xcb\xb3;\xacr\xeb\x81\xfe\
+\x00.\xfbY3\xb6\xbfy\x19j\xc1\xf2\x05\xc3Ok\
+[\xdd{\xf2\xd5u\xa0\x22\x1b@\xb0\x1a=\xd4\x033\
+*\xc6\xc3\xe3\x84\xe5\xf7\xdbe\xfe\x95\xfe\x80uv\xb9\
+\xbey}nX\x82\x0a`\xcb{\x8a\xe1\xe2\xa5\x88\xc0\
+\x1bm\xa6b&>]\x89\xab\xc5A%\xe6\xf4F\xe0\
+=FT\x88G$L\xc8A\x8dY\xd9{r}\xdb\
+\xc77\xbck\x13\x1f\x98\x22s\x9d\xfd\x91\xd5Xo\xf9\
+3e\x9c\xc5\x5crn\x10\xe5\x14\x0b\x16\x81\x22g\x01\
+\xce4\x09\xf4\x82\xbc\xb0\xda\xd9\xba\xf3\x99{q\xbe\x89\
+z5,\xaa\x86\x8d\xde\xdf\x1f\xb9_b\xd8\x93\xbc\xc9\
+\x8e\xc4\xc48P5@S\xe1Es\x88\xa4@x\xab\
+\x15\x15b\xe1\x18b\x0d\x1bB]\xd6\xbf4\xbcs\x93\
+n\x9c\xd5\x0f\xac\xffC|\xb9\x98)\xbc\xc6\xb7\xb8\xee\
+&b\x01\xd1\xc0\x9e\xaa\x0fu6\xd5X\x1d*\xb1c\
+\xc4\x8c\xef\xb4\xdf3R\xb9\xcd\x1fT\xd88\x89>J\
+0Y\x8e\x09\x16\x11\x90YFAXa\xe5$\xf4\x0f\
+\xc3\xa7\x1er\xfd\xbdQ\x1c\xb4O\x99D\x99-@\x84\
+o\x07),<\x97\xe0944\x0b@E`{0\
+\xd2\xcd e\x0fou\xdeA\xa0\x99\xa1<Imj\
+\xe6Z4\xe5\x1a\xacX\xceg\x90\x8e\x18\x96\xbf\x11\xd0\
+\x7fDok\xef\x0b\x9f0\xb6\xb9\xbf*e\xc1\x96\xa4\
+\xdc\xe7\xc0\x8e\x94g\xd1\xcf$\x11\xd99\xd8\xed\xdd\xdb\
+\x08\x88\xce\xde\xb1_\xea\x96z\xb6\x17\x13\xd4/\x88\xda\
+\x87H\xd9\x14%\xc5\xd7_\x1d\xc1\xe8\xd7\x08\x92v\xf2\
+\xc6\x96\xbb\xd4^!=I\x05\xccv-\x00\xa1mq\
+\xe1\xe2d\xf8O\xc3\x01\xefW 1\xf0\x1f}\x18\xc9\
+3z##\xe5\xd3\xb36\xa1\xc9\x80\xd3\x9b\x90\x18\x9f\
+\x5c\x1d\x0a\xd8\xdf\x9aO\x8f5\xfd\xe1\x178\x8b\xeb\x09\
+H \xa56\x84\x1e\x04$\x96y\x01T\x04\xd3 '\
+\xb2\xb2\x9b\xb3\xb4\xb4\x93\xa2\x88\xa4Bf\x16\x08\x0c-\
+&\xa77#M&\xb9\xf2\xb8\xdfq\xde\xd7\x1f\xce\xb0\
+\xbc^/C\xcf0kUjL*\xfa\xc1H\xc0\xfb\
+\xd9\xf9\x00\xb4\xf7\x09\xcfi,\xad;\xc4dt\xaaK\
+d\x10Sn\x5c\xe6{\xba\xea\xfb\xb5\x03\x91u2\x91\
+\x8f\xb2\x06\x9b\xb6\x98\x9d\x99\xad0\xb4\x96n$%\x84\
+\x1f\x0f\xf9={\xda\x83B\x8a\xe5u&\xb9\x90\x9ds\
+\x07jQ\x8d\x0dHcb\xac+\xe4o;z=5\
+\x9a\x06\x80nB\x03=\x9f.\x9cc\xb5Z~\xe6\xe9\
+\xc2)!1\x1d\x1b\x80S\xf5w\xf4\x0a\x09\xac\xd5Y\
+j\x01P\xa3W\xb5\xa2&\x1b\xf8r\xfcJ(\xe0]\
+z}\x00c`\x01\xe7\xcd[\xa0\xb2\xc9\x9a\xde\xc8V\
+\xd6j\x7f\xb1\x98\x8c\xa9AUY\xc0\x9fh\xc0\x87B\
+\xdd\xee\x0e_P\x883\xbc\xceZ\x0d\x80\xe150,\
+\xa0\x1d\x5c\x19\x04\xf8\xb1\xce\xeeB\x85\x09aK\xa8\xdb\
+s\xb0\x1e\x88\xf6\xbe&\x03\xd8x<\xb2\xaa\x80\x8d\x7f\
+\xa3\x16(\xb5\x94\xa5E\x9b{\x18\x0a\x9c\x1a\xe9\xf1\xae\
+\xab\x01\x00=\x064\xa9\x90{\x94+\x98e\x97Ug\
+4\xdaOC\xa0\xc7\xed\xc8\xe5\xa8\xc7\xb5\x9a\x0e\xc07\
+ trz\xdbi5\xbdV\xfa\x08\x00@k\x82\x98\
+\x98\xfc\xedH\x8fk3\xc4@\x12b\xc0L-@\xd3\
+\x1e\x06\xc6\x8b\xa5\xe2O \xf2\xb6\xc1\xefVulC\
+\x17\x80\xd3\xb5\xba\x918\x19~j\xd8\xef\xdd7\x97\x15\
+\xea\x02h\xef\x8f\xec\x82j\xdb\xc1\xeb4\xdbN?`\
+\xffG\xa3\xf1\xec\xeb\x15^\xe3\xad\xf6\xaf\x8b\x89X\x95\
+;@\x10\xdb@\x91Dx+\xf8\xf4\xcb\x1d\xbd\xe14\
+\xd6\xea\x8d*\x00\xca\xa5\xcc-\x90\x86\xe3=\x88\xa0{\
+4\xb6\xd6\xef\x8b4%\x96\x17M\xab\xb2\x98\x93\xda\xac\
+.\xdb\xef:qf\xa6\x1eu\x83\x18\x0a\xd6U\xbd\xc3\
+\xb9DLA\xae\x16\xd3\xaf\xea\x15\xd3\xbe\xe3\x01\xf3\x07\
+\xd7\x03\xd2\xd9\x1b~\x14\x9b\xac\x07\xa5\x5c\xba\xa6\xb81\
+\x9c\x061Z=2\x8a\xe8\xb6\xa3]\x86\xab\x1d\xc1\xb1\
+\x0c\xe6\x0d\x065\x06\xcamj1\x19}\xac\x05\xb9\x06\
+\x92\xfa\x5c\x84\xc0u\x02\x9d`e\xe9Z=(?\x11\
+\xdd7\xd2\xed|\xaaq\x00\xbdB\x18\xa6'n:\xeb\
+\x016\x8a\xa4\x5c\x12\xc9\x85\xc2\x19\x86%\xc75\x0cz\
+W\x83\x8d\x9f\xa4$)\x0fM\xbf\x81\x91\xb3\xab$\x84\
+\xbf\x0b~\xee\xa3\x14\x83\x10\xa9f\x86\xa4\xb5\xb9pa\
+R\x18\x1d\xe9\xf6\xdc\xf7\xcc\xa8\xa2{{<\x1c\x9b\x09\
+\x80$'v\x0f\x06\x9c?\xed\xe8\x1b;\xcdY]\x9d\
+5V\x00\xf0\x14\x90\xd3\xa1u\x1e\xb9\xd7\x02\x09\x7fz\
+\xd5\xb5\x00\x9cRD\xc1\xac\xb3\xd2\xd0\xd3Sd\x816\
+S\x7f\xa5>J\x80\xe3P\x1f\xa7\x00\xa9\x99)\xbfS\
+\xfd\xbe\x9a\xe8AQ\xe2\xb4\x06Z\x1b\x91$\x93\x15#\
+\x9b,\xe7\xbfqR\xb1D\xd2\xe1\xb1Y\x16\x88\x0b?\
+\x0f\xf5\xb4\xed\xda\xd0+|A2\xdb\xde\x97r)D\
+\xfb\xf1\xca\x82\xf9\x14\xb8\xa0p(\xe4\xf7<\xd2\x10\x00\
+\xf0\xe5\x8b\x8cN\xbf\x1c\xfc\xaf\xb6\xb2\x82\xc9\xd5!.\
+\x1d'\xc2\xefT_\x0ad\x16\xb1++\xcf\x19L0\
+Z\x8c|gp\x93\xfb0\xddx\xe3[\xe3\xe6\xdc5\
+)\x5c\x0b\x00H_j\xfc\xb9!\xbf\xf7\x07\xf4\x1e\xb0\
+\xc2\x9b\xbc\xcd\xbd\x0e\xac6\xa5+\xc3k\xd5\xc32\xe4\
+2\xb7\xbf\xfe\xb0\xf7r\xe5\x8b\xba\x16\xf0\xf5\x86\xb7\xf1\
+V\xc7~\xaa\xd8\xcc\x8c2_@\xd3\x8dh\xe1\x92\xf3\
+Y\xa4\xe4\xb3\x8f\x0cu\xbb\x0eU\x9e\x99\x13\x80\x05&\
+\x1d\xe9\xd8\xfe\x90\xdf\xbd]\x05\x19L\xdcQ\xd0\xb1\x17\
+(5\x99\xcaHp]\xdb\xe2A\x85D\xe4\xd8H\xc0\
+\xbdi^\x00\xf4\x86\xce\x01\xa1K\x22\xe8\x05\x8d\xc5\xb1\
+\x84~\xa6nC\x05\xaa\xa7]\x1e\xa9\xab\x82\xcaV\xa1\
+\xa7\xc4\x82\xbf\xd2\x5c.&'\xcfp\x06\xb2ep\xa3\
+\xf7\xdf\xd5\x80\xeb\x02\x88\x03\x80\x87K\x00T+\xf4\x8e\
+\x1d\xe6\xed\x9eo\x15&\xa6g\x06\xaa\x1b\x83\xbb\xb2\xe9\
+\xec\xe7\xde\xec\xb1\xff\x8b\xde\xd7\x10\x95\xf0\x05'\xd6+\
+L\xb1\x07Id5\xb8\xceR\x16\xd8\x22=e\x98\xf9\
+\x03\x0ep!P\x98Rf\x00\x06m$;\xca\xf0\xca\
+o\x86\xbb\xdco\xcfe\xa9z\x00H*\xf6\xfc`\xc0\
+\xbd\xa3\xf2\xcc\xba`\xdaSd\xc51z8\xf4\xe0*\
+Kcs\x01\xa7\x8a\x0c\x0ew{\xd7\xaa\x87\x0ct\x9a\
+\xb1:\xb77L\xe6:\x7f\x9f\xf1Jr~\x19\xc2\xa4\
+\x15Dk\x14hWX\x89L\xe8\x0c\xcc\xe5\x13\x0f8\
+\xaf\xcd\xe7^\x8d\x02\xa0r|\xfd\xc2\xf3\x90\xc1\x9e\xcc\
+\xc7\xa6\xadPa\xb6Rf\xf2\xf3\xa1\x80\xe7\x9f\x0dY\
+`>\xa5n\xe4\xfb\x1b\x01\xa0\xde{\x95\xc4\xb1N\xcf\
+P\x0b\xcf\xb0\xc2I\xb0\xc2\xfa5}\xe1gY\x8bc\
+W\xc3\x16\xb8\x11eo\xc6\x85*\xcfB\xc3\xf2#\xbe\
+\xc5\xfd\xb3|tz\xc4\xaf\x16F\x8d\x0e\xd9\xcd\xb2s\
+\x5c\xc8~\x93\xb79\xf7\xd3^\xbd\x12\x97\xffS?\xd0\
+(\xb0\x1b\xb1\x00\x95I;\xb8\x8b\x97\x84\x18\xa75\x99\
+im\xa8\xb6\x02\xcch_by\xfc\x1e\xa3kyU\
+\x84I\x08}CD\xd7\xa2\x02\xa0\xc6BP\xf8\x9e\xd6\
+\xee:\x90\x8f\x81\x15\xca\xd9\x8fZ\x01*~\x1a\xde\x8d\
+\x1e\x86\xb8xL\x1d\x7f.V\x00\xa5\xb4*|\xc2\x1a\
+-m\xd5\xb3)5\x13*\x92H\x10\x03\xf4`\xba\x8b\
+\x5ct\x16P\x01\xf4G\xfc0\x09\x09R\x8e45\xc9\
+\x80\xeb\x14\xc4\xcc\xa9\xc8\xa2\x04P\xb2\xc2\xd8Y\xd6l\
+_Yw\xccY\x0e\x90E\x0b\x80\xbe\xaff\xf5\xf6a\
+1\x11\xbd\xeePm\xd1\x02(\x07\xf4\x19\xde\xdcz\x8f\
+\x9a6\xeb\xacE\x0d\xa0\xbd7\xfaE\x8d\xd5\xf6Wp\
+\xa3\x1a\xba]\x83E}\x8f\xbd@\x8b\xf6\x03\xe1t8\
+<5\xd8R;2\xa0\xd3\x89\xc8\xaf\x86\xba\xdb\x9el\
+d[\xa0\x0f\xc7\xf4\x0e\xd7\x83\xb9\xf1\xb9_\x0eQ\xba\
+\xb1`\x00*\xf4\x801\xc0h\x11ZO\xdaWh[\
+a\x885\xde\xf8\xdfS\xc0p\xd8\x1eG\xc2Y\xce\xec\
+p\xa9T_\xcd\xff%\x95)\x1b\x96\xb3\xc9\xf3\x0b\x06\
+\x80\xbe\xba\xea\x1c\x08\x1f\x82z\xe4\x87m\xd5}\x18\x82\
+\xa2,\x8b7WO\xb0\xe7\xb3\x84\xff\x8d\xe8\x92x\x9e\
+\xbc\xa8(\xf2\x9d\xf0w0X\x81\x893\x10K\x0d\x10\
+\xcc\x0f9\xad\xf6\xf1\xff\x02o\x03;\xa7\xb4\x00\x07\xaa\
+\x00\x00\x00\x00IEND\xaeB`\x82\x89PNG\
+\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00@\
+\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\x00\x00\x0e\
+\x18IDATx^\xdd[\x0bp\x5cU\x19>\xe7\
+\xdc{\xf7\xfd~\xa7E\x05\x85\x8a\x08(\x8f\x11ap\
+ $iZ\xa8TZ\xb2IA\x14\x86\x8e\xe3\x08\x88\
+0\xa8\xc0\xa00 \x888\x80\x8f\xa2\x8e\xbc\xea\x08$\
+\xd9m\x0b-PH\x93P\x04\x05\xc5\x02\x8e8(\x8f\
+\x16P\xe8\xbe\xb2\xd9\xec#\x9b\xdd\xfb:\xfe\xe7\xe6A\
+\x9a\xbd\x9b\xddM I{\xa7\x99Ls\xcf=\xe7\xff\
+\xbf\xfb\x9f\xff\xfc\xff\xf7\xff\x17\xa3:\xae\x8e\xc8\xd0\xf2\
+,U\xdb\x15B\x9b\x91\xaa\x1e\x83(YN\x88\xeaV\
+)6 \x8c)LQ \x08%\x10U\xdf$\x08\xff\
+\x85\xaa\xf8\xd9]\x1b\x82/\xd41\xf5\xa2\x0f\xc1\xb3I\
+\xb0\xaa;v\xa6\xcc\xe1k0\xa2m\xd8h3 J\
+\x11Ud\xd0\x93\xfd\xa8\x88\xfd\x9f]\x18\x83\xda\x1c\x07\
+?\x02\xc2\x84C\xaa\x5cF\xaa$\xbe\x87\x09\xee6 \
+\xdb/w\x86m\xf1E\xd7\xb4\x8a\x00\xba\x00l\xd8^\
+\x08\xa6\xca\xf9\xcd\x82\xdd\xbf\x8a='\x8f\xe5\x11\x95\xc5\
+q\xa5k]\x18k pF3\xe2\xccV$\xe52\
+\x08\xcb\xe2\xd5\xbb:Cw\xd7zt1\xeeW\x00\xd0\
+\xda\x13\xff2&\xf4O\x06w\xc8P\x1eI\xc3\x1b\x97\
+\xe6%\x17ou\x22\xce`F\xb4\x94:\xf1\xa9\xb5\x81\
+W\xe75\xd9\xc7\xf0\xf0\x01\x00\xb4n\xdb\xff9L\x8d\
+\xaf\xf3f;\x12\x0b\x19\x0a\xfb}\xd6-R\x97<\xb0\
+=\x8c\xae\x00\x12\xb3\xf1+\x06\xc2M\x9b\xeazf\x01\
+\x07M)x\xc5N\xd0\xbc\x90|\xd7`\xf7\x86\xc4|\
+zV\xe5\x99\x89c\x8e\xd7L\x1d\x1c\x81\xb65\xa8\xaa\
+h?\x93~aJ\x07\x00\xc0\xe0\xf0\x22\xb9\x90\xfaa\
+\x7fG\xd3\x1d\x0b\xa8[]KM\x01\xd0\x1aM\xdce\
+\xf2\x06\xae\x1aKV\xf1W\x84P\xd8\xdd\x98\x994\xbb\
+\xa4B\x06\x11L\x8b\xa0;x@l\x12\xe0\xef\xcc\x09\
+2\x07\xa8\x94\x8a\x9a\xb3\x9c\xf0\x90\x00\x80\x0f\x95GR\
+\xd7>\xb3\xa1\xe9guI\xb5\x80\x834\x00:\x9e\xa6\
+\x9eL~(Mx\x01)\xe5\xb1\xca\xe5Ay\xc2\xf1\
+xbk\xf4\xc3\xd9\xf7{\x09\xf1/\xb9\x91;\x05\x83\
+\xb9\x0c\xcax\x08\xa2\x9f\xa5XiA\x0a]\xc7\xd9\x1c\
+G10\xe4\xd1\x11\xa4\x02\x10\x0c\x80%m\x01m\xbd\
+\xb1\xcb\x04whS9\x93\xa84av\xcc\x81\xb93\
+\xe5Q1\xb7\xf1\xe9p\xe0\xfeZ/hu$u\x86\
+\xa4*\xd7pV\xc7\x1av\x1a\x10\x01\xa1r*~I\
+\x7f\xb8is\xadg\x17\xfa\xbef\x01-=\xb1\x9d\x82\
+\xc3\xbbZ\xca\xa5u\xd6\xc7\xc8\xe0\xf4\x81\x13\x1b\xba\x7f\
+\xb0+\xb4\xb1\x11\x01\xcf~l\xe8\x94rI\xb9\x0b\xac\
+\xe3\x0b\x94\x18\x8e\x19\x08{\xfe\xdb\xc8\xf3\x0b1\x16S\
+JIko|\x1fg\xb6}J\x19+T\xac\x89a\
+[\x10\xc1\x88\xd4\xb2t<(\xf0\xda\x5c\x84\x8250\
+\x5c\xe3Q\xd3\x12\xbbp\xcb6\x0a.:\xf9\x0e\xe1\x0d\
+vU,U\x88G\xe0\x0cW\xc5\xb2\xe4!\x82?\x1a\
+\xf6d\x97\x98\xfc\xf3\x16\x07\xaf\xdbZ<,\xafd\xdf\
+@\xbc\xc9\xa2\x0b\x80`\xd2<\xbb\xc3e\x0d>\xdan\
+O\xce{\xc5%6\x01\xde\xb0\x9d\x06\x93\xe5\xe4\xdb`\
+\x016=\x000!H\xb0{\x91\x92\x1b\xbetWg\
+\xe0\x81%&\xff\xbc\xc5\xc1,\x00\xfaO!\xfe?,\
+X\xfcJ\xb9\xa8;!g\xb2\x22*\x8e\x16\xcd.\xfe\
+\xa8\x1d+\xfd\xfb\xe7\xbd\xea\x12\x9a@;\x05\xda\x22\x89\
+W\x89\xd9\xfeEy\xb4\xca\x16\x878@\xb0\xb9\xb1\x5c\
+H\xa712\xb5\xf6\x87\xdd\xffXB:\xccK\x14\x0d\
+\x80\xd6\xde\xd8=\x06W\xf0;Z\x1cP\xedb X\
+\x9cX\x95\xc0Q\x96\xc5[\x9d\xc4\x7fk4\x8cu\xa2\
+\xa6y\xc9\xb3\xe0\x0fk\x00\xb0\xf3\x9a\x1a\x9c\x7f\x95 \
+r\x9b\x0aa\xf5Da\x11!o\xc0\x82\xcd\x85\xc4\x91\
+d\x16\x92\x81\xbb)W\xde4\xb8\xee0\xbd\x00b\xc1\
+\x95\x99\xcb\x82\x1f\xe6\x02\x91\xc4\x0b\x06\xa7\xff\xd4r6\
+U;\x0b\x84\x9c\x9f\x07\xbf\x00\xb1\x03\xc4\xf8I\x19\xab\
+\xe8\x01\x0b!w\xed\x08\xfb\xdf\x98\x8b\x10\x8b\xf9\xcc\x14\
+\x00\xab\xb7'O\xa0\x9c\xfd\x15`r\x90\x22\x95j\x83\
+\xc0\xa4\x06 X\xae\xcf[\x1cH.\xe6\x80\x05\x1a{\
+\xd2\x84\xf8\x9b\x9f\x08\xfb^ZL\xa5\x1aY\xfb\x80|\
+\xbf%\x92\xba\xda\xec\xf7\xddYN\x0f\x03\x15 \xd7\x07\
+\xc2\xc4j,Zd\x99\x22\x95%\x00c\xe4I\x0b2\
+\x7foG\xd8\xf9v#\xc2,\xc6\xd8\x0a\xc2ceo\
+\xfc6\x83?x\x9d\x98\xcb#E\x1ck\x08\x04\xa6\x00\
+\xcb(Y\xdc \x17\xb3H\x91\xc5\xeb\x07;\x02?]\
+\x0c\xc5\xea]S\x97\xf1i\x8f\xc4\xaf\xa4\x06\xcb/\xd8\
+\xf9\xcf\x12$\xa0<\x1a\x06\x823Z \x89r\xa0r\
+29\x08\x01T\xdb\x92\xcd\x05\xaa!\xd5\x1a\x89\x1f\x87\
+\x91\xfa\xa0\xe0j:\x89E\x88l\x8f\xd7E\x8aNN\
+8A\xa0\x18\xbd~TJ'^\xf2\xa0\xe0ipl\
+\x02e\xf4\xe1\xf5\xad=\xd4\xf2\xee\xde\xf8\x0fT\x8cO\
+F*\x96\x81q\xd1\x12&H\x9b\x80{a\xd43I\
+\x0b\x84\xef\x7f*\xec\xddR\xef\x1b\x9d9\xee\xa6\xdd\xd4\
+\xf4\xfcP\xea*B\x95v\xb8g\x03\x1b\x05\xda\x9a\xed\
+o\xf2\x81\xc0\x93\xfbkr~\xed=\x89o(D\xbd\
+\xc5\xe0\x0c}R\x95\xca\x13@\x1c\xa0\xc7\xec\xb2\x81\xa3\
+4\x07\x82\xa8\x9c\x88o\xeb\xefjZ?9\x18\x94\x17\
+\xde\xd9\x9bx\xc5\x14\x0a\x1e+\x17A\xd7\x09\x8a}\xf2\
+>\x13L\xa3\xddx\x8cJC\x89\xdd7\x04\x82+\x9b\
+\x9b\xf1\x04\xcdT?\x1c-\xbdC\xdf\xb4.\xf7n\x96\
+\x0a@\xdb1f\x1b \x06k\xd4\xe6f\x81_M\x00\
+&\x97b@\xa8H\xbd\x8ew\xf8\x8ef<\xa04\x0a\
+\x16Q'c\xcc\x163z|\xa8\x94\x1a\xfa\xfa`\x97\
+\xffa6\xe79\xdbS\xcd\xd4\xe2{F\xca\xa6!\xd9\
+\xaa\xce<\xb3g\xc11\xa3R\xfc@\x00\xeb\x85\xa0\xbd\
+7\xf5m\xe2\xf4\xfcV\xca\x0dUX\xb0\xc6m\xd6;\
+\xd1\xe4\xb8\xd5\xd1\xe4j\x89*\xd7\xf3\x16\xd7\xe9\x8c\xf6\
+b\xdc \xa5\xea\xec>B\x8b\x22\x1dX)\xe6b\xbb\
+:\x02\x87\xc1\x1bP[\xbb\xe3\x17\x08N\xef\xc3\xda\xf3\
+\x8cL\x9d\xe5b\xeb\x18]^T\xca\x0c\xaf\x1e\x0c{\
+\x9fnD\xe6\xf6\xad\xf1\x8d\xc4\xec\xbdW*\x0cW\x00\
+@\x10\x99;\xed\xdd\x12I\x9fJ\xa8x#o\xf7\xb6\
+3\xde\x0f\x8a'5\x98d`\x87\x81\x1e\xa7#\xc3\x1d\
+lO\xb7t';\x05\x87\xb3\x87\x99a-\x00\x10\x03\
+\xd0\xea\xc2J~\xe4\xad\xfe\xae\xe0\x8a%\x01\xc0\xa4\x10\
++#\xe96\x15\x89\xdd\x82#\xe0\x15sC\xb3\x82\x00\
+\x91&\x92\xb3\xc3\xd1\xfe\xae@\xb8}Kb=6\xbb\
+\xb6\xd4\x05\x00\xf3\x07\x90\x963\x00\xd5L\xe2\x82\xa7;\
+C\xdd\xf5\x82\xf0\xb1Y\xc0t\x01.~4\xe3z\xbf\
+\x5c\xfa\x9b\xe0\xf0\xad\x10\x0b\xc3UA`\x11\xa3Z,\
+ho\xb1=\x1a_\x8b-\xee\xc7\xea\x05\x80Y\x01\x10\
+\xb3X\x1d\xcb\xc7\xfa\xc3\xc1eK\x0a\x00&\x0c\xa3\xd6\
+\x87G\xe2\x1f\xc0\xf9o\xaa\xca+@l\x00\xd9dv\
+ \x1ct\xb5D\x87\xd7\x08\x16\xeb\xe3u\x03\xa0\x9d\x8f\
+\x90\x8c{\x82H\x1cN_\xde\xdf\xe9\xbb\xa7\x1e\x10\xc6\
+-\xc0\x03>\x80\xf9\x9a\x03k\x9b\xf3\xf2\x01z\x8b\xb7\
+\xf6&o\x11\x9c\x9e\x1b\x80A\xd6\xa5\xd7\xb5\x1a\xa1<\
+&\x02=nl\x8d\xc4\xce\xe1\xad\x9e'*\x00`\xf1\
+\x03\x94\x95\xd9\xfc\x15\xce\x95Y\x81\xd1\x0aVP\x18u\
+u\x06=Q\x8c\xc5Z ,\xc8\x16\x98~BP\x8b\
+sg\xb5\xb7\xcaj\x04T\x1a+\x02\x00\xd6\x95\xd1\xd4\
+\x1abqTX\x00;\xf6\xa8\xa2\x021\xa1:\xe1\x98\
+2U:H\xb0\x02o\x10\xc9\x99\xa1\x1b\xfb\xc2\xfe\x9b\
+\x97\x14\x00P^[\xc7[\xdd[\xe5\x02\xf0\x0a:G\
+\x1bK\x9fa{\xc4\x07\xc3\xc1\xa6U\x91\xf8\xb9\xc8\xea\
+\xde>\x13,\xce\xc4\xc6\x14\x9e\xc3\x14\xc7x\x9b\xb3S\
+\x82\xb9f^\x9c\xc9\x02\xd5\xe6\x92\x1ap\x04\xdc\x0f\x9f\
+\x8ds\xb3\x81P\xd7\x16`Nl\xf3y\xee\xca\x95j\
+\xc1;\xe3~Kt\xff\xad\x06{\xf0z1\x0b\x15\xb3\
+\x19\x91\x1d\x1b\x0a\xb4\x1aR\x8a\x99\x97\xc1\x02Nn\x8b\
+\x0c\x9d\xc7Y\xed\xdbf\x02\xc0*P\xe0\xe8\xf6@4\
+|\x051[_da\xb8\x1eIc\xf4\x86\x90<\x92\
+\xf8\xd5\xae\x8e\xd0\x95\xf3\x02\x00\xf6\xe2\xe5\xc4`\xf95\
+-\x17\xfbTA\xf9.\xb0;o6\xa8\xf7\xd4\xf0\x96\
+\x9eD\x9c7[\x82\xb2N\x81\x85\x0d2\xba\xc0\x81e\
+\x87~3\xd0\x19\xb8lu$}>\xb5\xda\xa2\xba\x16\
+ \x16\xde\x1f\x0c7}\x02d{\x9e\xb7zO\x97\xf2\
+\x95\x84\x131\x98\xb4u\xcd\x9c\xbc|\xc7\xda\xeaDm\
+M\x1f\xd0\x16\x89\xed\xe1\xac\x9e\x93X\x1a\xab\x99\x9b$\
+nr\x11\xfe\xf6h\xd8\xf7A#@\xb4\xf6&\x1e\x12\
+\x9c\xbe\x0b\x81*\xd3}\x8c\x85\x9d\x82\xdd\x03\xc7`\xea\
+\xac\xbe\xf5M\xbb\xc1a\x86\xc1\xc4{+\x00\x80\x93\x82\
+\x96K98*\x9d\xab\xba\xe3-\xc4\x13\x1c`\x16\xa5\
+\xb7\xa5\x8c\x9e\x10*g\x93\x0f\x0dv\x04/\xaa&k\
+M\x00Z{\x92o`\x9e\xac`\xf18C\x15\x22.\
+xK\xb0 R\xb6\x80+\xde\xecF\xa1gf#?\
+YG\x09\xd4\xc9\xef28\x03\xa7\x96G\xc0w\xb1\x12\
+\xd8\xcc\xc6\x8a\x89PX*\x8eho\x96\x09[\x1d\x00\
+30Rcc\x1e\x14\xb2\xb3\xec\xb1\xb5'\xb1\x97\xb7\
+9>\xad\xe7\x0b\x18\x09C\x04\x03\x12\xc4\xe2\x8a'\xce\
+\x0f\xbc\xa5\x07BM\x00\xda\x22\xf1}\x14\xf3GLO\
+l\x18\x10l/\xb2f(%\x9f\xcd\xc1\xe9\xf9/P\
+\xecu\x0e\xc9)\x15\xf39(\xf5\x09\x98(\x87c\x85\
+\x9e\x06t\xfa\xd1\xac~\xc8\xceY]\xe5\xd9\xf1\x0do\
+\x9f\xa5\xc5\xe5t\xe2\xc2\x81p\xe8\x91Z\x00\xc0IQ\
+6/\xe3\xfd;N\xf7\xe7W\xf5\xc67\x10w\xf0\x11\
+fYz\xe98\xdbV\x00\xfcS\x83]Mg\xcf\x1d\
+\x00\x02\x00\xe8ddL\xf0q\x94\x8dZ\x17\x18h\xc2\
+Ng\xa6\x12\xfc\x82\xdc\x90\xf1\x87\xd0OP++4\
+\xf9\xc0T\x87\x12\xcf\x0et\x85\x9a'\x85\xacj\x01\x13\
+\xb1\x82\xc1b\x0e=\xb9\xc6\x05\xa8\xb2\xeau\xfc\x1d\xc1\
+\xe6<\x5c*\xe6*\xac\x8b%J\x82\xd5\x81\xc4\xdc\xd8\
+\x97\x06\xbb\x9c\x7f\x9f\x09BM\x0bh\xed\x89\xbd\x02\x05\
+\xd0\x13\x80\xfe\x9a}\xcbC\x14v\xc0\xa5Q\x17\xb5\x0b\
+\xbeFw\x10I\x99D\xc6E,GF\xc3\xce\xe1Z\
+\x000\xebSeQ\xf6 \xcb\xb2h\xd8\xce\x1a0\x10\
+\xcb\x1b8G`\x8b8\xa2\xef\x0bX\xf9^\xca\x0f\xbf\
+\x08\x11\xe6i\x0d\x03\xb02\x1a\xfb9\xef\x0c]\xa3\xed\
+{\xc6J|\x14\x8dQ\x93l\x90\xc7\x8f\xc4\xa1xF\
+\xb0\xbbN\xd8y\x8e\xf9\xbd\xe9\xc2U\xb3\x00\xcd\xbb\x8b\
+\xa2*\x10\xeb\xf2\xe9\xfd\x85\xad\x91\xc4?y\x9b\xfb8\
+\xd8j:V\xc0\x8f;\xd8\xd1L[\xdfz\xdf\xc0\xf4\
+ujZ\xc0E}\xd4\xba\x7f$\xf1\xb8\xd9\x1fl\x96\
+\x0aE\xe8\xef)4F}\xcd\x80\x9c5Mr\x16;\
+\xf8\x10309\xf1\xe7=$\xb4\x1e\x9c\x99\xf6&\xe7\
+\x03\xc0\xeaH\xe6\x0c\xe4p<\x0bo\xba2.\x98H\
+\x97\xa5\xd1\xcc\xeb\x83\xe1\xd0\xe7\x1b\x02`rp[\xef\
+\xd0e*\x95n\x02\x93\xf51g\xc3\x12\x1a\xb6\xc7\xa1\
+\xc9\x87\x91\xa2\xba\x81\x8d\xe6\x0b\xd8?\xd6)\xca\x1b\x10\
+\x8b\xd0\xd8q*\x8e\xc4\xd3\x1c\x87\xaf\xed[\x1f\xba\xaf\
+\xda\xbej\xd4\x02\xc6}A\xec9H\xa9\xbf\xa2\x05Z\
+3\x81\x07\x7fep\xf9\x914\x92^\xd7\x1f\xf6=:\
+y\xbb\xa6\x05L\x9f\x87u\x8b\xc0\xa9p>\x10\x86\x1b\
+\x08Eg\x11\x8b\xd5A\xa0?\x80eaS-p\x1a\
+\xa9\xc6\x9eb\x1d\xa1\xe0\x14Ay\x16\xa9\x01Y\xa1R\
+\xa2\xbe\x00\xb7\xeewu\x84\xfe\x08\x89\xca\xac4\xcf\x5c\
+\x00\xd0\x8a7\xbc\xf3\x15\x05:W+h\xb4\x89\xda\xa5\
+T\xc8\xee\x1d\xec\x0a\x1e9'\x00\xa6\x83\xc1H\xcbw\
+\xf7\xc5\x8eWT\xee\x14\xd0r\x05\xcc\x7f\x84J\xa9\x1d\
+\xe8,@DU\xe0\x10\xc8C\x83X\x02q\x08\x1a\xa4\
+\xe9\xcb*'\xbd\xdcH\x8dp.\x000\xf9 .x\
+\xcc\xe0\xf6\xaf\xd5+\xe4N\x92&b&\xde9\xd0\xd9\
+\x14\xd1\x1c\xe8\xc7E\x89U3\xedz\xff>W\x00\xbe\
+\xda7vD\xb9$\xefc\xc76c\xa9g^\xacp\
++\x15rSV\xb0\xaa;y)v\xba\xee[\x10>\
+\xa0^\xe5\xb57Y%\x14\xaev\x0aL\x9f\xbb\xad7\
+\xfe\x80\xe0\x0e^R\x1e\xael\xea\x9c\xb2\x82lr\xfd\
+@Gp[[w\xecb\xde\xe9}\xf0\x90\x02\xe0\xbc\
+\xbe| \x9f/'\x08\xe1Y\xf9\xae\xd2\x0a\xec\x90u\
+\xe63\xff\x86:\xc41\x1a\xf7hqo\xd1K\xd1?\
+rFh\xa1,`\xdc\x17\xa4\xee0z}\xdf/\xa5\
+\xf5\xac\x00\x12/\xe8O\x16\xca\xe9\x13\x8bc\xaa\x91\xb7\
+\xbb_\xd4#i\x0ej\x00\xb4\xf8%\x93\xccp&\xb3\
+\xa0\x94Fu\xac\xc0\x0b\xd1a\xfa)\x8e\xf0?BF\
+\xd3\x1e=^\xe1\xa0\x06@\x8b\x0b\xa2\xc9\xebLn\xff\
+mP{\xac\x88S\x18\xb5\x06Q-\x94\x02\xc9MX\
+Q\x7fL98\xc7&\x1b\xb8'\xe0:\xe8\x01\xd8\xbd\
+\x9b\xf2?I%S\xbc\xc9\xe6\x92K\x05\xdd\x10\x19\x88\
+U\xf6=\x93\x19\x8epn&Ku\xd0\x03\xa0\x9d\xf3\
+=\xf1\x8d\xbc7xoi\x18\x88\x18\x08Nf^\xd0\
+\xd3\xc4\x92+]\xf7tH\x00\xa09\xc4H\xec=\xa8\
+U~R/]\x9e\xcd1\x1f2\x00|\x98.\xeb\x93\
+&\xd5@8d\x00`\x0aBp\xf4\x1ag\xf3\x1c\x0b\
+\x19a\xdd)\xfd!\x05\xc0\xaah\xeaLl\xf7\xec\xd6\
+M\x97\xab\x98\xc0!\x05\xc0\x84/x\x1e\xbeu<]\
+/]\xd6\xc3\xe0\x90\x03`ed\xffI\x9c\xcd\xb7G\
+\xebY\x9c\xa5\xebd\x12\x8cC\x0e\x00\xcd\x17\xf4\xc4\xb6\
+\x1a\xbc\xa1uz!r\x85\x15\xb0^\xa1F\xe2\xf7\x8f\
+r,\xa3\xbb\xb1\xdd\xfb\xc8\xcc\x16\x19\x8d\x14\x854\x97\
+\xe7\xed\xcb\xfa\xd6[c\x8d\xae\xd9\x11\xa1\xfea\x9aH\
+\x1a\x80#\x14u\xbf\x81\x1a\x9f\x911W\xaa\xacH\x8b\
+\x06\x00\xab\x0d\x1a<\xdemb\x0eZd\xe0\x8b\x94q\
+\xb6\x1dz\x90\x81Od\xa55\xbf\xcf\xe8\xefnv@\
+\x9d\xbd\xf1\xeb\x9c\xad\xa9fQR\x078\xbb\x8bh\xbd\
+\x0a\x93}\x01L[FhA\x98\xcc\x0a*r!{\
+\xfb\xa2\x01p\xee\x9fS\xf6\xe2\x07\xf2&\x0c\xdfl\xa9\
+\x04Y\x08|\x80\x09\x94\x1a\xb0\x1c(\x0d\x1fd\xfen\
+W\xe7\xb2y}l\xfd\xb5\x9d\x89\xcf\xe4\xf3\xe4Z\xf8\
+\xf4\xfbD\xb0s0\xab\xf1\x8f\xb6\x80\xbd\xe2(!\x12\
+\x87\xc9\x1f\xfa:\xfcw\xfe\x1f`\xcd\xa0\x9c\x8aQ\x0b\
+/\x00\x00\x00\x00IEND\xaeB`\x82\x89PN\
+G\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\
+`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\x00\x00\
+\x16\x10IDATx^\xed]\x09t\x1c\xc5\x99\xae\
+\xea\x9e\xee\x19\xcd=\xa3\xb9\x04\x84\xc3\x90@ ,I\
+0\x9b\x84\x98\x10\x22\xc9\x06\xdb\xd8\x18\xac\xc3\xe1a\x96\
+\xc7r,\x81\xb7&KX\xe2%o\x9d\x83GB \
+\xceK\x16X\xd8\x84GBbK#l\xc0'\xd6\x01\
+\x9b\x87\xc9\xf2\x88\x97\x05\x12\xb2\x815\x06\x02\x96\xe6\x90\
+F\x1a\xcdh4Ww\xef\xff\xd7h\x8c,K\x9a\xea\
+\xd1\x8cm\xc9\xaa\x17'\x01WWW\xfd_W\xd5\x7f\
+|\xff?\x94\xcc\xa0]\xb7G\xb3\x0c$\xfb.T\xf2\
+\xf4KyA\xf8\x0cQ\xe8\x02J\xd4\x00%\xd4\xa3\x0a\
+\xc4L4\xcd hT%\x82\x9aV\x09\x89\x11B{\
+\x05U\xfb@\x13\xc4\xd7\x0cTy\xc5\xa6\x05\xde\xech\
+\xa6\xf0\xefO\xdcF\xf5.}\xc3\x8b\x9a\xe9\x95Hx\
+\x95\xa2i\xab\x89@\x17i\xd4\xe0\x13$\x99\x0d\xa3\xa9\
+\x0a\xd1\x94<!\xaa\x0a\xb2\x07\x91\x17\x1b\x05H\x04\xb1\
+\xf0G4\x14\xfa\xe6s\xd0/\x1b\x83\xaeo\x19\x04\xba\
+E!\xf23\xdd\xcd\xee\xbf\xea\x9d\xcfl\xef\xcf\x0d\xc0\
+\xb5\xbb4{8\x11\xfd\x16\xa1\xda\x1d\x92\xdd\xe3  \
+l%;J\xd4\x5c\x16\x04\x0f\xc2\xd64\x14+\x9f<\
+\xa8\x00`\x08D0HD\x90L\xf0G&\xd9\x04l\
+\x045\xbf\x93\x10\xf9\x87\x00\xc4^\xbe\x81f\x7f/.\
+\x00\x1a\xdb\xa2\xb7\x10\xa2<$\xd5\xfa-J*I\x94\
+L\xaa \xf4J5\xd8!\x82A&\x06\x8b\x83\xed\x22\
+%1\xb0\xc7c\x0a\x5c\xbfy%\x0dW\xea\x15\xc7\xeb\
+8\xd3\x02\xf0w\xcf\x0c:?\xcce\x83&\xb7\xaf1\
+\x9fJ\x91\xfchb\xecK\xaf\xder(\xec\x0a\x93\xbb\
+\x96d\x22\xa1\x0f\x9d\xfe\xc0\xb9\x1d\x97\xd1d\xf5\xdev\
+\xecG\x9e\x12\x80\xab\x9e\x19<}$\x93{Y\xae\xf5\
+\x9e\x94\x19\x8c\xc2\xe1\x02g\x8c\xaar\xed\x98\x99.\x0b\
+\xef\x0ac\xad\x97d\x07B7t5\xd7=9\xd3\xf1\
+\x8e\xe7\xe7'\x15\xe8\xda\xadZ\xed\xc1|d\xbf\xd1\xe9\
+sfb\xa1c0\x7fJd\x87\x87d\xe3\xfd\xbf\xec\
+i\x0d\xfc\xfd1\x98\xc0Q{\xe5\xa4\x004\x06\xfb\xf6\
+I\xce\xc0\x85\xc7F\xf8\x85\xb5K\xf6Z\x92K\x0e<\
+\xdd\xd3\x5c\xd7t\xd4\xa4q\x0c^t\x04\x00\x8b\xdb#\
+\x1b%\x8fw]\xba\x1f\xee?\xa6\xd9\x94\xd3`\xd8\x89\
+#\xb3\xa1\xf8\xc7\x93l\x08@l{OK`E9\
+3\x98-\xcf\x1c&\xa6+\x9e\x8b|N\x13\xed\xaf\xa1\
+\x96\xa3*9\xddg>\x15%\x22\xcaFBA\xa3\xc1\
+s\x9c\x80v\xc3\x1a\xd8\x04\xa85\xa1\x8d\xa0\xe6Am\
+\x05\x1b\x00\xb5\x9d\xe9\x1a\x02\x90O\xc4vt\xb7\x06\xae\
+\x9c-\xc2,g\x9e\x87\x01\xd0\x10\xec{I\xb2{\x17\
+e\x87\x07\xf8\x85/\x80\xad\x0bM\xb2\xba\xc0\xae\xca\x10\
+ut\xa4\x97\x88\xf4\x15UU\xde3PaX\xd1\xa8\
+\xa4\x09\xc4%(\x8a\x8f\x10\xe1\xb3`!\x9f%Y\x5c\
+\xf0\x04(\xb6\xe9\x14Qr\xe9Iw\x9ads\x03\x00\
+\x83'\x0e\x00\x0d\xc1\xd0\xf9\x06\xb3\xe3M%=\x02_\
+)X\xa9<\x0d\x84/JF*\x9a,$\x17\x1f\xd8\
+!\x09\xc6\x07w7\xbb~7\xdd\xa3\x0d\xc1\xd8\xa9\x9a\
+A\xb9\x84\xe6\x955\x1a\xa1K\x8c\x0e\xafA\xc9\x8c\x12\
+e4y\x98\xf5\x5c\xb8\x03\x06\x9f\xe9i\xf6_\xcd3\
+\x95\xd9\xda\xe7\xd0\x0eh\xec\xe8{T\xb2\xfbo\xcd\x0c\
+r\xda>(|\x83\x11\x9e\x87\xcd\x92\xcf\x5c\xdb\xdd\x1c\
+\xd8\xa4W\x08\xab\xf6$|\xa9\xa1\xe4\x0d\xaaF\xbe!\
+\xb9\xfc\x9f@ \x8a\xb6\x06\xd3\x82\x86c\x8f\xf5\xb4\xf8\
+o\xd5;\xeel\xea\xcf\x00\xd04\x8d6\xb4\x87\x0f\x18\
+\xcc\xb6\xd3\xf3\xa9a\xae\xf9\xe3\x19\xcf\x8e\x89\xe1\xa1\xeb\
+\xbaZ<\xbf\xe1zh\x8aN\xf0~\xa11\x18\xbe\x91\
+R\xed>\xc9\x15\xf0\xaa\x99\x0c\x8cm$\xe9\xd0\xc0\xed\
+0\xf6\xc33\x19\xfbx\x7f\x96\x01\xb0\xfc\xe9\xc8'\xb3\
+\x82\xfc\x0e^\x8cxI\xf24\xc9\xe6\x22J2\xfer\
+W\x8b\x7f\x11O\x7f\x9e>\xe8\xe8\xdb\x1b\x8d\xae\x83\xdb\
+\xe1.\xaaj)\xab\xcb\xb6\xf0\x99%\xb6\x08\xcf\xb3\xb3\
+\xb5\x0f\x03`q0\xb2Z\xb08:\xf2#\xf1\x92\xda\
+\x09\xf6GG\x1a~\xfd\xb9\xa1\x81k\xbb\xd7\xe8?z\
+f\xab\xb0\xaa1\xef\x02\x00\x1d\xa1{E\x9b\xf7\xfb\xd9\
+x\x94K\xf7g\xeeg\xb0\x11\xc0^\xfdt\xe7j\xfb\
+_\xaa1\xb1\x13e\xcc\x02\x00\xed\xbd\x1bE\xbbo]\
+v\xb8\x9f\x0f\x00\xd9DH6\xabZ]\xe6\xba\xb9~\
+DT\xfbC`\x00\xa0\x06d\xb0xn\xcd&\x06\xf8\
+\x00\x90\x8c,\x0e\xe0\x16\x0c\xa7t4{\x0eV{\x92\
+sy|\x06@}{\xf8\xdfe\x9b\xeb\x16P\xfb\xe0\
+\x9fJ\xbb\x0bP\x03B\xdf=\x1d\x1d^\xb1{\xb5w\
+\xfb\x5c\x16P\xb5\xd7\xc6\x00h\xe8\x08\xffD\xb2\xd6\xde\
+\xc9{\x04\xe132\x18J`1\xef\xeei\xad[Z\
+\xedI\xce\xe5\xf1\xc7.\xe1^\xb8\x84\xfd\xdc\x970\xd3\
+\x84 \xb6k0\xdb\x09\x1dI6\xedn\xae}z.\
+\x0b\xa9\x9akc\x00,\xd9\x1a^KM\xae_\xe5\x93\
+\x83\xfc\xa1F\xe6\x860A,Q Z6\xb5\xa4\xab\
+\xc9\xdfY\xcd\x89\xce\xd5\xb1\x19\x00\xe8\x05U\x89\xf95\
+%\x9b\x06\x8f%\xa7\x1f\x08\x1f\x04\x10\x0cF\x0be\x06\
+\x5c.uGws\xdd\xbf\xcdUAUk]\x0c\x80\
+&M\x93\x87\xdaC!j\xb2\xb8\xd0\x19\xa7\xab\x8d9\
+\xe4\xf0R\xce\xc4C\xbb\x89hY\xd7s\xb5\xfd\x1d]\
+c\x9c\xc0\x9d?v\xc6\xb5\xf5\x05\x0dN_Sv\xa8\
+\x0c\xcb\x1f]\xd2\xe0\xfcG\x0ff~d\x88P5\xf7\
+\xb3\xbcfx\xe0\x85y\x15\xb5\xe4\xa7u\x08\x80+\x82\
+\x83\x97\x12\xab\xf5?s @F\xae*\xb3\x09`\xa4\
+I\xb8\x1b\x00H\xa0\xff<a\xd1,\x0f=\xd7l\xfb\
+s\x99\xc3\xcd\xf9\xc7\x0e\x0b\xc8\xd4\xb7\x85_\x96\x1d\xee\
+\x8b!\x18>\xc3\x85S\x88\x8c\x99\xc0V\xb0\xc3\x8e\x18\
+&Z.\xb5\x87R\xe3C\x9d\xcd\xb5]3\x1cx\xce\
+=>!\x22\x16[$;\x9c/\xe5\x12\x83\xc0@\xc9\
+\xf3G\xc5\xa6\x11\x0b\xfa\x8dP]\xc5\x90d.9\xf4\
+\x86@\xc4\x07\x9d\xb4v3pB\xa7\x8fI\xce9Q\
+O\xbe\xa0#\x82\xf2\x8d\xed\xa1'\xe4Z\xff\x0d,(\
+\xcfa\x15\xf3\xca\x89\xd9\x0d56\xc6\x80\xcb\x0dG\xfb\
+\xa8J\xefw\xb4x\x1f\xe9\xa0'6\x10G\x00\x80\xc1\
+\x99\xc6\xf6\xc8~\xd9\xed[\x00\xe7xEv\xc1x\x90\
+\xd0\x95-\x9a\xac\xf0\xc7L\x80\xf6\xd2\x0f\xc1\xe1\xf5\xdd\
+-\x81\xff\xe0\x05r\xae\xf5\x9b\x94\x17\xc4Xq\xb9\xf4\
+[\x06\x9b\xd7\x0c\x0e\xba\x8a\x83\xc0\x84\x087\xb4\xc1\x0c\
+@\x18\x11\x88\xc8\x9bB\x0d\xb9\xadk\xa5\xff\xe5\xb9&\
+\xe0R\xeb\x99\x92j\xb8\x22\x18?+E\xd2\xfbd\xa7\
+\xcf\xc1\xe2\xc4\x10/\xac85\x91\xa9\xaf\x84bp\x07\
+5\xaf|*\x0e\xcc\xe8\xc0\xb7KMz.\xfd\xfd\x94\
+\x00\xe0\x22Wt\x8e\x9c4\x1a\x1b\xee\x96k\x03\x9f\xce\
+\x0e\xc3\xc5\x5c\x06W\x88KX\x00\x84 JTv\xba\
+H\xba?\xf2\x86\x9b\xfa\xbev\xa2$nL\x0b@Q\
+x\xc8\x96\x13,\xf6u\xe8\x86\xce\x01\x8f\x1f>\xdb\xaa\
+\xec\x06\x18\x95\x02\x13\x1bI\xb9\x1f\x0a\x92\xfd\x0b{\xae\
+\xb1\xf4\xf1\x00x\xc7.\xcd\xf8\xe7\xf4A\xab;o\xd3\
+R\xe6\xc3\xe9|\xe6\x94\x83\x0e\x92Ae\x91\xd7\x95\xd9\
+p\x19\x05\x12\xd2\xd1k\xc8\xfa\x10\x12\xaa#'e\xac\
+yM\x90\xf3Y-\x0f\xa1\xacd\x9e\xd4\xc4w5[\
+\x19\xe9\x96\x0b\x00\xecxE0zi\x8e(?\x97\x9d\
+\xfe\xf3\x91P\x95\x07\x1e\x0f2\xde\xaa\xd1\x8c.?\xf0\
+\x8c\x22\x11\x8f\xd7|\xde\xe6\xcb\xecS\x1a%\xcbv\x0c\
+-\xc8&G\x7fH\x04R\x0f3\xa9\x11T\xaa\xaa\x02\
+\x1c\x95\xe3\x1a\xa4DQM\x10\xf2\x9a\xaa\xa5!Uj\
+\x80h\xe2\xefeZ\xb3qw\x15\x8d\xc3\xc6`\xff*\
+p\x8e\xdd\xa7\x0a\xc29\xcca\xc9\xa4\x8c\xff\x05S\x83\
+\xff`b\x0b(\x1f\x7f4\x10\xed^n\x00\x8ak\xaa\
+\xdf\x12\xbe\x8d\xe4\xd4\xef\x1a]\x01\x8f\x92\x19\x01B\xd5\
+\xc8\xe1\xe9H\x15B\xc4T\x1b \xe9X\xe4\x0d\xe0\x05\
+}v\xb2!W\x04\xa3g\x8fh\xca_L\x1e\x00+\
+\x09\x1f\xc3\xb4TG\xbci0#\xc7@\xd0Rg\x8c\
+\xbcT\xe2N\xa0=\xfe\xb4B\xd3=4\xcc\x9a\xe74\
+\x7f4\xdb\x1f2:\x81\xd7\x94\x18*\xa4k\x8dS\xe7\
+\x99\xc0\xe1$A2\x9b\x92\x1c\xc8\xe8\x06\x00\x9f\xbfy\
+\x9f&\x1d\xd8\x1f\xfe\x06\x15\xb4\xf5\x92\xc3\xefUs\x19\
+\xb8@\x13\x5c\x8c\x0a\xee\x05\x03w\x11\x85\x9b\x8eE\x1f\
+\xeei\xf2\xdd>\xf19`\xf2\xed0\xba\xfd\xcb\xd2\xfd\
+\xfa\xe9\xf3\xb8x\xc9f\x83\xfb&\xfa\x8f=-\xbe\x9f\
+q\xcf\x89\xa3\xe3U\xbb\x86\xceL&\xb3\xfb\xd1\xeeA\
+\xb9L\xdb0U\x8bc\xcc)\xbb\xe0\xd9\xfbN\xa2\xff\
+\x06\xd8\xf9\xffd\xb0\xb9\xcf\x02\x1b\x02\x80\x00\xd7\x03/\
+\xb5q\xba\x97\x8f]\xcch\xbc)\xc9\xa1\x85\x9d\xcd\xde\
+\xff.v\xc7\x0f\xe0\xdd\x03\x91\x08\xa8\xb0N\xa44\xea\
+n\xe8\xc1\x95MT0\x18a'\x8c~\xae\xab\xd9\xf5\
+\xba\xee1\xa6x\xe0\xca\xe0\xe8\x19iux?\x91e\
+A\x05\xf7\xfe\xb4K\xa4\x822#\x00\xc6\x0f^\xdf\x11\
+[\x0eL\xdbo\x1b,\xb6\x8b\xd1\xdaE\x8e\x11/\xc9\
+k\xbaI\x82\x1aL\xf2C\xfd=]\xad\xfe\x86b\xbf\
+\xa6\xa0\xe6\x1eR\xc3\x7f\xa5\xc6\x1a\x0b2\xb9\xcbj\x00\
+\x82l\xab\xa5\xf9\xe1\xfe?u\xb5\x04\xce/k\x8cI\
+\x1e\xba28\x04\x00d\x8e>\x00\xc5\xb9,\xd9\x1c\xb9\
+D\x11\x95\xf5\x82l\xbd\x5c4\xd6\x10\xe6]U\x95\xb2\
+\xb5&\xcc\x193\x80\xe5\x9cKf\xfe\xb6\xa7\xd5\xf1\x07\
+|O\xfd\xd6\x8f\xc0\xef-\xbd\x0f\x17\x9c\xb5l\x00`\
+\x1c\xb4\xcae\x17h]\x83\xe1\xb2\xb8\xad\x93\x81\xa6\x07\
+\x00\x08h\xe5+\xb6\x03&N\xe6\xf2M\xb1\xbf\xc9\x89\
+\xd9\x1f\x00m\x1d\xf8\xfd\x1a\xa8\xaf\x83,\x82V\x8e1\
+\x87ZQv8\xf2DwS\xe0F|\x0f\xee\x80\x18\
+\x89 \x00\xb6\x99\x00\x80ca \x09\x08\xc1\x07\x81\x85\
+}J%v\x81\x1e\x00\x84J\x1eASM\xfe\xf2\x8e\
+\xbe\xaf\xe6\x15\xf11H\xf6\xfbT\xb6\xccd?\xbc\x07\
+0\xef\xc0)\xf8NE/j%\x01@\xed\xc8\x88\xbb\
+`(r[w\xb3\xff\xd1\x99\x82p\xdc\x01\x80\x0bB\
+\xf6\xf3\xe2\xb6\xbe\xdfH\xee\xba5H}\x81,z]\
+;\x01\xef\x14T\xddj\xf2\xb9s\xb65{\xdf\xae(\
+\x00\x18\xd76Y\xa8\x9aJ\x0c\x9eqV\xc0\xff\xf8B\
+\xaa#(~$\x5cz\x00\xa8\xea\x114\xd9\x97\xf4\xb5\
+\xb6\xbeGj<\x81\x7fH\x0f\xe8\xcb?cD0\xb3\
+\x0d\x8e\x8a\xc1k\xba\x9bN\xda\xda\x14\x8c\xc3\x11\x94\xae\
+\xc8\x11\xc4\xe6\x09*/\x1es\x99xt=\xa8\xbc\xf7\
+\xcfd\x17\xe8\x01\xe0\xa8\x1cA\x13\x17\xd3\xd8\xde\xb7\xd3\
+`\xf7,\xd5\x13u\xa3pLHv`c\xc7\x07\x98\
+\xf1\x04\x16\xb0+\x9d\xca|P\x89;\xa08?f\x18\
+\xa5Gs\xeeZ\x9f\xb7\xa3\x91\xc6\xcb\x05\xe1\xb8\x07\x00\
+\x8e\x0foL\x8bD0RVJO>$\x04\xf8B\
+e\x87\x97(\xf1\xc8w;[\xea6T\x03\x00|\x97\
+\x11\xac\xef|\xac\xff\xa7\x9d-\xde;\x8f\x06\x00G\xfd\
+\x08*.\xaa\xa1-\xb4\x1d\x0c\xb7\xe59$\x03\xf3\xb4\
+1\x00\xb2\xf1\xd8\x03=-\xde\x7f^\xf6\xdb\x0f\x5ci\
+\xc9Tz\x07\xb0\x04B\x11\x5c\x87P\xc5\x85\xe5RM\
+\x9f\xe9/\xca5\xe0\xd1\xc8\x13\xd9c\xaa\xdbuY\xc1\
+Y\xa6\xb7\x1d\xf7;\x00\x17\xd4\x10\xec\xbfG\xb29\xef\
+\xe7\xe6\xa2\x96\xb9\x03Xy\x1c\xa2D\xa1`\x91\x07n\
+~\x00\xa24\xf1\xd8\xe8\x0e@\x80(\xfadO\xab\xef\
+\x06\xbd\xc2\xc7\xfe\xfa\x00\xa0\x95\xb3\x84\xf5L\x16\xf2\xd1\
+\xee\x02\x0e\xd1\x8f\x81\xdc\xcb\xe7Q\x85;\x00\xc9\xc0j\
+r\xf0\xae=M\xde\x87x\x8f \xb1\xc6\x0a\xe7\xfa\xc8\
+v\x10\xbc\xd3Pc\xbd\x84ypK4\x01\xa8\xf7\x08\
+\x9c)G>\xb9\xad\xd9\xb1\xbfT\xff\x89\x7f\xaf\x07\x80\
+cv\x04-\xee\xe8\xfb\xb1h\xf5\xdcU\x00\xa0\xf4W\
+Y\xd0\x82\x80Y\x91\x8a\xaf\xdd\xd3\xec\x7f\x8a\x17\x004\
+\xb2\x94\x91\xc4s\x06\xaa\xb5S\x9b{S\x16\x8dA\x0e\
+\x17\xba\xd1\xc94\xa2g\xc1\x13\xbb\xaa\x9a\x00\x08@H\
+\xa8\x9a%<\xdd\xc4A\x13z^\xb4\xba\x97`p\x87\
+\xa7\xb1\x0c|#\x10\xbe\xd2\x89/\xech\xae{\x95\xd7\
+\x0e@\x00@\xbf\x7f\xe5\x8c3}_9p \xd4'\
+\xc8\x96Z\x1e\xea%\x16\x92B\xe2\x80\xa0$.\xda\xb5\
+\xd2\xbb\x8fg\x8e\xc5>zv\xc0!\x00\xe0L\xbe\x1d\
+\x8c\xa3\x0b\x0c\x9a\xfc\xe8\x9eV\xe7kz^\xa8\xb7/\
+\x08\xcf\x1aS#1(i a`\x82\xa7\xa1\x0f\x9f\
+\xe4\xb3\x8a\xd3\xee\xf3u\x5cNcM\xcf\x83+b\xb8\
+\xb4+\x02m\x07\xf0\xfb\xbf\xd3\xddZwv}{\xf4\
+;\xe0\xa3\xff^!\x0f\xba\xf4\xaeC\xad+?<\xa0\
+;\x0bT\x0f\x00\xec\x08Z\x1c\x1ch\x14\xad\xb6N\xb1\
+F\x02\xbeN\x12\x8c\x9d\x91_\xda]\x96\xf5\xd5\xca\xfd\
+\xaa\xef\x88\xdc\x07^\xc8\xf5\xbc\x09\x81\x08\x10\x96AP\
+\x92\x83\xfb\xbaZ\xeb.\xc2\x7f\xe6\x06\x00\xee\x80|&\
+\xc5\xfc<M/\x02\xf0\x91p\x02\x19{\x98\x10^\xaa\
+\xa1?\x1f\xdfK\x12\xc9\xfa\xdd\xcd\xce\x17J\xf5/{\
+\x07,\xee\x08?N\x8d\xd6\x9b0\xa0\x82\xba9\xe6\xff\
+\x02\x1f\x08\xbct\xda\x86\x05\x0b\xfc\x1b\xc14/\xd3\xdf\
+{\xe4\x94\x97n\xe9\xfdJ^\xb4\xfe\x8e\x15\xed(\x15\
+\xac(>\x8eV*\x9c\xc9\xe9\xe1\xfe\x0d/4y\xbf\
+\xab\x07\x004\xae\xb4\xecH\xac\xb3)\xe0\x81\x10\xa0V\
+\xdf\x16\xfa\x05X\xbc7f\x0694LPa%\x8b\
+\x93\xe6\x12Co\xf6\xb4\xfa/\xa8\x1a\x00@\xc2z\x9e\
+\xca\xc6%\xe3\xbd\x8a8q\xdc\xbe\xb9\xa1P\x8c\xaa\xe2\
+\xa3&7}d\xdbbo/\xef$&\xeb\xd7\xd8\xd6\
+\xd7D\x0cr\x10A\x86\xaf\xb2\xa4N^\x1c\xa3\xa0\x95\
+\x80\xc3,G\x16lov\xbe\xa7\x0b\x00\xe0\x1c\x01/\
+5u\x8e5\xe0\xfe\xf9R\x9a\xc1`IF\xca\x1e(\
+\xe43\x94\x88V\xc1\x8b\xf0\xf2/\x94L\x88\x82\x0b\xc4\
+\xbf\x95g\xfd\xba\x8f 0\x8a^\x04\x00\xbez\x84U\
+\x0a_\x1e8\xa9X\xec\x124\x02T\xa2w\x81K\xe0\
+W>\x8bw\xcfo\x97R\xbez\x060c\x18\xff\x8b\
+\x9a@\xef\x86\xed\xbc\x0a\xdf\x01\xe7>\xb7\xf0q\xc1\x18\
+\x90\xc9\xc5\xfb\xbb\xbb[\xfc\x8dE\x01\xf0\x1eA\x18\x8f\
+\xd0r\xa3\x19'\x09\xb8\xc0\x8b\xca\xce\x1d\xf8\x10\xb6H\
+N\xff\xd5\x99!\xbe\x9a\x18\x92\xd5\x09\xf7H\xfc\xbd\xae\
+\xe6\xc0\x82J\x03\xc0.\xe1\x86`\xf8\xf7\xa0e|i\
+\xca/\x02+\x1a\xc2W\x88A\x11\xbc\xbc@uL\x83\
+\xea\xf4\xbf\xc0 y\x0db\xc2\xafKD\x0e\x01\xcb6\
+\x0e\x15Z\x873TReE5\xe7\x94\xcc\xc9D\xd0\
+\xbe\x0c\xb6\xcf\xa5\xa0\x7f\x9f\x87\x97(T>\xd1\xef\x05\
+\x85\xf7\xe2\x99-\xab\xc9\xcfo[\xe9\xfb\x1f\xdd\x00\x80\
+e\xab\xe5G\xb35'\x19<\xdb\x16y\xa1\xe2 \xa4\
+cm\x1b8\x8fh\xc6?\xe1zy\x22v\xe8\x87\xc2\
+\xa0\x0dD\xe5n\x81\xb0\xe8\xe3\xa5@\xd0\xb3\x03\x18\x00\
+\xf0E\xfc\x81H\xc6\x85\xbc[\x12\x8f\x10\x8c\xa5b\xa4\
+\x8a\x15g\x1d\xab\x17\xcaJ\xdc\xc0\xffg\xae\xe3\xb1B\
+\xad\xb8@d \xe8J{\x1a\xb7B\x93\x07\xac\xd2\x81\
+\xd0\xaf\xbb[\xea\xae\x1f\xbfp\xde\x1d\x80\xc0\xc3\x1c\xf2\
+&\xb3\xd1\xb7s\xb9\x13\x8c\x80Bkh\x0b?+9\
+=+\xb9\x92Q\x98\xbb\xda\x0a\xee\xeaa.w\xb5\x1e\
+\x00\x98\x16\xd4\x10\x8c\xbc\x04\xc2\x5c\xc4\xed\x18;$\x09\
+\xac\x86\x8bf\x04R>\xf0_\x0ac\xd4\x17\xf4\xba`\
+\x8d\xc5\x228\xa5\xbe\x99I\xfe\x1e\xe3\xb5V7\x85\xbc\
+\xe5\xf0I.\xdf\x99O-\xa1\x87\xe5M\xe9\x01\x80\xa9\
+\xaf\xc4W\x07G\x10\xd4a(\xb4\x95\xc1\xc4\xb9i#\
+}\x0b\xca\xec\xb0\x84\xf3\x92\x0d\x15\x01\xb7\x9f(\xfd\xa1\
+{\xf6\xac\xa9\xfb\xd1t\xfd\xf5\x00\xc0v@}\xb0w\
+\xab([W\xf1\x18(%'Z\x89\x0ec\x01\x12d\
+X\xc8\x99\x0c\x18^\x9eW'\x0e\xab\x07\x00\xd8\x01\x9a\
+A\xb4\x9e<\x91e\x07wS\x9b\xec\xf2\xb7piD\
+0\x014\xcc\x94t2\xed\xf6\x07\xbc\xd3\xd52\xd5\x0d\
+@C[\xf4\x01\xd1l\xfe\xd6\xd1(\xcaZ\x12\x9f\xb1\
+\xacK<\xde\xd4\xd1\xc4\xaa\xce\xd5\x9eg'{\x86\x1b\
+\x00VR!CD\x97|j\xe7\x92\xda\x0f\xc7\x8f\x85\
+\x95\xbb\xa8A\xf8\x809IK\xd0G\x0a\xcf\x15vA\
+.\x1e\xfdQW\x93\xef\x9e\xa9\xd6\xa2\x07\x801C,\
+z!pX\xf61\xca\x5c.\xadKC))P\x9d\
+\x1dd\xbb\x87\xd5\x90S\xb3\x09\x16\xf9\x9a\xeaq]\x00\
+\xc0=dS\xb53\x9e]S\xf7\xfe\xc4\xf1\x1a\xda#\
+\x0f\xcb.\xefm\xbc\xe59Q\xabR\xa0.\x9e\xddi\
+\xf6Oe\xa8\xea\x01\xe0cWDG\xf4_\x8d.\xcf\
+\x86\xfc(\x94\x0c\x83\x9c.\x1eS]\xa7l\xa7\xee\x8e\
+\x04,\xc1@!7\x0d\xe8!\xa1\xa8F\x8cW\x97*\
+\xde])\x00p\x9c\xa1\xa1H\x94\x1aM\x02/\xbb\x02\
+\xdd\xd5\xd9x\xf8\x10Cc\xe2\xc2\xca\x02\x00\x07\xa9o\
+\xef\xbf^\xa0\xb9GdW\xc0\x9c\x1bI\x10\x15\xcc\xf5\
+\xc3J\xd0WL\xe2\x1f\x0f\x84N6\xc9\x0a\x05\xbb1\
+7 9\xb8\xa9\xceUw\xf3\xc4\x0bw\xc6G\x10\xec\
+\x00\xa3\xd5q\xfa\xaee5p\xdc\x1c\xd9\x96l\xe9\xfb\
+\x9eh\x0b|'\x13\xe3\xf3\x11\x15\xdd\xd5\x06Y\x9et\
+L=\x00\x1c\xe1\x8e\xc6b\xdd\xbd\xd9\xcc\xdd\xc0'\xfe\
+&p>\x8d\xa8Z\xb2J\xe9X\xeb\xb3B\xd5\xd2Y\
+\xd9z(Y\x8f\xbezTO\x95\xc4\xe0>A\x14\xbf\
+\xb9\xa7\xc9\xf7\x12/\xc6zw\xc0t\x00\x00\xcd\xd1\xfc\
+\xde\xfepD\xa8\xb1Xx-t &\xc3n\x8dl\
+\xean\xf5_[\xb1\x1d0~\xa0\x15{\xa3\xb6\xd1\x8f\
+\xc8\xd7U\xa2\xae\x05z\xef\xc5\xe8\x19d\x97\x15\xa8l\
+\xac\xf0*\xe6\x11\x17UM|pbU\x5cV\xb0\x15\
+S\xb7\xf1\x7f\x80\x80\x0a\x8e-\xb4\x0f\xf0\xeb\xc1\x96O\
+D\xb3\xf0\xd7;\x88,\xfc\xa4\x9c\xb4\xa4J\x02\x80\xf3\
+\x01\x8dh\x9d\xb1\xd6\xbf1\x8d\xbb\x80#>\xc1v\x01\
+\xacIQ\xc9\xd9\x13\xab\x02\xe8\xd9\x01\x5c\xf1\x80\xa5\xc1\
+d@%\xa9eyM\xbb\x0c\xb6\xc1E\xf0\x05\x9f)\
+\x98\xac\x22\xfa\xcc\x0b6@1\xa4Pt\xf1\x8e\xfd\xf3\
+\xd8B \xab\x065\x1a\x056\xd0\xfb\xa2\xa8\xee\x05\xb2\
+~\x8f!\x97\xde\xb1\xf3\xda\xd3\x0e\x19F\xbc_~\xb1\
+_\xa5\x01`\xbc\xa5\x8ep\x9fPc\xf7\x816\xc8\xa5\
+\x88\xa0\x83\x10\xee\x82-`$\xae\x1e?\x7f=\xe4\xdc\
+\xb2\x22bWoI\x9d\x92\xcc&N\xa5\x229SS\
+\xe9\xd9*U\x5c*\xa15`\x93\x99\xd1\x00\x06\x9f\xd1\
+(\x08{D\xa4\x860@\x12\x82X\xd6\xdb\xa0A\xef\
+\xafde\xadJ\x03\x80\x02\x5c\x12\x0c_':}\xbf\
+F\xeb\x98\xe7\xb8e\xbb\x00\x7f\xeb \x93fd\xb1\x22\
+\x08\x15\xdf\x01z\xbf\xce\xa3\xd1\xbf\x1a\x00\x14\x8e\xa2\xbe\
+\xb7\x0dV\xd7\xa7\xd0o\xc5\xd3\x0ad\xae\xf0a\x15\xde\
+\x97\xee\x1c=-72\xfc.x~\xc5R\xf6\x05\xd7\
+\x11\xc43\x91\xa3\xdd\xa7j\x00\x04c\xcb$\xbbcG\
+\x0eb\xd5\xa5\x8a\x8b\xe3\x9a\x8bw\x81)\xab\x1d\x0a\xe0\
+/\xde<\xf0\x09\x85\xe6\xdf\x15dY*\x05@YG\
+\xd0\xd1\x16\xf6d\xef\xab\x16\x00\xf8.tN\x02so\
+a6\x19\xe3\xbb\x0b0\x9f-\x16\xdd\xdc\xb5\xc6\xffu\
+|\xbe)\xd8\x7f\xf2\x10\xc9\x1d\x80\xb2\x00\xb2Z*\xe4\
+ZMzz5\x81\xaa*\x00[\xc2_6\xd4\xb8\xf7\
+\xf2V\x8da\x9a\x1d\xdc|\x92\xd1\xc4\xec\x825\xcf%\
+\xfd\x91L\xe2=Q\xaa\xa9)\x19\xfa\x9c\x07`\xf2\xcf\
+\xa4>\x18\xee\x04\xb7H#\x97\xbb\x1a\x86@\xbb 3\
+\x14\xfd\x05\xe4\x9b\xddTP\xe1\xd5\x8f\xc0\xba\xb6\x97\xb4\
+\xaeg-\x00\x9c\x09\x1a\xf8u\xa2\xdd2\x9d!6\x19\
+\x04\xcb\xdab\x9f\xc9\x9b\x8d\x7fT\xd1/\xc5\xe1\xaef\
+\x94Fpm\xfb\xad>\x07F\x0b\xe1'`\x06\xa8l\
+q\x97\xf40\xcf\x030\xf5AY\xdf\x1e\xda\x0c?b\
+\xd4\xca[\xce\x1f}D\xf9X\xf4\xbe\xceV\xdf\xbdP\
+\x09\xbe\x97\x1a\xcdu%\x13\x08\xe7\x01\x98\x1a\x80\xa5;\
+{O\xcb\xa5M\xef\xe3\xf9^R\x9b\x81a\xb0\xe8\x88\
+\x96\x19\x1d\x09\xb8\xfc\xfe\xdex\xf8U\x83\xd1z.s\
+\xf1O\xd7\xe6\x01\x98^>\xecG-\x1c\x81[\xb9\xdc\
+\xd5x\x11c\xd1\x91\xf8\xc0=\x90!\x7f\x95`2\x7f\
+\xb1$\x17u\x1e\x80\xe9\x01\xa8\x87\xdfS#\xd9p?\
+\x8b\x03p\xa4\xc3\xb2x\xb8\x9a\x85\xd0'\x05>\x82\xe8\
++Y{o\x1e\x80\xd2\xca2\x04m\xbe/\xbb\xbd\xf7\
+2wu)G\xddXl\x83\xfd\xaa,\xcf/\x0f\xce\
+\x03P\x1a\x80\xc3\xdc\xd5\x1c\xf4\xf6\xd2#\x8e\xeb1\x0f\
+\x00\x9f\xb8\xd0]-\xbb\xfd\x1b\x99FTj\x17\xf0\x0d\
+Y\xe85\x0f\x00\x9f\xb4\xd0]\x0dGQ/\x94a\xf0\
+\xf3\xba\xab\xb9F\x9e\x07\x80KL\xac\x13\x86l\x8d\xee\
+\xda'\xb31pWs$yp\x8d<\x0f\x00\x97\x98\
+\x0eu\x02\x03\xeb\xffD\xb3\xe3\xac\x5c*\xce\xe5\xa8+\
+9\xfa<\x00%EtX\x87\xfa\x8e\xe8r\xd9\xe6\xde\
+\xce\xeb\xae.9\xfa\xac\x05\x803C\xa6\x5c_\xd0t\
+\x82+\xb8\xabk\x17\xb2\xfc\xb6\x99\xb6y\x00\xf4K\xb0\
+\x11\xdc\xd5\xa2\xc9\xb9\x97U\x08\xd3\xf3[\x0b\x93\xbdj\
+\x1e\x00\xfd\x00\xe0\x13\x90f\xdb%9<\x0d\xbc\xee\xea\
+)\xdf2\x0f@y\x00,\xdf\x1e\xbe /8^\xc7\
+\x82\x85<9\x06\xf3\x00L\xc3\x8c+\x0f\x02\xfc\xed\xb5\
+\xf0&\xc9\xe1[\xc3\xe5\xa8\x9b\xe2%\x82P\xc1\x9aq\
+\xe5.\xa4\x9c\xe7\xaa\x19\x92\xe4\x9d\x0f\x16e\x1d\x1eJ\
+\x85\xb1\x0898\xea\xcaRKg-\x00k\xa1f\xdc\
+A\x8e\x9aqE-\xc8&\x03;z\xd5\x91\xech^\
+aO\xd5\xaf\xa1=t\x93\xc9\xeb\x7f<\x13\x1b\x80:\
+ \xfa\xea\xe2\xb1\xb9)\xe9\x83\xc7$S~\xa6\x0bg\
+\xac\xe6\xe1H\x84\xca5\xe2ta?LQ\xc2LG\
+cV=\x94a9\xd3wO|\x1e\xd2\x9d\x1e3\xf9\
+}7g\xe3\x89B\xfe1\x87\x95\x8cnk\x96\x0e<\
+\xdc\xbf~V\x02P\xa0\x12\x86^\x95\x9c\x81\x0bYy\
+\xcc1\xae*s\x94!U\x12\x13\x0b\xd9\x0fF\xd81\
+X\xfe\xae[\xf0\x9d_\xcc\x92\xac4\x00L+\x0a\x86\
+\xfe\x05\x92\x167@.\x99\x81\xb1\xea\x18\x08\x93g\xe3\
+#\xa7\x14Y\xe1J\x22\xf6\x14$\x9e\xaf\x9d\x95\x00\xe0\
+\xa2\xd7l\x1f\xf6DG2wS\xaa^\x0ck\xf5\xa9\
+\x82Z\x03\xeeE\x03DD\xf2\x82*\x8cj\x82\x1a&\
+\xaa\xe1\xbfl.\xd3\x83\xd5\xca\xfa\x1f\x0f&f\xdc\x08\
+Z\xf6\x1aE\xa0\x9f\x17T\xd5\xadRA\x12\xb0j\xf1\
+XS\x81\xa3\x0cU\xadQ\xdeaH\xa7\xdbZ\xcc;\
+\xfe\x7f\x93\x9d\x06/.\x9e\x8a;\x00\x00\x00\x00IE\
+ND\xaeB`\x82\x89PNG\x0d\x0a\x1a\x0a\x00\x00\
+\x00\x0dIHDR\x00\x00\x00\x80\x00\x00\x00\x80\x08\x06\
+\x00\x00\x00\xc3>a\xcb\x00\x00\x1d\x86IDATx\
+^\xed]\x09x\x9ce\x9d\xff\xce\xb93w\xe6\x08\x97\
+\x85.\xc7\xc3*\x1eE\x0e\xa9\x0b$MJ(-W\
+\x92v]\x11\xf4\x91GqY\x0eA\x14/\x16\x11T\
+`q\x8b\x88\xab>+\x82\xd2d\xd2\x16Zhis\
+\x00+\xb2\xc8!.\x8a \xa8\x15\x0b43\x93\xc9d\
+2\xc9d\xae\xef\xd8\xff\xff\x9dL\x9b\x84\xa43\xdf\xfb\
+\xcdL\xd2f\xde\x87>\x05\xe6\xfb\xde\xf3\xf7\xfd\xdf\xf7\
+\xfd\x1f\xbf?\xcbT\xa9\xb4\x84\xe2G\x0bL\xee\x83\xaa\
+\xaa\x9e\xa40\xec\x09\x8c\xca\x1e\xa1rj\x10\x9a\xf3\xb3\
+\x0ace\x18\xd6\xac\xb0*\xc7\xa9\xf0_\x8c\x9af8\
+uRe\xd8\xb0\xaa\xa8\xef0,\xff.\xcf(\xaf\xf1\
+,\xff\xb2\xdb\xe6\xfd\xdd/\xdb\xd9d\x95\xba\xb9\xe4\xab\
+e+5\x03W\xbe\xa4\x8a{\xf7D\xce\x93\x15f\x95\
+\xc2*+9\x96=Iex\x03g0\xc1Z\xb3\x8c\
+*K\x8c\xaa\xc8\x0c\xa3(\x8c\xaa\xe2\x9a\xab\x07\x9a\x86\
+\xdfY\xf8\xc3p<\xc3\xc2\x1f\x8e\x17\xe0Y\x85\x91\xb3\
+\x93\xf0\xff\xb8\x09x\xfb\x0f\x8c\xc2\xff\x9a\xe5\xd8\xe7\x96\
+\x1d\xeb\xd9\xfd\xe3\x15,\xfcP/\x95\x98\x01\xdd\x00X\
+\x13\x1a9#\xa3J_`Xf\x8d`\xb1;X\xc1\
+\xc0(\xb94\xa3\xe4sd\xc1q!\x0b\x8b=m\xc1\
+\x0f\xda\xf3B\x97`\xb1\x0f\x00B4\x02\x94L\xa4\xce\
+\xfc\xe4\xd8\x04\xc7\xaa;A\xb2<8\xd0\x19\xdcQ\x89\
+IX\xcauP\x03\xa0mK\xacE\x96s\xdf\xe4\x8d\
+\xf6\xb38\xa3\x99\x913)X\xa0,\xf9\xd2\xabS@\
+Jp\x1c\xc3!\x18\xccVF\x95$F\x9a\x18}\x13\
+D\xc7]\x03]\x81\x9fT\xa7\xcd\xc3\xbfV\xcd\x00\xb8\
+pg\xe4\xb8\xf1\x94r\xafhv\x9d\x87\xe2Z\x9a\x1c\
+c\x14)_\xf3\x99ba\x9b\x10\xcc6\x06\xb7\x98l\
+<\xf2\x96\xc03\xd7\xee\xee\x08l\xabyG\x0e\xf1\x06\
+5\x01\xa0uK\xecjY\x926\x1a\x9d~&7>\
+\x02_a\xed\x17~\xf6|\xa3T\x10\xacN\x90\x0c\x06\
+F\x1a\x8b|\xbd\xaf#p\xdb!\xbe&5\xed~Y\
+\x00\xe8\x08\xa9|B\x09\x87DO\xe0b)5\x01\xe2\
+~\xa2\xa6\x9d,\xd9\x18\xdc%x\x83\x99\xc5s\x02?\
+\x91<\xed\xf1N\xef\x0b%\xdf\xa9?P8k\x95\x9a\
+\x87\x8e\xfe\xb8#\x1e\xcf>ir\x07>\x9cM\xc4\xf0\
+\x04\xaf\xc2I\xbe\xe4{\xa5\xea\xad\xc6\xefFw\x80\xc9\
+&\x86\xffs\xb0\xd3wm5\xea?\x1c\xeb<\xe8B\
+>\xf5\x94*\xdc\x16\x8d\xbed\xf2\xf8N\xc9\x8cD\xf0\
+:\xb7h\x17\x1f\x17G\xb49\x199\x95\xfcM\x7f\x97\
+\xff\x8c\xc3q\xb1\xaa1\xa6\x83\x02\xa0\xa5gh\xb3\xd1\
+\x13\xb8\x84,\xfe\xf4{{5zR\x81:\x05s\x03\
+#e\x93o\x0cv6\x9dX\x81\xea\x96D\x15\xf3\x02\
+\xa0\xad'|\xb3\xe0\xf1\x7f;\x1b\x1f\x86\x1b<\xac\xfe\
+\x22\x15\xfb\xd3W\x89\x87[\x81\x92\x9d\xd8\x0b\xfa\x81c\
+\x96\xc4\xeaU`\x90s\x02\xa0}\xdb\xf0\x0a\x99\xb3\xbe\
+\xa8\x82\xe2E\x96\xb2\x87\xc4\xe2\xe3\x5c\xf0&+#\xe7\
+\xd2\xe1\x81\x0e_\x13h\x16\xcb\xd5<U`\x1a\x0f\xdd\
+*\xe6\x04\xc0\xaa\xee\xa1\xd7\x04\xbb\xe7\xa4\xdc\xc4he\
+\x17\x1fU\xbe\x9c@\x14:\xa8\x1e&\xea_X&\x90\
+0\x85-\x06T\xc4\xaa\x0c\xdaCT\x15S\x14\x04\x80\
+\x94M\x87\xe1\x10X\x07@\x99\xf3\xf7\x1e\x00\xb4\x86\xa2\
+\x9f\x11\x9c\x8d?\xcd%\xa2\x055n\x05\x0a'\x88\x0c\
+o\xb42,\xdc\xd5\xe54\x5c#\xb3`\xfb\xe1X0\
+\x1b(9\x80\x02\x0f\xcd\x18P\xa9\xc4\xc2s\xb8\x8f#\
+$\x94\x5c\x86\xa8~\x15\x19t\x0de\x9e?\xea\x00\xd0\
+\xbeX3\x00\x00\xfau\xb6\xb57\x12\xe6\xccv\x9f\x94\
+\x1a\xd3^\xdb\xf47\xd0\xce\x07\x0a}r2\xcfL2\
+r>\xfd\x02\xa3\xa8\xbb\xc0\xea\xf7\x9c\xd1\xeaz\x9dU\
+\xb3\xc9#\x02\x8e\x89\xd1\x1c#d'b\xaeL\xd2h\
+\xe7\xd4T@\x92\xb8\x15\x0c\xab\xae\x00yp\x1ah\xf9\
+\xde'X\x1a\x08\x18\xd00TJ\xcd\x8c\x00Ps\xe9\
+\xa1\xbe\x0e\xdf\x11\xf5-\xa0\xbc\xe5\x9b\x01\x80\xd5\xa1\xf0\
+Z\xb6\xc1\xb3-?>Z\xb0\xdc\xd1\x96i\x8a\x99\xdc\
+\xc4\xc8f3#\xdeI\xa3\x9ci\xde2v*/\xa5\
+/\x92U\xb6S\xb0\xda\x8e\xe3\xc0\xd0$M\x8e\x13\x9b\
+\xc3\x5c\x05U\xc3R:\xf5\xd6\xe0\xfa\xc02\xda\xae/\
+\xb5\xf7f\x00\xa0\xa5g_\xbf\xd8\xe0m\xc9%G\xe8\
+\xe7\x01\x16_0YY)\x93RY\x95]?\xd0\xe5\
+\x0b\xd1Wv\xe0\xcd\x96\xcd\x916Fb>\xcfp\xec\
+:\xd1\xee\x01 $\x89d\x98^\x04\xab\x83\x91'\xc7\
+^\x1c\xe8\x0a~\xb4\x12m.\x85:\xf6\x03\xe0\x13;\
+U{4\x19\x1de\x0dF\x0eN\xd2\xd4c'\xf6\x7f\
+\xdc\xc5%u\xe5@\xa7\xfb\xd7\xd4\x15\xcd\xf3\xe2\xda\xd0\
+\xd8\xf2\xb4\x9a\xbeY\xe5\x84+\xc4\x06\x17X\x04\x13`\
+\x8c\xca\x91\xa7\x0d\x8eF\xb0\x07\x0c\xf7\xf6\xaf\x0fvV\
+\xba\xdd\xc3\xb5\xbe\xfd\x00h\xe9\xddw\xb1`vm\x91\
+\xe0\x90Vj\xaf\x9dw2\xe0T\x8f\x86\xa2lr\xf8\
+\xe6\xc1\x0e\xdf\x1d\xd5\x9c\xb4\x8b\xb6f\x8eO\xe6\xc7\xbe\
++\x98\xad\x17r\x063\xf1A0\xd8\xad\xccdd\xf8\
+\x9a\xc1.\xdf\xc6j\xb6}8\xd5}\x00\x00=C\xf7\
+\x89\x0e\xdfUx\xfa\xa7-\xa8\x88Q\xd3\x93\xfb\x9c]\
+\xbe\xa3{YV\xc7!\xa2\xfc\x1e\xb4t\x87O\x07\x8f\
+\xa1\x1b\x15\x8e[\x0b\x83y1\xe8\xf0\xadz\xa8\x8dM\
+\x95_\xc3\xd2~\xf2\x00\x00\xba\xc3O\x096\xc7\xd9y\
+\x10\xa9T\x05\xbe~\x14\xc1\xf2x\xf4\xae\xbe\x8e\xe0\x8d\
+Tu\xe8x\xe9\x16\xb0[\xdcr\x0e[-o\x14\x1d\
+=[\xdc\xaf\x12\x00\xe0\xf5\xaf\xa57\xba\x0fL\xaa\x01\
+\xf4\xec\xa1)\xe8\xa0\x81\xe6X.\x97n\x7f\xa2\xc3\xf7\
+\x04M\x1d\xf5wj?\x03\x04\x00\x97mU=\xef\xe6\
+\xc21<\xc0\xcd>Y\x97\xdb%t\xc8@\xc5\x91Q\
+\xe6\xdf\xbfc\xbd\xfb\xd5r\xdf\xab?\xb7\xb03@\x00\
+\x006\xff\xa3\xe3\xf1\xdc\xdf\xf1\x9e=\xdf\x1d\xbbT7\
+\x8b\xe0qs\xe2\x91\xbd\x9d\xdewK=_\xff}q\
+\xcc\x00\x01@\xeb\xe6\xd8\x89\x8a\xa2\xbc\x8eb\x9c\x1a\x00\
+\xe0\xac\x89\xd7\xb1\x06E]\xf6\xe8\x86\xe0[\x8bcx\
+\xf5^\x94\x9a\x01\x02\x80\xd5\xdb\xe2\x1f\x90r\xf2+h\
+\xa4A\xfd;M)\x9c\x01\xcc\x0c\x9b\x9f<\x7f\xd7\xa5\
+\xbe\x9d4u\xd4\xdf\xa9\xfd\x0c\x10\x004o}\xe7x\
+V\x12\xdf`y\x91Z\x02\xa0w\x99\xc1\xd9\xc8\xe4\xc6\
+b\xff5\xd8\xe5\xff\x5c\xed\x87Ro\x91f\x06\x0ag\
+\x80P\xec\x88\xb8*\xbd\xa3\xe7\x0c\x80\xf5\xf0F\x0b\x18\
+}Rik\x93\xe8\xdf~V\xe38M\x87\xea\xef\xd4\
+v\x06\x08\x00>\xf9\xa0j\xddg\x8c$x\xd1$\xe8\
+Q\x03c]\x06\xa7\x0f\x5c\xc6c\xbf\x18\xec\xf0\x7f\xb2\
+\xb6C\xa9\xb7F3\x03\xfb\x15A\xe7n\xda\xf76\x98\
+^\x8fD{\xbd\x9e\x82v}\x83\xc3\xcb\xe4\x12\xb1\xdb\
+\xc0\x10\xf4u=u\xd5\xdf\xad\xfe\x0c\x1c\xd0\x04\x86\xa2\
+\xcf\x00\x00\xce\xa2\xd6\x04\x16\xfb\x0a\xd6@\x08\xee\x04?\
+\x000\xd4$\xa3\xf5@\x8d\xea\xaf\xa1\xae\x16\xf6\x03\xa0\
+\xb9;\xfa}\x83\xd3{M\xc1\x16\xa0\xd3\x9d\x0eA\xc0\
+\x09\xac\x00\xce \xb9d\xe4\x91\xa3D\xf3\xa7\x1f\xb8\xc8\
+E\xa9c\xd65\xbe\xfa\xcb%f\xe0\xc0\x16\xd0=\xd4\
+ahp\x85\xa4TR\x9f3\xc84I\x80^\x7fx\
+3\xc8&\xa2a\x03\xc7]\xf9\xc4\xa5\x8d\x8f\xd5Wd\
+q\xcd\xc0~\x00\x5c\xfe\xc8\xa8\xf3\xedl.\xca\x1b\x8c\
+\xa2\xde\x83\xe0\xec!\xa2\xa3\x06\xc6\xfc\xe7&\xe2O\x9a\
+\xcd\xec\xf5\x8f_\xe0\x7feqM\xc3\xd2\xed\xcd\x0c\x8f\
+\xa0U=C;\x04{c{nl\xb8\xe23\x82\x8a\
+\x22r.\x00\x97.&\x9f\xd9*\x9a\xc4\xef\xed\xbc\xd0\
+\xfb|\xc5\x1b\xaaW\xa8i\x06f\xfa\x04\xf6\x86\x9b\x19\
+\x8bk\x00\xdd\xad\xa8\x9dBJ4\x8f\xf1\xfd\xc4u\x0b\
+\x9c<\xe5l\xeaI\x08\xe8\xbas\xb0\xd3\xb3KS\xaf\
+\xeb\x0fWl\x06\xde\xe3\x16\xde\xdc\x1dy\xd6`w\x9d\
+\xa9\xcb/\xb0\x8c\xee\xa1\xd2\x09=~\xd1\xf9TN\x8d\
+\xbd\x0a&\xe9\xffpq\x81\x07{;k\xe3HRF\
+\x17\x97\xc4#\xef\x01@\xfb\xb6\xe8\xc7\x15\xc1\xf1?R\
+z\xbc&\xf1\xffE\xa2\x07\xa4\x96\x81k\xe3\xb0\x22s\
+\xf7\xbay\xcb\x8fz;\x1b*\xbf\x0f-\x89%\xd56\
+\xc89#\x83\xc0\xcd\xea)\x83\xdb\x7fv6\x1e\xd6V\
+\x9b\x8e\xa7\xd1\x10\x85\xc1#\xbc\xc9\xc2dG\x87\xf3\xd0\
+\xb1\x9fq\x82\xf9\x9e\xbeK\xed\x7f\xd2Qm\xfd\xd5r\
+\xaf\x81\xd3\x9f[\xdb7\xdc\x94NH\x7f\xe6Lv\x8b\
+\x94\x99\xa8lxX\xa9%\x01\xd72\xf4,\x02\xc2)\
+\x06\x95R`b\xee\x86\xffu\xfb@g\xe0\x0f\xa5^\
+\xad\xff\xae}\x06\xe6\x94\x00XMKh\xe8|\xd1\xee\
+{\x1c#\x84 <\xab\xb6 \x98\x1a\xc7\xfe\x03#z\
+*g'{\xadF\xd3\x97\x1e\xbd\xc8\xf5\x96\xf6a\xd6\
+\xdf\x98o\x06\xe6\x05\x00\x01Aw\xf8\x0ec\xa3\xff\xcb\
+\xd9Q\xe0\x03R\xe4\x05\x01\x01\xf6\x03\x81\x80W\xc8\xec\
+h\x18TK\xe2m'5xn\xbb\xb7\x9d\x9d;<\
+\xa8\xbe\xd6\x9af\xe0\xa0\x00  \xe8\x09o4\xba\xfd\
+W\xe7\xc6\xe2@\x11 -\x18\x08\xb0/hn\x16\xac\
+\xb05$\x22Q\x85\xe5?3\xd8\xd1\xf8\xb8\xa6\xd1\xd6\
+\x1f~\xcf\x0c\x94\x04\x00\xbe\xd1\xda;t\xa7\xe8\x0c\xdc\
+\x90\x1f\x1f[x\xbe\x008\x10\x88\xa0G@\xe7\x95\x5c\
+*~\xdfq\xefk\xbc\x0e\x98C\x17\x9e\xae\xec\x10\x05\
+WY\x00\xc0\xb1\xb5\x85\x86\xbf\xc1\xd9\x9c\xff\xae*\x12\
+9\x9c-h!\xc6&\x9e\x15\x1d\x1e&;\x12y\xcb\
+\xca\xf1\xab\xb7w6\xbe\xb1\xa0}:D\x1b/\x1b\x00\
+8\xbe\xd5\x9b\x86\xce\xce\xb3l\xb7\xd1\xe3\xf7\xe7\xc7F\
+\x16\x84 r\xff<\x03\x08 \xa0\x815:|`l\
+\x8ad\x04\x8ba\xc5\xee\xb5\x9e?\x1e\xa2\xeb\xb0`\xdd\
+\xd6\x04\x00r&\x08\xc5\x1d,\x9b\xbf_\xb0\xba7\xa8\
+\xaa\x0c\xc1\x99c@\x04\x8e\x8c\x0e\x0bD\x1d\x07@\x10\
+\xadNVN%d\xd1(\x9f\xbes]\xd3KZg\
+\xb3m\xfb\xc8\xc9l:\xff\x81<\xf0\x8e\x0a,\xd0\x93\
+\xcc\x15\xd4\xc6C\xad@{\x0e\xcc3yp\x7fLI\
+\x8c!\xdeht\xfdy\xd3:\x16\x18\xb4\x16Gi{\
+x\xe8d _?]\x11\x0cGBg\x1d,\xa3\x98\
+\x81\x81\xdd\xa0*\x9c\xc2\xa9J\x06\x8c\xfcp\x9dbG\
+\x18\x91\xf9C\xff%\xbe~\x18\x0c\xfd\xa2\x15\xc2\xb5\xe5\
+\x8d\x06w\xf0x\xf4\x22\x82p\xf0\xb2\x99<*>]\
+\x04\x04\x0e\x16M\xd9\x82Q8e\xd7:\xf7\xef\xcbi\
+c5\xd8>\xf2\x0a{7\xe8\x1dNAv\x92\x02m\
+\xe2\xc1|!\xe0w\xa4\xb1!T6\xc0~\x8eL\xa9\
+\x8a\xfc&\xcf\x0b?\xdeu\xa9\xf7\x1e\x9c\xd0r\xda\xad\
+\xf43\xed;\xf6\x1d\x93K\xb1\xbf\xe0\x0c\xb6\xb30@\
+\x07\x19Y@\xb5>\x8b\xa4\xbb\xc0\xb5\x8c\xc1;\x85m\
+|\xec]\x9e\x15\xae\xd0,\x01fw\xbe94|=\
+\xa7\xc8\xb7\x8a.\xbf\x15\xd5\xc7\x84\xe2\xbdLJ\x97\x8a\
+N\x04\x80\xc0`s\xb3\xb9d,\xe6\xe6,'\xf4v\
+:\xe2\x07\xab\xbfmk\xe42\xce\xe2\xfd9.h\xc1\
+\xf8Uf,+\x99\xb1)~#\x16\xb4\x97\xe0\x0a\xcf\
+\x9b\x91\xaf8\xbc\x97\x11\xd4\xd5\x03\x177\xbd^\xd1q\
+\x95Q\x19ZqM\x81@{&\x06\xc4\x1e\x08\xcc\xe9\
+\x1cK\x88\xe7i\xab\x0c=G\x0a~B\xc5\x93\x9fL\
+\x84u\x03\x00\xfb\x87\xdc\x02\x91t\xec:UVn\x80\
+=\xd9\x86T\xb2H\x0bCK\xf6T\xc6\x98\xe7}\x04\
+x\x0dA_\x10yr\xb03\xd0<\xdfC\x1b\x9eJ\
+z\xa3\x91\xf4>\xd1f\x17+q\xa0\x05*\x1c\x06\x0f\
+\xa4`@S\xadF\xf6#\xdb\xd7\xf9~\xa7g\x0cZ\
+\xdf\x85\xb8\xce\x97y\x93\xedC\xdai}\x08\x1c*W\
+\xf0|\x00\xe7\x82\x7f\xe3T\xe9:\x90\x08.\x19\xb9}\
+P\x8b\xa7\x87nFc\xf7P\xcc\x19\x5cx0\x9c\x9f\
+\xa3\x00\xb4\x9c\xffjp\x06\xee\xcd\x8e\x82\xfb\x1b%#\
+\xd9\x5c\xdd\x22\xce\xb0\xe3\xf1\x84\xdda9\xe1\x91\xb6\x06\
+\xfa8{\x8dc^\xd5\x13y\x8e\xb34\x9c\xae\x15\x00\
+*\xcbI\x15\x05@\xb1\xdfW\xefT\x8d\xaf\xa5\xa3\x9f\
+\xe1d\xf5\x06\xc1\xe6^\x86\x92@\x9aD\xe2\x89\x1a\x5c\
+\xd7\x91\x9f\xc8haa+RM\x96\x8cg\xc7\x9ac\
+F\xdf\xb3muG~\x06\xfe\x8f\x97\xeb\xe1B\x98o\
+\x8dL\xde\x00\x93\x19\x0d?1\xd8\x11l\xd7\xb8\x8e\xd4\
+\x8f\xd3\x01\x00\x97\x9eE\xa3[u\xcb\xb9\xdd\xd1\x0e\x9e\
+\x91\xbf\xc4Y\x1d+8P\xde\x10n\x9f)J\x97\xaa\
+\xb5<\xc5T\x22%\xc3sr\x15\x00\x0f\xe2\x16\xbe\xc1\
+}1\x92a\xe9v\x80\x9d5\x08\xe2\xf9\xd4\xe0f\xe4\
+\x89\xe4E}\x97\xba\x1e\xad\xda\x18\xa7U\xbc\xa8\x01P\
+\xec\xe7\xeaM\xe1f\x99Sod\x8d\xd66\xc2\xe7\x87\
+F\xa6y\xd8\xbe*1i\xa86V\xb3\x19\xc5\xc9\xf9\
+\x02\xe0d2\xc3\xb7\xa09\x14\xd9\x0aW\xc7\x8b\xaa\x01\
+\x008`\xa9\xa2\xc5\x0e!\x92\x89w\x06;\x83GU\
+b,\xa5\xea8$\x00P\x1c\x04\xd2\xd0f\xb3\xd2M\
+\x1cg\xb8\x14\x18I\xa6H\x9e\xaa\xb05\xa0\x14pA\
+b\x8b\xd1\x11\x08P\xf1\xce\x08P\xa9\xa6\x04\xc0q\xe2\
+\xa1\x10\xcf!\xb0\xc5\x5c5\xd0\xe9\xbf\xbf\xd4\x02\xea\xfd\
+\xfd\x90\x02@q\xb0kC\xc3'@\x96\xa1;\xe0:\
+r\x11F\x13\x91\xd3x\x85\x15J\xe8S\x00g\x8f\xbf\
+\x0e\xae\xf7/\x9f>\xc9\xd5\x06\x00\xb6\x85\xeenrf\
+|\xc4\xd5\x11h\x02\xbe$\xba\x90\xeb2\x91qH\x02\
+\xa08\xb6\xf3B\xa3\xff\x94W2\xf7\x18\x5c\xfe\x0f\xe5\
+'FA\xafR9\x8b#\xfa\x1d\xb2<\xa4\xa1\xe3\x94\
+\x19\xca\xa1Z\x00\x00\xb9\x90\x89\x04J\x0c\x7fe\xa0\xd3\
+\xf7\x9d2\xd7\x92\xea\xb1C\x1a\x00\xc5\x11\xa3\xc5\x91\xb7\
+5\xde@\xbc\x85s\xe9\x8a\xa8\x96\xc9\xfd\xdc\xeef\xf2\
+\xe3\xb1\xab\x81B\xfe\x07\xc5\xb6j\x02\x00h\xac\xc0^\
+\x8e\xd1\xd2\x01\x88\x96f\xab\x16-}X\x00\x00\x17\x07\
+\x12TtB\xe2\x9f\x1eB*\x0d\xd7\xb8J\xd8\x17\x90\
+\xb9\x0c\xe8jgD+\xd7\x0a\x00D\x0a\x00ob~\
+b\xf8\xbb\xa0{\xff2\xd5\xe7]\xc6K\x87\x0d\x00p\
+\xacm\xbd\xe1u\xac\xc5\xf9\xa8\x92\x05%R\x05r\x15\
+\xc0i\x1f\xe8cG\x9f\xed\xefj:\xab\xd6\x12\x00\xdb\
+#\x9c\x09 \xd5\xdc\x9c\xcdW-O\xe7\xc3\x0a\x00D\
+\x12\x84\x22\x9f\x87\xbb\xf4\x0fu\x93V\xe3\x02\x90,\x22\
+\xe3\x90E\xa4i\x7f\x16\x91\x9aI\x80)\xc4\x19]\x01\
+ty\xffI_\x87\xff\xca2>h\xcd\x8f\x1cv\x00\
+  \xd84\xf4\x84\xe8\xf0\xae\x06\xe3\x8e\xe6\x09\x99\xfe\
+B\x81\xb5$3\xe1\xee\xf09\x8b\xec\xa5\xb5\x06\x00\xfa\
+4\xa2\x8a\xdab\xcc.\x7f\xb4\xdd\xffW]\x03\x9a\xe3\
+\xe5\xc3\x13\x00@\x01\x0b_\xefshO\xd0\xa3B&\
+<\xc2RV:\xeeX\x9f\xa3\x98t\xba\xd6\x00\xc05\
++\xe8$\xc2\xdb\x06\xd67]X\x07@\x993\xb0*\
+\x14\xde\xc3\x19\xad\xcb\x90\xc0\x9a\xb6\x10\xf6\xf2\x5c\x0e5\
+\x82\x8d\xa0\x11$&\xe2U\xbd\xa0\x0a\xb6hT\x05\x93\
+\x04\x18<\xb8\x8b\x00\x1b-\x85\xb9\x1b\xaf\xa4\x08\xc6\xfc\
+d\xee#O\xaew\xbeL;\x9e\xb9\xde;,%\x00\
+\x0e\xb4\xb9'\xbc\x09\xce\x02\xeb\xf3I\x5c7:\xd2\x0a\
+\xb4\xd7\xcb\xd9L~e\xc0o\x07.a\x92`\x80\x0a\
+\x00p\xa5\x84C\xfd\x18\xac\xbd\x83\xd6\x82H\xac\x85\xc9\
+\x91\xa7\x06\xbb\x02\xe7\xd6\x01P\xc6\x0c@\xfa\x9a\x1f\xf3\
+6\xf7gI\xa0*\xc5W\xb7\xff\x14\x9eO%\x06:\
+\x82\x9e\xa2\xc7\x8ev\x00@\xb4\x12\x84\xac\xa9\xf9\xf4&\
+\xc0\xe1\xa9\xac`\x5cN\xc3\xa1@\xe2 A;\xc9$\
+\xe3\xe7\xec\xda\x10|\xba\x8c)(\xeb\x91\xc3V\x02\xb4\
+\x82\x04\xe0\xf4J\x00Ba?\xf16$\x918\xba8\
+\x9b4\x00\x10\xc1n!\x8f'~\xa4\x08\xfc^\xd1\xe2\
+\xb8\x1d\xb5\x964\xa0$\x96\xc2T\xfc\xb7\xfd\x9d\xc1\x15\
+e\xadn\x19\x0f\x1d\xb6\x00\x80-\xe0I\xf0\xf5;G\
+\x8f\xd7\x0er\x11(\x93\xe33\xd2\xc9j\x07\x00\xa6\xa5\
+u\x81sK\x22d\xb3[\xaf\x1eOf\x22h\xbf\xa0\
+\xb1f\xe2{\x08\x02u<\xb6nWg`{\x19\xeb\
+[\xf2\x91\xc3\x17\x00\xa1\xc8;p\x8d;\x82\x9e\xba\x0e\
+s\x18\x80\xab\xd6D|\xa6&\x90\xe2\x10\x88\x0a\xa5\xfc\
+\xe4\x18\xd9\xbf[6\x85\x1f\x17\x9d\x9e\xf3\x81\x15\xb5\xe4\
+\xe2\xcc\xf5\x00fR\x03\xa7L0R\x05f\x18\xa9\xa8\
+*\xc33\x0d\x95G\xd0,\x87\x90\xf3\x1fO\x1c\xeb\xc9\
+9\xc6\x1e\xbc\x18\xdc\x86\x17A974\xf4Q\xc1h\
+{\x1e\xbf2\xe2}KS\x88*\xd6\xc7H\x89\xc8\xbf\
+\xf7u\x05o\xa1\xdf\x02\xc0\xba\x07!iJ*\xf9\x12\
+l%\xa76\x87F\xce\x10-\xd6\xff%\x1c\x0a\xe0\x84\
+\xa9\xb5\x10\xb75\xe8W&\x1e\xf9\xec\x93\xeb\x03?\xd5\
+\xfa\xfe\xec\xe7u\x03\xa0\xadw\xe8V\xd6\xe2\xfa:\xf2\
+\xf7\xb0\xb2\xb4\xd5`3\xdf\xb8c\x8ds\x8f\xde\x8e\xe9\
+y\x1f\xec\x02\xf7\x89\xf6\xc6\xab\x88\x22\x88\xf2\x00H\x08\
+\xacA\x11\xc4\xe6R3\x08\xaci\xb6\x004\xefJ\x99\
+\xf1\xd7\xc0\xc9\xe3d\x1cWs\xcf\xd0oa[\xf8p\
+\xc1\xa9D{)\x98\xaa\x93\xb1\xe3\x96\x07\x9a\xf4\x86\xb6\
+\xe9\x02@\xeb\xee\x91\xa3\xe4D~\xaf`\x81\xbd\x12\xbe\
+6\x11\x90\x8e$Q\x9c\xaa\xdeq\xa6\xcf\x7fk\xf1\xea\
+\xa4}\x88\xf4o\x5c\x10J,\xcbp\xd2\x1eP\x9fQ\
+\xed\xb3\xc5\x96y#\x5c\x01\xf3\xe9\xf4q\xc7\x06\xbcE\
+%\x10\xfeF\x05\x00\xa2RN\xfd\xad\xbf3p,\xd6\
+\xd1\xb6y\xdf%\x9c\xd5\xb79?\x1e\xa7sz\x9d2\
+\x17K\x89\xf0\x97\xfa:\x83w\xd2\xcf\x96\xce-\xe0\xdc\
+\x9e\xe1\xcf\x09F\xe3\xfd\x98u\xab\x98*\x16'\x0e\x01\
+\x91\x1f\x0b\x0f\xcb\x0a{s%\xc4\x94\x96\x01\xae\xea\x0e\
+\xffFpxN\xa3\xddc\x8bm\x190\xbf`*\xd1\
+\xd7\xdf\xe1k\x9b\xde>\x0d\x00\x88i7\x93\x8e\x00\xfd\
+m\xb0\x98\x95\x14\xbc\x8b\xff\xce\x9b\x1dGk\xf5\xc6\xdd\
+\x0fPrCI\xa5\x9c\x9c\x1f\xdd\xd6\xa8\xb5]\xfa$\
+@O\xf4\x1e\xd6l\xbd\x96\xd0\xb7MW\xb6\x00B1\
+x\x00\xc1\x90\x1d\x8b\xbc!(\xdc\xed\xbb\xba|\xbf\xa8\
+f\xf4KGH5$\x94\xe8N\xd1\xd9\xd8\x0c\xe4\x92\
+3\xfb\xa3\x05A\xf0,\xee\xb3b\x83\x87Q\x12#\x97\
+\xed\xde\xe0\x7fH7\x00\x0a6\x85\xf1\x95\x8d>w1\
+9\x15\x1a\xad\x0c\x0e\xdf\x0fI\x9ee\x1a\xf7\xf2))\
+\x90\x1d\x1f\xb9}\xf0\x12\xefW5\x0eq\xff\xe3\xba\x00\
+\xb0\xaa'\xfc\xdf\xac\xd1r\x05\x06r\xcc\xa5m#\xdc\
+=\x00\x04\x92\xb6u|xX\xe5\x85\xfb\x0c&\xdb\x03\
+;\xcf7\xff\x9d\xb6\xc3s\xbd\x87\x07+V\xcd=`\
+p\xfa\x8f\x07\x9f~\xdd\xeeaS\xa9\xe4q\xc1|\xb3\
+\xb71*\x09\x00\x1f\x82\x9a\x9f\xcc.;6\xd8P\xdc\
+\xb3\xaf|I\x15\xf7\xec\x09\x0f\xf1\xc6\x06\x0f\x1e\x08i\
+J\xd1yU1\xf8|\x83\x94\x07p]\x00h\xe9\x8e\
+\xfc\x923\x9a\xfe\x193z\x1fL\xdd\x8a\xf7W\x94\x06\
+D\x9f\x0d\xfe{`\xa0yFe\x85\x87\xfd>\xe3\xe6\
+M\xe7\xd8\xe9\xeeC\xd0\x22h\xfb\xce\x84\x00\xbb+\xe1\
+\xf0\xf1)\x8ck#\x87*\x8c\xfc\xd5\x15l\x0a\xa7\x7f\
+\x0f$\xb0\x8c\x87\xef\x1e\xec\x0a\xde0{a\xa8\x00\x80\
+*\xe5\x5c6\xbf\xd2\xef\xdb\xafR&g\x81\x9e\xa1\x9b\
+xW\xe0;\x10\x8dD}XEs1\x18\x8a\xee\x1f\
+X\x1f\xbc\x8a\x06D\xba\x00\x80\x961\xd6h\xbe\x18\xf4\
+\xe5\xe5\x89\x5c\x10[(\x0d\xf0\x0bC\xe58h\xc4@\
+I\xaf\xbc\x0e2\xf7e\xc8\xda\xf7\x8a\xc8\xf3/\xe7\x05\
+f\xc8\xaez\xc6%\x7fl\xec\xc3yo\xfa\x9bg3\
+\xf2\xd3O3\xfc\x8e\x1cc|M\xcaxs\x13\x89\xd3\
+\x18UX\xa1\xb2\xf9V\xdeh;\x05\xd5\xac\x18e\x5c\
+)\x06\x92B\x16\xf1T\xd6i\x07\x87\xcc\xd5\x05\x03\x90\
+\xde-\xa0hU\xb46q\xee\xe9\xc90>\xb9\x1br\
+-\x8c\x0d\x83\x1407\xd0\xea+\x88\xc1\x0an:\xd6\
+\x5c\x96*\xdf\x92.\x00\x00\x0f\xd0c\x90/x\x8d\x92\
+C\xca\x1dm\x06\x17\xdc\x1e\x90\xdf\x0f\xa3Q\xd1\xe6\x8d\
+r\x1b'\x01\x03?0\x1c\x8c\xe3 6HVS,\
+\xcf\xa4 l\xb6\x01~\x87\xbct\xaa\x80W*rB\
+/\xa6\x85\xa7\xbd\xe7\xcf\xf1\xb9\xa0\x1f\xa0\xd1\x0d\xa1a\
+\xf1\xe8\x8d\x03]\xfe\xbb\xe6\xfa\xa2h$\x00Y$H\
+\xacd\xb0\x18\x1b\xe1\x8a<\xe3\xee\xd7\x12\x0a\x7f\xd5\xe0\
+\xf0\xdf\x06<\x05:\xa4\x00:\x90F\xb6@\xe2\xebK\
+\xb5J\x01]\x008\x17\x22K!SH;\x0d\x00f\
+w\x14'\x9f\x01/\x5c\xf27\x16\x90\x10\xe4\xdf\xe1o\
+Dx!d\x19\xc3\x93\xe5\xc2\xd5\x89\xf2~?\xef\x04\
+ME\x08\xe7\x93\xb17\xfb\xbb\x02'\x16O\xeb\x95\x91\
+\x00Sfe;\x04\x9a\xb4\xcf\x0c4\x81\xb3\x80\xe5\xaf\
+{\xa2\x11\xd8\xcfm\xd4R\x80\x98\x8bM\x8c89\xf1\
+\xc1\xc7\xd7k#\xd3\xd6\x05\x80U\xbd\x91\x87Y\xc1\xb4\
+\xa1\xd4\x19@+*k\xfe<\xa6\xad\x87\x98@\xccz\
+fV\x84\x7f\xd8\xde\xe9\xf8\xcb|}\xa0\x95\x00 \xd9\
+T\xab\x93;r{k\xe3\xbe\xd9u7\xf7F\xbfb\
+t4\xde\xae\xe7,\x80\x0e\xac\xf9\xe4\xc8\x00H\xaeU\
+Z\xe6O\x17\x00\xda\xba\x87\xeef,\x0d\xd7\x13\xa7\x8b\
+J\x7f\x91ZF\xa1\xe7\xd9b\x96\x12p\x01\xcf\x8d\x96\
+\x8e\xc6\xa1\x02\x00\xe6E\x04E\x19\xcb\x19\x8f\x19\xe8t\
+\xef\x9d\xdd]\xc8]lz6\x12\xde\x07Q\xba\xae\xc2\
+\x95Z{A\xe2+\xc1\x02\xba\x81\xc9\xe4\xc7ww\xf8\
+\x9e)\xb7\x06}\x00\xe8\x1d\xfe\xa2*\x9a\xee*\x10;\
+,\x08\xc1E\xb9\xe3\x9c\xfb\xb9)\xc2(\x83\xd3\xc3d\
+\xc6\x86\xe1>\xed+y\x9f\xa6\x06\x00\x9cmLV\xd3\
+q\xf3\xa9\xc9\x81h\xfb*8\x7f\xdc\x07 \xa4\xd3\x0b\
+\xc0\x08EP^\xe5'\xe2/\x00\xbf\xc1i\xe5N\x8c\
+N\x00DW\x02\xe7\xde\xaf`\x87\xa67\xba\x94\xdb\xd3\
+J?7\x95\x9a\xc6\xe0t3\xd9X\xf9\xd7(Z\x00\
+\xa0ob\x83`>\xe1\x91\x8b\xedo\xce\xbb\xbdt\x0f\
+\xed\x85H\xe8\xa3h\xb5\x83\xc5\xbc\x0a\xf9\xf1\xe4\x1a\x90\
+4;\xca\x992]\x00\xc0\x06\x9a\xbb\xc3\xafB\xbc\xfc\
+\xc9\x10\xc6TN{\x8b\xe3\x19\xe4\x010XX\x14\x99\
+@\xf4\xf0=HVyS\xb9\x1d\xa3\x07\x80\x047\x1b\
+\xd3I\x07#\xb0>\x17R\xef\x80\x052\x04{9\x9d\
+\x8d\x00\xa5\x00\xf8\x1e\xe4'\x93o\x0cv\xfaN,g\
+L\xba\x01\xb0&\x14\xfbhV\x10\x9e\x17\xe0>\x0e\x0c\
+\x17\x8b\xfe,@B\xbe\xc0\xa9\x02\xb5o\x8a$]3\
+\xd8\xe5\xdbX\xceD\x15\x9f\xd1\x07\x00\x0e\x00\xe0=(\
+\x839l\x05\xaf\x88\x0d\xce\x0f\xa0\xa1\x88\xa6\x10s1\
+\xa1\xbf\x1b\xb9|\xb0\x0bx\x8cJ\x14\xdd\x00\xc0\xfa\xdb\
+\x1f\x8d\x9d\x96\xcb\xe5v\x18\x5cA\x8f\x84\x8c\xa0`\x1c\
+Z\x8c\x05\x95<\xa2\xb5\x81\xc9\x8d\x84\xffd\xb0\xd9:\
+v\xaci\xd0\x9c\xaa\xbe\xda\x00h\xdb\x12ka\xcd\xf6\
+~\xdc\x06h\xfc\x05p\xde\x89'Sz|\xa8\xaf\xc3\
+wd)\xfbKE\x00\x80\x8d\x821\xc66\xa6\x0e\x7f\
+K\xe1\xd8k\xd1\x92\x96\x07\xda5%\x0f\x1a\xc2\x85\xbe\
+\x1d \x85\xbc\x08\x14\xf2\xe0\x97\x97OD\x81\xb5Z\xfd\
+&\xd0\xc7\x7f\x9b\x16\xa0\xd5\x06@a[\x1d\xfa\x95\xc1\
+\xee]I\x1b\xd8\xa2\x85c\xa0b\x00(N\xe8\x05\xa1\
+\xf4\xb2Ie\xfc\x1b i/\x17\xed^\x02\x02\x05l\
+\x05@\x1b_S0\x90\xd0n\x11L\xd3f+\x92>\
+\x81\x9eQy\xd0.8\xbe\xba\xf5\x12\xcb;\xb4\x8b\x8f\
+\xef\xd5\x02\x00\xb8\xad\xe6\xcd\xd6\xe7\xc1\x87\x80\x9aQ\x95\
+8\xa1L\x8e\x97t\x1a\xa98\x00\x8a\x93\xdb\xb6%\x15\
+\x84\xa0\xb6\xcb\x80J\xea\x0a^\xb4\x9c\x80qv*\x5c\
+\x85\x0a\xd1:\xc0GWam\x1e\xa2\x1eO\xc1H\xda\
+H\xacd\xd0\x86496\xc6\xb1\xcaO\x18\xc9\xb0\xb1\
+o\x83\xe7m=\x0b_\xab3@\xb1\x1d\xe2;\xe8j\
+<\x9f\x9a\x8c\xaa\xe842\x1a\xb9\xbe\xaf+p\xcf|\
+c\xaf\x1a\x00\xa67x\xde\xb6\xe8\x87\xf2Y\xa5\x1d\xb6\
+\x83u@?z\xaa`\xb21\x1c\x9aHa\x91\x88\xee\
+\x1f}\xe3\x90\x85\x12u\x09\xe4\x0f\xfe\xf3^\xdb\x02a\
+\xa6C\xd50\x09\xb4(\x90\x16\xce\xb0% \xc7 \x10\
+\xec0*\xb7\x8bc\x85\xd0\xcd\x8d\x9e\xc7\xce9\x07\xcc\
+L\x15,\xb5\x90\x00\xd8\xdd\xd6\xcd\xb1\x13\x19\xc1\xf0:\
+\x99#J>$\xf4\xc9\x90\xb2\xa9\x84\x9b\xf15\x81\xd3\
+\xc8\x9c\x07\xb3\x9a\x00`\xfa\xfc_\xb6U\xf5\xbc+\xc7\
+\xce\xe0\x15e\x05\xd8mOW\x14\xf5d\x8e\xe5\x9b\x18\
+A\x00\xea\x1fS\xe1+\x86\x85\x85\x7f\x992\x03\x00d\
+`\xb1\xf7\xdb\x02\xa4)\xd0@\x98\x150\x82H\x9c\xa2\
+\xfc\x19\x9e\xf8=/\xf2/\x02\xfd\xf0\xd3\x0e\xc6\xfb\x7f\
+\xd5\xcc\x1eV+\x00Lm7\x0f\x88\xf6\xc0\xa70\xd9\
+\x05U\x99\x92\x02\xe0\x9duS\x7fG\xf0{s\xd5Q\
+s\x00\xcc\xd5\x09d\x0b\x8d%c\xcbeVZ\xae\xaa\
+\x9c\x97\xe1d\x13\xcf2\x16F\xe1, \x09\x0c\xac\xca\
+g\x80\xb3\x18\xa9?\xd2\x82\xc0\xc7$I\x88\xaa\x0a\x1f\
+\x0d\xda\x1d\x7f\xf9e;\x9b\xa4\x9a\x1c\xca\x97j\x09\x80\
+\xb5\xdbT\x7f*\x1b\x0d\xf3\xa0J.\xd8[\xb4\x17\x01\
+\xb6^);\x99X\x99\x9a\x0c\xder\xc52\x12\xde6\
+\xbd,\x0a\x00h\x1f\xd6\xc2\xbdQK\x00\xe0(\x9b{\
+\x22w\x19]\xbe/R\x1b\x8a\xa6\x98F\xe4d\xec\x86\
+\xdd\x1d\x8dw\xcf\x9e\xb9\xe6\xee}\xcf\x0aV\xe7\x99\xda\
+\xb4\x8f5\x22\x8a\x5c\xb8e\x9e\xbf\xe5Z\x03\x80P\xec\
+3\xd9\x08k\xb0\x1aedU\xa7(x\x16\x00\xa2\x8b\
+\xb8\xb3#\x10\x9c\xcd:\x06\x00\xf8\x95hu\xad\x84\x10\
+H\x0d5\xd7\x01\xa0\x89)\x14\x1d^\xf00\x07N.\
+%5\x81s\xadBk\xef\xbe\xaf\x09\x8e\xe0\xb7\xe8\xa5\
+\x008\xba@0In4r\xdd\xc0\xfa\xc0\xf7\xa7\xb7\
+\x81y\x1eAGr\xb6\xb6\x10\xba:\x00j\x0a\x80[\
+\x9e\xfa\x1b\x98\x8bM\xba\xcc\xc5E\xbd\xc0\xd7\xfc\x81\xe0\
+\xf4\x9b\xd1\xaa\xee\xc8\x00o\xb37\xd7\x01P\xa6\x00\xac\
+\xf5\x16P\xec\x16\xf0\xfa\x7fAt\x05~@k.&\
+\xdaA\x90\x02r\x22\xf6\xf9\xdd]\x8d?*\xd6\x0b\xf1\
+\x09O\x08\x16\xd7j\x12\xb1\x5cv\xa9K\x80\x9aJ\x80\
+\xfd \xe8\x0e\x83\xb9\xd8Nm.F\x1b\x81\x94\x1e\x9b\
+\xc1CL\xc7}\x5c\x07\xc0\xc2\x00\xa07\xda!4x\
+\xa8\xcd\xc5$\xe0\xc5\x8e\xaec\xd1O\x80=\xe4a\x04\
+\x16\xba\xf5\xf1V\xd7\x06mL*K\x19\x00\x14t\xf1\
+z\x0f\x813\x0em\xa1\xf0\xef\x05\xab\xeb\xfd\xb4\xe6b\
+\x12^\x9eJ\xbc\x011\x0f\xc4_\x00\x83{\x04\xbb\xe7\
+\x8a\x1cdr+\xdf\xb3\xbb\x0e\x80\x05\x91\x00\xb8`\xad\
+\xa1\x91U\x9c\xad\xa1\x8f\xd6\x5c\x5c \x99\x00\xa7\x91\xf1\
+\x18x\x0d\x05w\xd0ER\xd7\x01\xb0`\x00@\x10\xb4\
+\x84\xf6=#\xda\x1a\xcf\xa25\x17\x17\xa8fF\x80j\
+\xa6i\x05P\xe9\xdc\xce;\x1a\xbf\x82Q\xdd\xe5\x9b\xee\
+\xeb\x00XP\x00\xa0\x03\x8e\xcc[\x7fCk.&\x84\
+S\xa0\x1c2N\xe6ON+\xe9f\xc1\xe5\xddH\x02\
+j\xcb\xf6\xdd\xa8\x03`A\x01P\x90\x02`.\xb6\xd3\
+\x9b\x8b\x89\x14\x98Ll\x82-\xe19\xdel\xdf\xa8\xcd\
+\x9d\xaf\x0e\x80\x05\x07@\xeb\xe6\xe4\x89\x8c\xc8\xbe\x8e\x14\
+84\xe6bbuU\xa5I0\xb8=\xc7\x18\x0c\xcd\
+\xda\xa2\xbb\xea\x00Xp\x00\x10)\xd03\xf4s\x08\x89\
+\xbf\x8c\xa8\x88\xb5\x16d/-\xc4\xdf\xa1\x1f\x86\xc6\x88\
+\xea:\x00\x16\x05\x00\xdaC\x13\x81\x1c\x93\x1a\xc2k&\
+\xad\xb9\x185\x84\xda\x09*\xea\x00X\x14\x00\xc0\x8f\x1e\
+\xc3\xf3xw\xe0zjC\x91V\xc9A\x9e\xaf\x03`\
+\xd1\x00\xa0\xa5\x1f\xcc\xc5\xa3\xfa\xcc\xc5\xda1P\x07\xc0\
+\xa2\x01\x00Q\x0e\xf5\x86\xc1\x5c\xec\xa77\x17kF@\
+\x1d\x00\x8b\x0a\x00\x18]\xfc\xccptH0Z\x9d\xb4\
+|C\xda0P\x07\xc0\xa2\x02@A/PHjM\
+k.\xae\x03\xa0\xcc\x19\xa0\xc9\x18RIc\xd0|\xdd\
+\x04\xafi\xb6\xa57\xbcW0;\x8e\xd4\xe6\xdfW\xe6\
+\xc0g<V\x97\x00\x8bN\x02\xe0\xfa4o\x8av\x19\
+\x5c\xden\xa0\xb9\xa1\x8e..\x0f\x0eK\x19\x00\x14l\
+\xe1\xb5\x90\x00\xc5\x85\x03\x02J0\x17;\xa9\xcd\xc5u\
+\x00\x94\x98\x81\x85r\x09+oa\x88\x83G+8x\
+\xec\xa65\x17\x97\xd7N]\x02,\xca-\xe0\x80\x14\x18\
+\x02s\xb1\x97\xda\x5c\x5c\x1a\x04u\x00,j\x00\xa0\xb9\
+X\x01s1\xc4\x05V\x89\xba\xa7\x0e\x80E\x0d\x00r\
+ \xec\x1e\xdaip6\x9eW\x1d\xea\x9e:\x00\x16=\
+\x00\xda\xb6\x8f@r\x0a\xd3\xab\x84\x9f\x01\xf8\x0f+[\
+\xc0\x82\xc8\xb0y\x84\xc1\x92+\x8b\xfd\x108}AZ\
+{\x87\x1e\x10\x1c\x10]\x1c\xa7\x8c.\x9ewu\xeb\x12\
+`\xd1K\x00\xb2\x0d@(>'E#@\xe9\xcf\x03\
+\x97\xa3F\x9b\xff\xc1\xbfm\x95\xe3\x80\xfbc\x09\x96C\
+I\x02\xe0\xf2\xb4\x85\xc2\xd7\xf0N\xff\xf7\xf1,@X\
+Y*P\x08\x1b\x8b\xaa&\x97(\x00\xa2\x90;\xd8q\
+HH\x80\xe2Z\x03\x07\xc0\xaf\x0d\x1e\xdf\xc72\xb1\xca\
+l\x05\x85\xac\xea\xe9\x17\x96$\x00\xc0\x8dz;gs\
+]\xa0%0\x03\x93Y\xa0\xc7-g\xc8\xff\xe3\xee\xb5\
+\xc1?V\xe0#\xd4T\xc5\xda\xbe\xe1\xa6TB\xf9-\
+D\x08\x07\x80\x18S\x17\xado1\x85\xad4\x1e\xff\xf4\
+\x92\x04@so\xe4!\xb3\xd7\xf7/\x99\xe12E*\
+\xe6O\xc2\x9c\xbf\xc0\x81d\xcff\x8e\xec\xed\xf4\xbe\xab\
+i\xf5*\xf4pG(vD\x02ro\x18\xdc\xbe\xe5\
+\xf9\x14\xe4e@\xb2.\xe8\x13q\x05/\xb5\x92H\xd7\
+\x84\xc9>\x00\xc8F\xa7\x93\xc9\x0e\x87w\xf7w\x05W\
+\x97z\xadB]_\x5c\xd5\xacy,rJ:\xa5\x0c\
+@\xa0\xa5\x97\xe4.\xc0\x84\x15\x98\xc7`\xbaO=\xf1\
+\xb5\x84?\x84\xefH ^\xbb\x8a\x9c\xbd\x15\xf2\x06~\
+s!G\x03\x5c\x8e|\x5c\x09\x7f\x03\xfap\x15\x90k\
+y1a\x07F\x0a\x95:\x1b\x14r8\xa8\x84\xe1\x8d\
+\x95\x99\x87>\xe6\xf7^\x89\xb9\x94\x96$\x00p\x01a\
+\x22\xddq%\xba\x9ee\x95\xd3T\x86\x7f\x1f\xc7\xaav\
+\x99\x91\xcd@v%\xc2\x04\xc9*\xc7 \x17\xcf\x04|\
+8aAU_2\x9a\xb8'\xb6\xaf\xf3\xfdn!\x17\
+\x7fz\xdb\x98\xa4\xe2\x9d=\xf1\x8f\xcbj\xee\x14@\x80\
+OV\x18\xe0\xf0S\x05p\x13~\x0f5\x1bru\xa9\
+\x0a\xb9\xf3\xff\xc5\xcaZvn\xeblx\xadX\xd7\xff\
+\x03\x16zr\xab\x8f\xa3N`\x00\x00\x00\x00IEN\
+D\xaeB`\x82\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\
+\x0dIHDR\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
+\x00\x00\x5cr\xa8f\x00\x00 \x00IDATx^\
+\xed}\x09x[\xc5\xd5\xf6\xcc\x5c\xc9N\x9c8d\xb5\
+$\xb3\x84\x94@\x81\xef\x83\x02-\xa1\xec\x8d%/\x09\
+\x90\x90\xc5\x92M\x08\x0d?[KIKi)-k\
+\xa0\xb4,\xa5\x85\xb25\xa4-{\xb0$;\x09\x09\x10\
+b[r\x80\x94\xae\xec\xed\x07mY\x0am\xb0$;\
+\x8b\x13\xef\xd6\xbd3\xff\x91\x83K\x1c\xcb\xd6\x95t\x97\
+\xb9\xd2\xe8yx\xc2\xf3x\xe6\x9c\xf7\xbc3z5w\
+\xee\xcc9\x18\xe5\xc8gA\xb0ov\x0f\xd9s\x04\x92\
+i\xa9\x84\xb1K\xa6\xb8\x94`\xeab\x98\x96RD\xa6\
+\x10\x86\x8a\x10\xfcG\x09+\xc2\x0c\x8f\xdf?l\x86Y\
+/\xc1\xb8\x87*\xfb\xfeE\x18\xeda\x94mg\x84l\
+\x97\x08\xdb.Q\xfc\x1fF\xc9\xf6\x02\xa9`\xfbs\xde\
+\xc9\xff\xca\x11\xcaD\x18\x82\x01\x98\xea\x16\xfb,x\xa6\
+\xcb\xd1_\xd0}\x06c\xec\x18Y\xc1\xc7\x10D\x8fa\
+\x08\x1d\x03a\x8c3\x22\x14\x8c\xd1.J\xf1[\x98\xb0\
+7\x09bo\x15\xb0\xe2\xb7^\xa8)\xfe\x9b\x11\xbe\x85\
+\x0f\xc1\x80\xd6\x0cp/\x00\xd5A6\xb5\x03\xed<\x9b\
+Rz6\xc6\xf2\xd9\x8c\xe1\x13\xb4&![{\x89\x15\
+\x04b\xd26\x10\x87\xdf\xd9)\xd9V,M\xdfV\xef\
+\xc5J\xb6vE\x7f\xc1\x80\xde\x0cp)\x00\x9e\xe0\xae\
+\xc3$4\xb0(\xae\xb0E\xf0\xa5:[o\x12\xb4\xb6\
+\xcf@\xa9\x80\xd8m\x08\xe1\xad6\x85\xaeo\xbc\xc0\xf5\
+\x7fZ\xfb\x10\xf6\x04\x03Z0\xc0\x8d\x00T\xd4\xed<\
+\x14K\xf1\xc5V\xfd\xd2\x8f5\x18 b\x7fA\x18\xaf\
+\x1fG\xc8\xba\xe7\x97\x96\xbc\xaf\xc5\xc0\x09\x1b\x82\x01-\
+\x180]\x00*\x82\xed_VP\xfc\x9b\x88\xe2K\xb4\
+\x08\x88w\x1b\x0c\xa3W`\xa3\xf1\x91\x90\xd7\xf9\x0c\xef\
+X\x05\xbe\xdcg\xc04\x01\xa8jh\x9b/\xcb\xf1o\
+2D\xce\xcd}\x9a\x93E\x88?F\x12Zs\xb0\xe4\
+X\xf3\xe4b\xbc3?9\x10Q\x9b\xcd\x80\xe1\x02P\
+\xb9\xae}\xae\x12Wnf\x88}\xcd\xec\xe0y\xf0\x8f\
+1Q(\xa1\xf7\x1e\x229\xef\x14B\xc0\xc3\x88\xe4\x17\
+\x06\xc3\x04\xe0\xdc\x86\xb6#\xfb\xa9r\x13\xa5hy~\
+Q\xac.Z\xd8'\xe8!\x04\xdfq\xda\xf4\xf7\xee\x5c\
+5w\xae\xac\xae\x97h%\x18\xc8\x8e\x01C\x04\xa0<\
+\xd0\xfaS\xca\xf0\x8f\xb2\x83\x9a/\xbd\xf1\xc7\xb0*\xb8\
+.\xe4+\x09\xe6K\xc4\x22N\xf3\x18\xd0U\x00\xca\xd7\
+\xc5N\xa72\xbd\x1fN\xe0\x9dd^\x88\x16\xf5L\xc8\
+ma\xaf\xe3\x16\x8b\xa2\x17\xb0-\xc2\x80n\x02\xe0\x09\
+Fo\x80\xe3\xb4\xb7[\x84\x07.a\xc2J\xe0\xda\x90\
+\xcfq\x0f\x97\xe0\x04\xa8\x9c`@s\x01H\xbc\xcf\xa7\
+D~\x941\xea\xc9\x09\x86L\x0e\xc2&Ig5V\
+\x97\xc0\xa1\x22\xf1\x11\x0ch\xcf\x80\xa6\x02P\xb5q\xd7\
+\xf1Jo\xbc\x81\x22z\xa4\xf6P\xf3\xd3\x22\xdcsx\
+\xaa\xa5\xc6uQ~F/\xa2\xd6\x9b\x01\xcd\x04\xa0\xaa\
+\xbe\xfdk\xb2,7\xc0A\x97iz\x83\xce+\xfb\x84\
+t\xc0^\xc0\x94\xbc\x8aY\x04k\x18\x03\x9a\x08\x80\xa7\
+>\xb6\x18+\xac\x9e\x22F\x0cC\x9eG\x8e\x88D*\
+\x9b\xab\x1dMy\x14\xb2\x08\xd5 \x06\xb2\x16\x00w\xb0\
+\xb5\x0a\x8e\xf1\xbeh\x10\xde\xfct#I\xd7\x87\xabK\
+\xee\xc8\xcf\xe0E\xd4z2\x90\x95\x00\x94\x07w\x9f\xc0\
+\xd8\xc0K\xb0\xe1w\x90\x9e \xf3\xdd6$3y\xa2\
+\xb9\xd6\xb5\x22\xdfy\x10\xf1k\xcf@\xc6\x02P\xb9\xae\
+\xdb\xa5\xc4\xf7\xbe\x04\x9bTGi\x0fKX\x1c\xc6\x00\
+c\x1b\xc2\xb5\xa5\x8b\x05+\x82\x01\xad\x19\xc8H\x00 \
+\x1b\x0f\xf6\x04\x22/\xc3}\xf73\xb5\x06$\xec\x8dd\
+\x00c\x16\x0a\xf9J\xcb\x057\x82\x01\xad\x19\xc8H\x00\
+<\xc1\xf6\x87\x19\x95\xbf\xa95\x18a/9\x03\x98\x91\
+?\x84j\x1d\xa7\x09~\x04\x03Z3\x90\xb6\x00T\xd6\
+\xb5.\x971~Rk \xc2\xdeX\x0c\x90w\xc25\
+\x8e/\x09\x8e\x04\x03Z3\x90\x96\x00\x9c\xbf!v\xc4\
+\xde\x01\xf6\x16fl\xa2\xd6@\x84\xbd\xd1\x19\x80\xb3\x15\
+\xffh\xf1\xb9\x8e\x16\x1c\x09\x06\xb4f -\x01(\xf3\
+\xc7\x1a1\xa2\x15Z\x83\x10\xf6\xc6f@\x08\x80\x98!\
+z1\xa0Z\x00\xca\x03;\xbeEY\xfcA\xbd\x80\x08\
+\xbbb\x05 \xe6\x80\xf1\x0c\xa8\x12\x80\x95\x9bY\xe1\xdf\
+\xbb\xda\xfe\x05\xa9\xb9]\xc6C\x14\x1e\xc5\x0a@\xcc\x01\
+\xbd\x18P%\x00\xe5\xf5\x91\xdb\xa8\x82n\xd2\x0b\x84\xb0\
++\x1e\x01\xc4\x1c0\x87\x81\x94\x020x\xbd\x17\xc5?\
+\x86\xe2\x179w\xce\x1f\xee\xdb\xef\xb1\xc2)F\xb1\x02\
+0\xe7\xcb\x91\x0f^S\x0a\x80;\x10[\x8d\x18\xbd\xc2\
+\x92d`\xf2)\xbc\xb1\xf8\x1d\xc6\xb6m6l{\xaf\
+\x9f\xa2\x8e\xf1\x13QGQ\xcfA\x1d\xf5\xd5\xa8\x03r\
+\xf5\xc3\xfd%F\xaa\xeb\xd1\xe4\xb8\xbdmJO\x5c\x99\
+L0\x99\x8c\x99}\x0a\x95\xe2\x93\xe32:\x1eQ6\
+\x07j\x0d\x9el\xe6E'!\x00\x96\x9c}\x96\x00=\
+\xa6\x00\x9c\xb3\xb6cJ\xaf\xado'|\x89R\x0a\x05\
+/\xd1\x02\xd4\x16B\x90\x1f\xd9m\xbf\x0b-\x9e\xfe\x9e\
+\x16\xb8\xa0<\x99\xb4\x0b\xed\x9a\x83\x98r2V\xe49\
+\x08K\xa7B\xd1\xd1/ha[\x8d\x0d\xa8#\xf0\xb7\
+f\x9f\xf385mE\x1b\xc1@:\x0c\x8c\xf9\xc5\xae\
+\x08\xb4~Wa\xf8\x17\xe9\x184\xa3-\x1c\x95\xed\x81\
+\xe5\xfc\xa3\x0a\x1d\xf7XK\xcd\xe47\x8c\xc0\x00\xe5\xcb\
+\xa0@i\xff\xf9\xf0d\xb4\x88!\x9d\xc5\x80\xe1?\x87\
+k\x9d\xa7\x18\x11\x97\xf0\x91_\x0c\x8c)\x00\xee\xba\xe8\
+\xdb\x08\xb3\xe3y\xa6\x04#\xb6\xe6\x90\xc2\xf1\xd7=\xbe\
+hJ\x87Y8\x13b\x80i\xff\x22\x8a\xd0\x12\xc00\
+Sk\x1c\x18\xe1\x97B5\xce\xb9Z\xdb\x15\xf6\x04\x03\
+\xa3\x0a@\xe5\xba\x1d\x1e9\x1eo\xe6\x97\x22\x12C\x04\
+\x7f'\xec-\x09\xf0\x84\xb1\xdc\x1f\xa9\x86\xa2\xeb+(\
+C\xf3\xb5\xc2\x05\x8f5\xc1\x96Z\xa7O+{\xc2\x8e\
+``\x88\x81Q\x05\xc0\xf3L\xeb\xd3\x8c\xe0e<R\
+\x95\xb8\x1dW<\xb9x\xd9\x86\xca\xe26\x1e\xf1%0\
+-\x0cv\x1e\xdb\x89\xf7^\x8c\x14\xbc\x02~\xc1\xa7g\
+\x83\x13\x13vg\xc8[*\xea*dC\xa2\xe8\x9b\x94\
+\x81Q\x05\xa0,\x10i\xc3\x0c\xcd\xe0\x8d7x\x17\xf9\
+Z\xc9$\xa7{\xed|\xbc\x977l\xc9\xf0$\x0eQ\
+\xbd\xd7\xd5\xfe]\xca\x94k2\xe5\xd3f\xc7\x975.\
+q\xfe\xc6\x0a\xf1\x0a\x8c\xd6b \xa9\x00\xb8\x83;O\
+Et\xe0\xf7\xbc\x85\xc2\x10\xfep\x9c\x9d\xba7/)\
+\xfd\x847l\xa9\xf0\xc0\x9b\x84\x82\xdd\xa8\xfd\x9a\x8c\x84\
+\x80\x14\x9c\x16\xf6N\xfbC*\x1f\xe2\xef\x82\x81t\x19\
+H.\x00\x81\xd8M\xf0\xee\xff\xb6t\x8d\xe9\xdd\xde\xce\
+ls\xb7\xd4\xcexIo?z\xdaO\x08\xc1\x1e\xd6\
+v\xbd\x8c\xd8\x0d\xf0z\xd5\xa6\xc6\xd7\x84Cl\x936\
+\x9d1\xa3SM[\xd1F0\x90\x0e\x03I\x05\x00\x96\
+\xff/\xc3r\xf5\xact\x0c\xe9\xdd\x16^\xf3\xad\x85*\
+9\x17\xea\xed\xc7(\xfb\xd5\xc1\x1d\x07\xef\xa4\xf1\x1b`\
+\x00\xc6L\xac\x02)\xd7\xea\xa1.\x80\xd7(\x5c\xc2O\
+~10B\x00\xe0\x95\xd6A\x8c\xf6\x9b\xf6Jm4\
+\xfaq\x81\xfdX\xad\x0e\xf6\xf04\xc4PB\xed8F\
+\xe9w \xbd\xda%\xc9q\xd9\xe7\x84k\xa6\xff\x85'\
+\xcc\x02K\xee00B\x00x|\xfd'av_\x93\
+\xaf\xf4\xbb\xb9C\xfb\xc8H\x16\x04\xf7\xcc\xee\xc5}\x97\
+\x22\xaa\xc0\x01#\xe98\xd8+h%v\xe9\xea\xd0R\
+Gc.\xc7-b3\x97\x81\x11\x02P\xe1\xdf\xb1R\
+A\xf1\xfb\xcd\x855\xdc;\xb6\x91*\xf1E\xe0iD\
+\x04\x96\x5ca`\x84\x00\x94\xd7E~E1\xfa\x06/\
+\x01\xc2-\xc4\xde\x16_i\x11/x\x04\x0e\xc1@.\
+10B\x00\xca\xea\x22/a\x8c\xce\xe6&H\xcc\x9e\
+\x0d\xfbJ\x17q\x83G\x00\x11\x0c\xe4\x10\x03#\x04\xc0\
+\xed\x8fE\x11\xa2\x0e^b\xb4a|C\xa3\xcf\xf9S\
+^\xf0\x08\x1c\x82\x81\x5cb`\x98\x00,j\xec,\xd9\
+\xbb\xbb+\xc6S\x80v\x22]\xba\xc5[\xf2[\x9e0\
+\x09,\x82\x81\x5ca`\x98\x00\xb8\xd7\xef=\x0a\x0dt\
+\xff\x83\xab\xe0$\xdby\xe1\xea\x19\xcfs\x85I\x80\x11\
+\x0c\xe4\x08\x03\xc3\x04\xa0<\xb8\xfd\x04J\xa57y\x8a\
+\xadp\xbc\xed\xe4\xcd\x0bg\xbc\xc6\x13&\x81E0\x90\
++\x0c\x0c_\x01px\x07\x80\x10\xe5\xc4f\xef!o\
+\xe5\x0a\xe1\x22\x0e\xc1\x00O\x0c\x0c\x13\x80\xaa\xba\xed\xee\
+8\x96B<\x01$vrF\xf3\x12\xc7\xab<a\x12\
+X\x04\x03\xb9\xc2\xc0\xf0\x15@}\xfb\xb9H\x91\x9f\xe3\
+)8\x89\x14T4y\xa7q\x9c\x98\x84'\xb6\x04\x16\
+\xc1@z\x0c\x0c\x13\x00(\xf9\xede\x0cq\x95a\x07\
+I\xd2\xf5\xe1\xea\x92;\xd2\x0bK\xb4\x16\x0c\x08\x06\xd4\
+00L\x00*\x1bbKd\x996\xa8\xe9hX\x1b\
+\xc6\x9a\xc3\xb5\xa5\xa2\x1e\xa1a\x84\x0bG\xf9\xc4\xc00\
+\x01(\xabo\x9b\x87\x15e3O\x04@\x12\x90\xf84\
+\xe28\xa8\xde\x8b{y\xc2%\xb0\x08\x06r\x81\x81a\
+\x020\x7f]\xebY\xfdq\xfc2o\x81\x81\x08\x5c\xd6\
+R#Rb\xf16.\x02\x8f\xf5\x19\x18&\x00\x15\xc1\
+\xd6/+\x14s\xf7\xce]\xa4\xc5\xb6\xfeD\x13\x11\xf0\
+\xc9\xc0p\x01h\xd8{\xb4\x22wkRMG\xebp\
+\x0bHA\xf5\x8b\xdei|\xedOh\x1d\xa4\xb0'\x18\
+0\x98\x81\xe1\x9b\x80\xeb\xba]r|o\xab\xc1\x18T\
+\xb9c\x88|x\x93\xa3\xe4\xe8\xb9s\xb1\xac\xaa\x83h\
+$\x18\x10\x0c\xa4d`dJ\xb0@k\x1f\x14\xa2(\
+L\xd9\xd3\x84\x06\x84\xa1'\x9ak]+Lp-\x5c\
+\x0a\x06r\x92\x81\x91\x02P\x17\xfb'\x14\xbe<\x92\xdb\
+h\x89\xf4K\xa8\x06t5\xb7\xf8\x040\xc1\x80\x85\x18\
+\x18\x99\x10\xc4\x1f\x0dA\xbd=7\xcf1H\x18\xdd\xda\
+\xe4s\xad\xe2\x19\xa3\xc0&\x18\xb0\x02\x03#S\x82\x05\
+\xa2\x8fR\xc6.\xe6\x1d<!\xf8\xeaf\xaf\xf3\x97\xbc\
+\xe3\x14\xf8\x04\x03<30r\x05\x10\x88\x5c\x075\x01\
+\xee\xe4\x19\xf4\x106\x91-\xc8\x0a\xa3$0\xf2\xcc\xc0\
+\xc8\xb4\xe0\xf5mg\xca\x8a\xf2\x0a\xcf\xa0\xf7\xc7\x06\x8f\
++\x1b\x0b\xc8\xa4ol\xf6N\x84Tf\xe2#\x18\x10\
+\x0c\xa4\xc3\xc0\x08\x01\xd8\xba\x95\xd9~\x12\x8d\xf5C6\
+^\xa8\xc3i\x8d\x0ff8b\x93\xd07\xb6x\x9d\x9b\
+\xac\x81X\xa0\x14\x0c\xf0\xc1@\xd2\xd2`\x9e\xba\xd6m\
+\x0c\xe33\xf8\x80\xa8\x1e\x85\x84\xa4\x9f4\xd5\x94\xdc\xa8\
+\xbe\x87h)\x18\xc8o\x06\x92\x0b\x80\xbf\xfdn\x86\xe4\
+k\xadH\x0d\xc1\xf8o6l\xbfU\x9c\x1a\xb4\xe2\xe8\
+\x09\xccF3\x90T\x00\xe6\x05w\x9f=@\xfb^2\
+\x1a\x8c\x96\xfe\xe0\xfe\xc0\xf3\x05\xe3\xa5[E>A-\
+Y\x15\xb6r\x8d\x81\xa4\x02\x90\x08\xd2\xed\x8f|\x0c\xff\
+\xcc\xb4z\xc0\xf0\xba\xf0\xc1\xc9\xc8q\x1b\x5c'n\xb7\
+z,\x02\xbf`@k\x06\xc6\x10\x80\xb6\xfb\x10R\xa0\
+j\xad\xf5?\x0c\x93.\x89\xa0\x87\xb0l{\xa8\xa9v\
+\xda\x7f\xac\x1f\x91\x88@0\xa0\x0d\x03\xa3\x0a@.<\
+\x06$\xa3\x08^\x1b\xaeA\x84<\x18\xf2:\xff\xaa\x0d\
+\x85\xc2\x8a`\xc0\xba\x0c\x8c*\x00\x89\x90\xca\xfc\xb1W\
+1\xa2\xa7Y7\xbc\xd1\x91\xc3\x85\xa7\xa0\xddF\x1el\
+\xac.\xd9\x96\x8b\xf1\x89\x98\x04\x03j\x18\x18S\x00\xca\
+\x83;\x16Q\x1a_\xaf\xc6\x90U\xdb`LB\x92\x84\
+V7.u\xac\xb3j\x0c\x02\xb7` S\x06\xc6\x14\
+\x80\x84Qw \xf22b\xe8\xacL\x1dX\xa6\x1fF\
+\xefJ\x8c\xae>|v\xe9\xea5_\xc1q\xcb\xe0\x16\
+@\x05\x03Y0\x90R\x00\xaa\x82\xd1\x05q\xca6f\
+\xe1\xc3R]\xe1\xf8\xe3n\x84\xd9j\x86\xc7\xad\x0ey\
+\xa7\xfe\xdbR\xe0\x05X\xc1@\x9a\x0c\xa4\x14\x80}\xab\
+\x80h\x0bbln\x9a\xb6-\xdf<\x91\x80\x04ND\
+\xae\x0e\xd58\xffh\xf9`D\x00\x82\x81$\x0c\xa8\x12\
+\x80\xaa\x86\xb6\xf9qYy!_\x19d\x885A\x85\
+\xa2\xd5\xcd\xde\xe9\x1b\xf2\x95\x03\x11wn2\xa0J\x00\
+\x06W\x01u\xb1&\x84iyn\xd2\xa0.*\xd80\
+\xfc+\xbc\x15yd2v\xae\x86\x83E\x8a\xba^\xa2\
+\x95`\x80_\x06T\x0b\xc0\xbc\xe0\x8e\xb2\x01\x1a\x0f\xf3\
+\x1b\x8aq\xc8 _\xc2NB\xd0\x83\x14\x17\xde\x0b\xfb\
+\x04{\x8c\xf3,<\x09\x06\xb4e@\xb5\x00$\xdc\x96\
+\xd7G~@\x15t\x97\xb6\x10\xack\x0d\xee\x1btS\
+l\xbb\xf7\x10\xfb\xb4\xfb\x9e\x5c\x8cwZ7\x12\x81<\
+_\x19HK\x00\x12$\x95\xf9\xdb\x82\x18)\xd5\xf9J\
+X\xb2\xb81f\xfd\x08\xa3{\x8b\xe4I\xf7m\xba`\
+bLp#\x18\xb0\x0a\x03i\x0b@u\x90M\xddI\
+c\xaf\xc3\x91\xda\xc3\xad\x12\xa4Q8\x19!2\xec\x93\
+\xdc7\x8e\x15\xff\x5cd(2\x8au\xe1'\x1b\x06\xd2\
+\x16\x80}\x8f\x02\xb1\x0a\xaa\xd0\xc6l\x1c\xe7r_\x8c\
+Q\x0f&\xe8\xd6\xe6j\xd7\xdd\xb9\x1c\xa7\x88\xcd\xfa\x0c\
+d$\x00\x89\xb0+\x03\xd1\xebe\xc6~b}\x0a\xf4\
+\x8b@$'\xd1\x8f[aY\x1b\x062\x16\x80\x84{\
+w]\xebz\x84\xf1\x22m\xa0\xe4\xb0\x15\x8c\x9f\xa32\
+\xbdu\xeb\xb2\xd2\xd7s8J\x11\x9a\x05\x19\xc8J\x00\
+\xf6\x89@\xa4\x1e6\xc0\x96Z0v\xe3!CU\xa3\
+\xa9h\xc6\x8dp\x86\xa0\xcbx\xe7\xc2\xa3``$\x03\
+Y\x0b\xc0>\x11\x88=\x05\x9b_\x17\x0a\x82S3\x90\
+(r\x8a\x89\xed\xaa\xb0w\xda\x96\xd4\xadE\x0b\xc1\x80\
+\xbe\x0ch\x22\x00\x83\x22\xe0o\xfd\x0dB\xf8\x12}\xe1\
+\xe6\x90u\x89\xfd4\x5c]zC\x0eE$B\xb1 \
+\x03\x9a\x09\xc0g+\x81\x07a%\xf0-\x0b\xf2`\x0a\
+d\x86\xa5W\x0a\xc6\xd9VnY8\xf5\x1dS\x00\x08\
+\xa7y\xcf\x80\xa6\x020(\x02\x81\xc8=\x90?\xe0{\
+y\xcf\xacJ\x02\xe0\xb6!\x93\x10[\xd9\xecs=\xa4\
+\xb2\x8bh&\x18\xd0\x8c\x01\xcd\x05 \x81\xcc\x13\xdcq\
+\x15\xa3\xf1\x074C\x99\x0f\x86\x18~:\x5c\xeb\x5c\x9e\
+\x0f\xa1\x8a\x18\xf9a@\x17\x01H\x84W\x1e\xdc~\x02\
+S\xc8\x03V\xac0d\xd6\xf00$\xd5\xb7\xd4\x94x\
+\xcd\xf2/\xfc\xe6\x1f\x03\xba\x09\xc0\x10\x95e\xfe\xd6;\
+\xe0\xd2\xcc\x0f\xf3\x8f\xda\x0c#\x863\x03!\xafc!\
+\x86G\x83\x0c-\x88n\x82\x01\xd5\x0c\xe8.\x00\x09$\
+\x89\x84\x22\xb2B\x1fd\x8c\xcdR\x8d,\x8f\x1b\xc2\xab\
+\xc2\xa6\xb3\x1c%\x0bW\xcd\xc5}yL\x83\x08\xfd\x00\
+\x06\x12\x85{\xd7tuN\xee\xdc\xdb7%^,\x15\
+\xa0\x1eZ\xa8 \xa5\xc0N\x0a\x0b\x15e \x8e$\xa5\
+\xdfN\x8b\xfb\xb1\xd2\xdb_<i\xdcn\xb9\xb7xw\
+\xaa\xbc\x15\x86\x08@\x22\x8ee\x9b\xd9\xa4Xg\xf4\x01\
+\xc6\xd0EbdS3\xc00z\xe5\xb0\x82q\x0b\x1f\
+_4\xa5#u\xeb\xec[x\xd6\xef8\x06\xcbr\x05\
+\x93\xd9IHB\x13\x10\x85\xff\xb4\xf8`,S\x86;\
+\x89\x84:%D\xbbd\x8a\xbal\x8c}\xa0`\xf2>\
+\xebw\xbc\x1f\xfe\xba\xb8F\x9d\x8c\xe6\xc1\xf1P\xe2\xe7\
+)\x0a\xfb\x12\xc1\xe8X\x8a\xa4#0\xa3\xc5\xe9\x0e\x09\
+T\xce\xde\x8b\x10\xfb'\x22\xe8]b\xb3\xbf\x86\x06\xf0\
+\xb3\xfb\x17\xc71L\x00\x86\x80'.\x12)2\xbd\x0d\
+.\xcc\x9c\x92n0y\xd7\x9e\xe1?O`\x13\x17\xe8\
+y\xc5\xb8\x22\xd8~\xb9\xa2(\x97@\x22\xd49\xa6\xf0\
+\x0b\xd9\x98\xe1\x16e\x90HR0\xb4x\xfa{\xa6`\
+\xe0\xc8i\xe5\xba\x1d\x1ee`\xe0\x16=\xf7\xce0E\
+O\xb2\xb8\xf3\x9a\x84\xf8\x1a.\x00C\x5cW\xf8?]\
+)3|+<\xebN\xe1\x88\x7f\xee\xa0\x80\xfao\x86\
+W\x84\xe7h\x0d\xcc\x1d\xdcy*b\x03\x0f\xc2+\xdb\
+\x93\xb4\xb6\x9d\xa9=\xd8\xf4\xa8\x9fH\x8a\xae\xdf\xe4=\
+\xe8\x83LmX\xb9\x9f\xbb\xbe\xedGHQ~jD\
+\x0c\xb02\xf8\x88H\xd4k\x9a\x00$\x82L\xe4\x16\xe8\
+\xa0\xb1[)bW\x19\x11\xb4e}`rw\xd8\xe7\
+\xb8N+\xfc<\x17|I\x9c\x8b\x80%\xeb\x8fZ|\
+\xae\xbc\xca<e\xc6\x15{ \xfaW\xa6\x0a\xc0\xd0\x84\
+\xf6\xf8\xa3_\x85q\xbf\x8924_\xabI\x9ekv\
+\x08f\xcb\x9b}\xa5Og\x1bW\xe2\x97\x9f)\xf1\x97\
+\x81o{\xb6\xb6t\xedO\xb1?|\x81\xb3VW\x1f\
+\x1c\x19\xf7\x04\xdb\xeffT\xbe\xd6PH\x98\xbd\xcd\x85\
+\x00\x0c\x05]U\x1fu+\x94]#\x84`\xe44\x80\
+/\xec\xc08&\xcdy\xbe\xc6\xf1v6\x93\xa4\x0c*\
+=\xc1o\xac%*=\xc1\x86\xf1\xcbv\xb9\xbf\xb6q\
+\xf9\xe1\x91lb\xb6B_\x10\x80\x87A\x00\xbei$\
+\xd6\xc1\xc45F:T\xebK\x08Ar\xa6\x18f\xaf\
+\xb7x]s \x07\x03U\xcb\xe5\xfe\xed<\x81\x88\x17\
+\xbeT\x81L\xfa\x9a\xd7\x87m\x0b\xd7\x94ZB\xb0\xb2\
+\xe1H\x08@\x12\xf6\x84\x10$\x9bR\xd2\xe3\xe1\x9a\x92\
+\x8b3\x99lVM\xe0\x02\xd7\xa7\x7f\x15\xf2\xce\xb82\
+\x93\x98\xad\xd2G\x08\xc0\x18#5/\xb8\xfb\xec~\xa5\
+\xffJX\x06\x8bc\xb2\x09\x9e\x88T\x13\xf6\x96\xa4\xfd\
+K\x0e{-{\xa0\xca\xd1$\xab|)\xf6\xc7\xc9\x08\
+]\xd9\xe2=\xf8A+bW\x83Y\x08\x80\x0a\x96\xce\
+\xf1w\xfeo/\xea\xba\x12\x9e[\x0c}VR\x01\xcd\
+\xd0&\xf0\x0c\xffZ\xa8\xd6ur:N\xcf\xf5\xc7\xbe\
+\xd4\x8b\xe8[\xe9\xf4\xe1\xad\xadd\x9bpL\xd3\xd2I\
+\x7f\xe7\x0d\x97\x16x\x84\x00\xa4\xc1\xe2\xfc`\x973\x8e\
+;\xafd2\xba\x12N\xccMK\xa3k\x0e5%\x17\
+\x86k\x1ck\xd5\x064/\xd8\x01\x95\x9dz-]\xd9\
+\x09R\xd1o\x0c\xd5\x94\x9e\xaf6f+\xb5\x13\x02\x90\
+\xc1h%\xceF\xdf\xde\xd6~%C\xca\x95\xf0\xab\xf8\
+\xc5\x0cLX\xb6\x0b\xac\x82\xde\x0c\xd5\xb8T\x1f\xe2\xf1\
+\x04\xda`\x03PI\xfb\xb1\x81;\x82\xb0}E\xd87\
+\xfd\x09\xeepe\x09H\x08@\x96\x04\xba\xfd\xb1ep\
+\xb0\x01\x1e\x0f\xe8iY\x9a\xb2Lw\x1b\x22_o\xac\
+q<\xa9\x06pY]d\x05\xbc\xf6yLM[\x9e\
+\xdb\xc0A\xa1\xe8\xc4\x83\x1dGm:\x03w\xf2\x8c3\
+]lB\x00\xd2el\x94\xf6\x9e\x86X%\x8d\x83\x10\
+`\xba@#\x93\xdc\x9a\x81c\xd4\x7f\x0d\xf9\x9c\xc7\xab\
+\x01\x98+\x02\x90\x88UB\xd2O\x9ajJnT\x13\
+\xb7U\xda\x08\x01\xd0x\xa4\xe67\xb4~\xa5_\xb6A\
+~Be\x85\xc6\xa6\xb92'a\xe9\x92&_\xc9\xa3\
+\xa9@\xe5\x92\x00\xc0u\xe9\xf882\xe1\xb0\x5c*\xbf\
+&\x04 \xd5\x0c\xce\xf0\xef\xee\xf5{\x8fb\xf1\x9e\xab\
+0c+34\xc1w7\x8c\xdf\x0d\xfb\x9c\xff\x93\x0a\
+d.\x09\xc0\xe0*\x00\xb3\xfb\x9a|\xa5\xdfM\x15\xb7\
+U\xfe.\x04@\xe7\x91\xaa|\xeac\x17-(X\xa9\
+ i%\xdc\xab\x9e\xa8\xb3;C\xcdK\x8c\x9c\xdeT\
+\xeb\xf8\xfdXNsM\x00\x12\xb1\x16\x17\x92\xd9\xcf.\
+r|h(\xd9:9\x13\x02\xa0\x13\xb1\x07\x9a\x85\x1b\
+\x88\x13\xf7\xe0\xc8\xd5\x94\xa2\x9b\x18\xc3\x05\x06\xb9\xd5\xd7\
+\x0dF?\x0f\xfb\x5c\xdf\xcf7\x01\x80\x0cS\xbfn\xa9\
+-\xbd\x5c_r\x8d\xb1.\x04\xc0\x18\x9e\xff\xebe\xc1\
+\xc6\xf6\xd2\xee>z3b\xf4\x0a\x83]\xeb\xe0\x0e\x7f\
+\x1c\xaeq\x8e\x99n-\x17W\x00\x09\x22\x0b\xc6K'\
+\xbd\xb8\xb0\xe4M\x1dH5\xd4\xa4\x10\x00C\xe9\xfe\xdc\
+YYp\xc7\x1c\xa2\xc4o\x86\x03E\x9a'\xdd02\
+\xa4\x022\xeek/z\xa7\xbc<\x9a\xcf\x5c\x15\x00X\
+\xc5\x05[j\x9d>#\xb9\xd6\xc3\x97\x10\x00=XM\
+\xc3\xa6\xa7>\xb6\x98*\xe8n8GpD\x1a\xdd\xb8\
+ij\xc3\xf8\x86F\x9fs\xd4l2\xb9*\x00\x89\x01\
+\xb034wK\xad\xeb%n\x06#\x03 B\x002\
+ M\xeb.\xe7\xac\xed\x98\xd2Gz\xd7X\xb1\xdaq\
+\xaa\xd4a\xb9,\x00pI\xac1\xe4+\xad\xd2z>\
+\x18iO\x08\x80\x91l\xa7\xf0edn6\xad\xc2\x86\
+CA{\xe0P\xd0\xe4|{\x04\x18\x8a\xd7N\xf0\xc2\
+-^\xe7&\xad\xf84\xda\x8e\x10\x00\xa3\x19O%\x02\
+\xcf\xb4Va\x09?\x02\x094\x0e\xe3\x0c\xda\xa8pl\
+\xc8\xf6\xe5\xc6\x9a\x19o$k\x90\xcb+\x80D\xbc\x98\
+\x91?\x84j\x1d\x96=\x06\xee\x09F #\x90\xb1\xb7\
+\x5c\xb9\xcd\x08\xc4\xcb\x17n^p\xe7\xb1q\x16\xf7\xc3\
+\xeb\xa6\xe3x\xc14\x16\x0e\x1ba\x175zK\x9f\xca\
+G\x01H\xc4<V\xfc\xbc\x8f_\x99?\xf2\xb0\xd1\xd7\
+\xdc\x85\x00\xa8\x98\x15\x89\x93\x84x\xa0;\x04\x17\x8d\x0e\
+U\xd1\xdc\xd4&\x92\xc4nj\xaa.\xbd=_\x05\x00\
+\xf6n\xe0T\xa4+\xe5\xa9HS\x07i\x14\xe7B\x00\
+x\x1c\x95\xcf0\x95\x05#s\x10\xc3a8N\xcc\xf7\
+\x09B\xcc~\x13\xf6\x95^\x96\xb7\x02\x00\x81[5s\
+\x90\x10\x00\x8e\x05 \x01\xcd\x8c\xbc\xediS\xc2Xs\
+\xb8\xb6\xb4\x22\xbf\x05\x00m\x0fW;g\xc2\xa6hF\
+\x89S\xd3\xe6\x5c\xa3\x0eB\x004\x22RO3\x95\xeb\
+c\x17\xc9\x03\x94\xdbd\x14\xf0\x0c\xf9OH\x12\x924\
+1J\xaeo\x02\xee?\xee\xa9\xceD\xe89G2\xb5\
+-\x04 S\xe6\x0c\xee\xc7sf]Bp[\xb3\xd7\
+\xe9\xc8\xe7\x15@\x22v\x86I\xe7x\xb9p\xe6\x0b\xcb\
+&\xef6xzd\xecN\x08@\xc6\xd4\x19\xdb\xf1\xdc\
+\xb5mG\xf6J\xca?\x8d\xf5\xaa\xce\x1b\x1c\x88\xe9\x81\
+\x031I\xab\xfa\xe6\xd3\x0a`\x90-\x8d\xcb\xa9\xa9\x1b\
+\x81\xcc[\x09\x01\xc8\x9c;\xc3{\x96\xd5E\x03\xbc\xa6\
+(\x87\xc3@\x04\x9e\x7f\xe1\xa5\xc5\xf0O\xde\x09\x00\x84\
+_\xcc\xd0\xacgk]\x1f\x1b>A2p(\x04 \
+\x03\xd2\xcc\xea\xe2\x0e\xb6V!\x8a_4\xcb\xffX~\
+\xa7\x12gq\xbd\x17w\x09\x01\x00\x06(y$|\x81\
+\xe3\x1b<\x8e\xd3\x88\xf1\x11\xe7\x00\xac0L\x9fct\
+\xfb\xa3Qx\xdaL\xfa\xbcmf$\x85\xa4\xcf\xb5\xd9\
+;\x0b\xb0\x0d\xff\x94\x07#+ \x07\x82\xe5\x93\x82\xa6\
+\xcb\xad}|\xe1\x97\xb6,\x9c\xfaN\xba\xfd\x8cn/\
+V\x00F3\x9e\xa5?w Z\x87\x18\xab\xc9\xd2\x8c\
+\xe6\xdd'M\x99\xe8\xd8PY\xdc&\x04`\x1f\x03\x8c\
+\x91\xba\x96Z\xc7\x05\x9a\x13\xad\xb1A!\x00\x1a\x13\xaa\
+\xb7\xb9r\x7f\xfb\x15\x14\xc9\xab\xf5\xf6\x93\xae}x\x04\
+(\x82G\x80^!\x00\x9f3`c\xd2Y\x8d\xb5%\
+\xdb\xd2\xe5\xd2\xc8\xf6B\x00\x8cd[\x03_U\xc1\xe8\
+\x828e\x1b50\xa5\x99\x09\xc8\x99/\xb7\xf8\x9c\xf6\
+d\x06My\x04\xc0x+\xfc\x04\xcf\xd5,\xc0\x0c\x0d\
+\xa5\xba*\x9d\xa1YM\xbb\x09\x01\xd0\x94N\xfd\x8dU\
+\xae\xdb\xe1\x91\xe3\xf1f\xfd=\xa9\xf7@\x10\xda\xdd\x5c\
+\xe3\x9a\xca\x8b\x00\xd8ld\xa9,\xd3\x06\xf5\x11\xe8\xd8\
+R\xb2\x9d\x17\xae\x9e\xf1\xbc\x8e\x1e\xb22m\x8e\x00\xb0\
+\x1e8<&>\x990PQ\x17;M\xc1\xf4\xd5L\
+\xfa\xea\xd8\xe7\x93p\x8d\xebp^\x04\x80!\xc9\x0b9\
+\x17\x97\xf2\xf0\xca\x14\xeeq\xfc.T[z\xa6\x8e\xdc\
+geZ\x08@V\xf4\x19\xdfy^C\xfby\x03\xb2\
+\xccU\x02\x0a8\x00\xf0\xb7f\x9f3\xe9\xd5es\x1e\
+\x01\xa4\x15vJ\xb7\xc71\x0b\x19?B#=b\x82\
+\x97\x85\xbc\xcegx\xc0r \x06!\x00<\x8e\xca\x18\
+\x98<\x81\xe8e\x90'`\x0dO\xb0\xc7J\x8aa\x86\
+\x00`B\xae\x0cy\x1d\xbf\xf2\xf8#\xef\xc2\xc9\xa4c\
+\xcc\xe6*\x9dRjFc\x15\x02`4\xe3Y\xfas\
+\x07\xdaoBL\xbe-K3\x9av\x1f\xeb\x95\x97\x19\
+\x02@$\xf2\xfd\xe6j\xc7\xcf\xcb\xeb#?\x80\x84\xab\
+wi\x1al\x86\xc6\x86D)\xc3\xee\xbau\x13\x02\xa0\
+\x1b\xb5\xfa\x18\x86r\xdb\x0fA\xb9\xed+\xf5\xb1\x9e\xb1\
+\xd5\xdb`\x0f\xe0\x16^\xf6\x00\xe0<\xfe\xcda\x9f\xe3\
+\xc7\x17\xadg\xd3>\x1d\x88\xee\xc88*\x0d;\xc2~\
+\xc4\xbf\xe1\xbe\xc4L\x0dMjbJ\x08\x80&4\x1a\
+g\x84\xcb[\x81\x05\xb6\x0b\xc3\x8bg\xac\xe5E\x00`\
+O\xe2\x0e\xd8\x93\xb8>\x81\xc7]\x17}\x0a\x12\xf7]\
+h\xdc\x08\x8d\xee\x09j@\xfc\xb0\xc5\xe7\xe2bE2\
+\x84R\x08\x00\x0f3C-\x06XkC\x96\xa0.\xcc\
+\xf0x\xb5]\x8ch\xc7\x08:\xa5\xc5\xeb\xfa3/\x02\
+\x80\x88\xf4\xcb\xb0\xb7\xe4\xea\x04\x9e\xca\xba\xb63e\xac\
+\xbcb\x04\x0f)}\x10\xd2\xe1\x9cX2s\xed|\xbc\
+7e[\x83\x1a\x08\x010\x88h-\xdcT\xd6G\x17\
+\xca\x0a{V\x0b[Z\xda\x18\xa7\x8c\x9f:\xda\x1dx\
+3\xf6\x00\x0e\xac\xdd\xe7\x09\xb46C%\x1f\x8f\x961\
+gj\x8b`\x06\xab\x93\xd2\xc1\xd5\x09\x0f\x1fn\x04\xa0\
+\xa2a\xef\xd1\x12\xa5\xa5\x05H\x8an\xf4\x16\xbf\xcb\x03\
+9\xbcap\xfb[\x7f\x03\x17\xce/\xe1\x0a\x17\xc3\xb1\
+p\xad\xd39\x1a&3\x04\x00c\xb26\xe4s\xfcw\
+\xd9_\xd1\xb0\xe3|E\x8eo\xe0\x81785\xc9l\
+\xd4>\xb3\xa9v\xda\x7fx\xc0\xc3\x85\x00\xb8\xfd\x9f\xc2\
+m1\xb2b\x88\x10\x18\xc0=H\xa1k\x0bl\xc5?\
+\xde\xec\x9d8\xe2\x86\x19\x0f\xc4\x99\x81\xc1S\x17\x8d1\
+\xccJ\xcc\xf0=\xaaO\x8c\x9f\x0b\xfb\x9c\x0bx\x12\x00\
+8\x06\xbc\x01r\x14.\xde\x1f\x93\xa7\xae\xf5\x0d\xf8\xf2\
+\x9d\xc8\x03w\x90\x16\xfb\xe1\x90\xcf\xf5-\x1e\xb0\x98.\
+\x00\xee@\xec.8\xb5\xf5\x83Q\xc8\xe8\x83C\x14\xb7\
+\xc3!\x8a\x9f\xf0@\x96\x99\x18x\xbd\x04$\xd9\xed\xdf\
+nZ2\xfd\x01\x9e\x04\x00\xbe`P\xb2\xcb5\xacd\
+W\xa5?z\xa9\x8c\xd8\xaf\xcd\x1c\xc3\xfd}\xdb\x8a\x0a\
+\xfe\xb7q\xc1\xb4\xff3\x1b\x8f9\x95\x81>;\x0a\x5c\
+\x1dd\x13;h,J\x11K\x9aNj\x88\x1c\xc8\xb5\
+\xf6\x01<;\xdd\xc2\xebi*\xbd\x071\xc1\xd3.\x1a\
+\xfb\x80\xc7<\x00\xb8\xc0~lh\xf1\xf4\xf7x\x12\x00\
+\xe0i[\xb8\xa6\xf4\xac\x031\xc1^\xc0'\xb0\x17\xc0\
+G\xc5%F\x9e\x0e\xd7:\x96\xeb=wR\xd97U\
+\x00\xe0\xa4\xd6\xc5pR\xeb\xd1T \xff\xfbh\xc0\xf0\
+\x0bD\xa2\xb74yK_W\xdb'\x17\xdaA*\xb0\
+_\xc0\xa3\xe3wy\x8be\xacl\xc0CX\xcd\xd8\x03\
+\x80\xc7\xa4\xd7[|\xa5_9\x90\xaf\xb2@\xe4:H\
+Zv'/<J\x8c\x9c\xdeT\xeb\xf8\xbd\x99xL\
+\x15\x80Ls\xdc\xc1\xb3\xdc\x03v[\xf1\x1d\x8dK&\
+D\xcc$\xcf\x08\xdf\x15\xc1\xd6/+\x14\xbff\x84\xaf\
+t}\xa8y\x965C\x00@\x98\xde\x834\xe5\xc7\x1e\
+\x18\xcf\x82\x8d\xed\xc5==J\x04\x04b\xcc\x15g\xba\
+<d\xdc>\xc5\xfeI\xc6v\xd3\xe8h\xaa\x00\xc0\xb9\
+\xf6\x8f\xe0\x95\xcd\xac4\xf0\xfe\xb7)C8\x0e%\xa9\
+\xee\x9c\xb5\xcby\xe7\x9a+pO&6x\xef\xb3 \
+\xb8gv7\xeb\xdd\x08\x9bZ#&3\x0f\xd8%\x9b\
+}Q\xd3\xd2\xe9c\xbe\x964C\x00\x80\x9bQo'\
+\x96\xf9[\xef\xc0\x08\xff\x90\x07\xfe\x12\x18\x98$\xcdo\
+\xa9.1-\xcf\xa3y\x02\x00\x87Z \xbd\x95\x92\xed\
+@\x80\x80\xec\xc0\x12\xba#\xec-\xfdE\xb6\xb6x\xea\
+\xbf0\xd8yl'\xed\xd9\x84\x11=\x82'\x5cCX\
+\xe0T[;\x9cjK\xf9F\xc2\x0c\x01`\x88\xedh\
+\xa9)\x9d\x91\x8c\xb7\x05M\xed\xa5\xdd\xbb\xe4Oy\xe1\
+\x14x|\x05x<\xdb,<\xa6\x09\xc0\xf9\x1bbG\
+t\xf6S\xd8\xd8\xd2\xe6\x03\xa7\xe3\x12K\xbb_O%\
+\xf65\xf5\xde\xe9\xdc\x0cp&\xd1\xcdkh;1.\
++\x1by.\x0c\xca$tOK\xb5\xeb\xdaT\xf1\x99\
+!\x00c\xd5)H\xe0u\xd7\xb5=\x88\xb0\xc2\xc5k\
+\xb8A\xfe\x88T\x03'\x17\x03\xa9\xb8\xd4\xe3\xef\xa6\x09\
+\xc0\x5c\x7f\xecK\x04\xd1\xb7\xf4\x08\x0a\x9eM\x9f\xc46\
+\xb2\xa6y\x89\x83\xb7\xc4\x19)\xc3\xad\x0a\xb6]\xa2P\
+\xe5gP`nJ\xca\xc6&6P\xfb\x1a\xcb$\x01\
+\x18\x80\x8b7\x85\xa3\xd1\x938t\xa6\xc8\xdd\xa3\xbe\xb9\
+0\x9aV8\xf7\xf2\x16\x1c\x5c2\xe5\x8c\x82i\x02\xe0\
+\x0e\xee<\x15\xd1\x01]w@\x13\xcb+bG\x8f\x17\
+\x958\x1b6\x9d\x81;\x8d\x1e\xd8t\xfc\xed{\xde\xef\
+\xfe\x19\xd4\x97:?\x9d~f\xb4M\xf6\x9e}4\x1c\
+f\x08\x00A\x846\xd78\xa4\xb1\xb8\xf1\x04\x22O0\
+\x86.2\x83\xbfd>%b\xbb\xa2\xc9;\xc3\xf0<\
+\x0f\xa6\x09\xc0\xbc`G\xd9\x00\xed\x0d\x1b1\x00\x89\xe3\
+\x97\xb0\x91\xd6 IR}\xd3\xd2\x19\x0d\xc9*\xd8\x18\
+\x81#\x99\x8f\x15\x8f\xb1q\xff\x1e\x1f\x83\x22\x12\xf8n\
+x\xdeO\x9aX\xd3,l\xa3\xf9\xb5cz\xc1\x16\xdf\
+\xc1ujp\x99!\x00\x09\x5c\x90\xa5\xd8\x06Y\x8aG\
+\xddcr\xfbw\x9c\x8cP<\xe9\x05&5qi\xdd\
+\x06\xe6\xe4\xbf\xa0\xba\xd2\x17\xb4\xb6\x9b\xca\x9ei\x02P\
+\xd5\xd06\x1f\x9es_H\x05P\xeb\xbf\x83\x18t\x12\
+\x8a\xea\xed6\xd2\xf0\xa2\xa9\xbb\xaf\xbb\xce@\xb4o9\
+\x9ct\xbc\x10\x0ag\x14i\x1d\xa7^\xf6\xe0\xd7\xf5}\
+\xf8u=J\xad}\xb3\x04\xe0\xd8I\xceq\x0f\xcc\xc7\
+\xfdc\xe1t\x07Z7\xf0\xb4\xe2\x82G\x81k\xe1Q\
+\xe0\x1e\xb5\xdcj\xd1\xce4\x01\xf0\xd4\xb7.f\x0a^\
+\xa7E\x10\x99\xda\x807\x08}\x08Ko\xc0\xfa\xe0M\
+\x09\xe17\xa5\x22\xf4\xc6\x8b\x0bK\xde\xcc\xd4^\xaa~\
+\x83\x8f=\xa8\xffT\xc4\xd02\x98x'\xa5j\xcf\xe3\
+\xdf\xe1D\xe6r\xb8\xcd\xf6\xb4Zlf\x09\xc0h\xa5\
+\xca\xf6\xc7]U\xd7\xfe\xb58\x96\xb7\xaa\x8dE\xefv\
+\x98\xa0\x9d'\xf49g\xdes\x11\xee\xd6\xdb\xd7\x90}\
+\xd3\x04\xa0*\x10\xad\x8d3\xc6]\xa2D\x86\x08\xe4\x92\
+do\xc2\x17\xf4MRH\xde\xa4\x0a\xeb\xc0\x84u\x14\
+\xd8\xa4\x0eY.\xd8c\xa3;;\xe6t\xa3\x8eU\x17\
+\xcf\xeaK6H\x97?\xc2\x8a\xb6O\xe9\x9e\xd4o\xb3\
+M\xb2\xcb\x1dG\x0fP\x0a_x|*\x91\xd0W\x19\
+E\xa3nL\x195\xe0\xd9\xf8!\x08\x87\x9bk\x9ci\
+]\xab5K\x00\x0e-tNy|\x11\xeeH\x15/\
+\xbc\x8a\xde\x04\x8f\x87\xe7\xa5jg\xd4\xdf1\x96n\x0f\
+\xf9Jn2\xca\x9fi\x02\x90\xee1`\xa3\x08Q\xeb\
+gp\xf5\x00\x09\x1e\x10\xa5\x1d\xb0,.\xa0\x98NB\
+\x8c\x1c\x04\xdb\x0d\x96x\x8eW\x1b\xe7\xfe\xed\x0a\xed\xec\
+\xec\xcdKJ\xd3J\xaea\x96\x00\xc0\x0a\xa0\x04\xf6\x00\
+\xdaS\xc5\xc9\xdb* Qde\xe28i\xe6\xa6\x85\
+3ZSa\xd7\xe2\xef\xa6\x09@E\x1d\xbc\xee\xc2\x0a\
+\xdco\x17\x1f+0\x00\xe7,\x1e\x0d\xd5:\xd3\xceE\
+`\x96\x00\xd8\xec\x93J\xd5\x1e\x15\xe7m\x15\x908\xea\
+\x0e\x95\x96\xbem\xc4\xbc\x10\x02`\x04\xcb\x16\xf7A\x08\
+\xea\xb1O\x98|\xec\xe6s\xc6\x7f\x92n(f\x09\x00\
+&\x853C\xde\xa9\xffV\x83\xb7\xaa.\x02{\x01\x88\
+\x9b\xbd\x80\x04f\xc96\xe1\x98\xa6\xa5\x93\xfe\xae\x06\x7f\
+6m\x84\x00d\xc3^\x9e\xf4\x85\xcb5\xff\x0f.\xd7\
+dT\xe2\xdb,\x01\x187q\xfc\x11/\x9c;\xf9#\
+\xb5C\xe4\x0e|\x0a{\x01\x84\x9b\xbd\x00\xc2\xd0\x13\xcd\
+\xb5\xae\x15j\xf1g\xda\xce<\x01\xe0(MS\xa6\xe4\
+\xe5E?\xcc~\x13\xf6\x95^\x96i\xacf\x09\xc0\x04\
+b;z\x93w\xc6?\xd4\xe2\x9e\x17\xdc}\xf6\x00\xed\
+{Im{#\xda\x15\xda\xec_\xdd\xbct\xfa\x9f\xf4\
+\xf4e\x9a\x00\x18q\x12PO\xe2\xf2\xc1v\xe2Z\xed\
+1\x93\x9c'\xa6z\x9f>\x16\x17f\x09\x80\xda\xa3\xca\
+\xfbc\xe7.\xe5:f\xcf\x82\xf8.\xd2s\xae\x99&\
+\x00\xe7\x05;f\xf5\xd0^\xd5K4=I\x10\xb6\x93\
+3`\xb3\xdb\xca\x1a\x97\xcc\xc8\xea\xd9\xd8,\x01 D\
+9\xb1\xd9{HZwM \xe5\xfa\x1cL\x91\xae\xbf\
+\xb8\xe9\xce5\xa8rT\x09U\x8e\x9a\xd2\xed\xa7\xb6\xbd\
+i\x02\x00i\xae\x0av\xd1\xe8\x98'\xb5\xd4\x06!\xda\
+\xe9\xc0\x00\x96\xbe\x13\xf6\x95\xdc\x9f\xade\xb3\x04\xa0\xd0\
+\xc6N\xde\xbc\xb44\xedD*n\x7f\x1b\xecu(\xba\
+?{\xab\xe6\x15\xe3\xad\x90t\xb5Lu\xfb4\x1b\x9a\
+&\x00\x09\x9cn\x7f\x142\xfe2G\x9a\x98Es\x9d\
+\x19\xd0\xf20\x8aY\x02\x80Q\xd1\xa9\xa1\x9a\x83\xfe\x98\
+.U\x0b\x82\xed_\xec\xa6\xb2\xee\xbb\xef\xe9\xe0* \
+\x05\xd5/z\xa75\xa4\xd3Gm[s\x05\xa0.\xfa\
+'(\xdb4G-X\xd1\xce\x00\x060y\x04\xea\xea\
+\xc1\xe5$m>f\x09\x80\x8dIg5\xd6\x96l\xcb\
+$\x0aX\x05\xdc\x07\xab\x80\xefd\xd2W\x8f>p\xab\
+\x15r\x1c\xbaF\xe48\xd4\xc2\x97\xa9\x02P\x1e\x88>\
+J\x19\xbbX\x8b@\x84\x8d\xec\x19 \x08\xado\xaeq\
+-\xc9\xde\xd2\xe7\x16L\x13\x80,\xf6/\xe6\x07\xbb\x9c\
+\x03lo\x22\x83p\x81\x96\x5cdc\xcbN\xa4K\xb7\
+xK~\x9b\x8d\x8dd}M\x15\x00O0r\x0e\x9c\
+\x8f\x7f^\xeb\xa0\x84\xbd\xf4\x19 \x84l\x9a\x8cJ\x16\
+\x8fu\x856}\xab\x08\x99%\x00\xd9n\x9e\xb9\x83\xb1\
+[\xe1\x98\xf7\xcd\x99\xc4\xacG\x9fDj\xfc\x16\x9f\xe3\
+H\xadm\x9b*\x00\x89`\xb8\xacv\xa35\xcb\xdc\xdb\
+c\xbf\x85<\xfa\x97\xea\x01\xd3,\x01\x80\x8cPU\xa1\
+\xa5\x8e\xc6Lc\x82M\xea\xf1;Y\xf4\x13\xb8)\x9a\
+4\xb7`\xa6v\xb3\xe9'a|M\x93\xcfyo6\
+6\x0e\xeck\xbe\x00\x04[\xef`\x94\x9f,\xadZ\x92\
+k\x05[\x90)\xe5NH\xa0\xf9#\xbd\xb0ZX\xf1\
+M\xeb\x00\x00\x0e9IDATU\x00\x12|\xb8\x83\
+\xad\xd7 \x8a\x7f\xae\x177\xe9\xdaM$b=\xac\xc7\
+y\xd8\xe3\x17\xe3\xa47Q\xd3\xb57\xf8\x03\x1cl\x7f\
+\x98Q\xf9\x9b\x99\xf4\xcd\xb4O\x22g#\x9c1\xf9\xfc\
+\x03\x05\x1b^\x06\xa5\x1dQ\xc9%S\x07\xa2\x9f:\x06\
+$\xcc\xe0\x17\xa5T\xd3_\x94\x03=[Y\x00\x12\xb1\
+\x94\x05b\xefcFg\xabcT\xffV\x12&\xb76\
+\xf9\x1c\xab\xb4\xf2\xc4\x85\x00$R`C>\xbc\xe73\
+\xad\x11\xa0\x15\x19\xf9b\x07n\xf6}d\xb3\x93\x95[\
+\x96\x96l\xd6;f\xab\x0b@\x22Ik\x9c\xf2sk\
+\x15~=\xfb\xa7`\xd7\xa1j\xae:\xab\x19[.\x04\
+ \x01t\xf1\xba\x9d\x87\xec\x91\x07\xd6B\xb6\x1c\xb1\x12\
+P3r\x19\xb6!\x18?6\x19;\xbe\x0d\x13\xa8+\
+C\x13iu\xb3\xba\x00\xec[\x05D^\x83\x15\xea\x97\
+\xd3\x0a\x5c\xc7\xc6\x98\xd8~\x16\xf2\xce\x18\xad\xa0nZ\
+\x9e\xb9\x11\x80!\xd4\x1e\x7f\xeb#P\xf5\xe7\xf2\xb4\xa2\
+\x10\x8dS2\x80\x11\xd9\x0b\xf7\xcc\xbf\x0d\xa7\xfb\x9eH\
+\xd9X\xc3\x06\xb9 \x00\xf3\x82;\x97\x0e\xd0\x81z\x0d\
+i\xc9\xda\xd4A\xf6\x83\x0e]\xbf\xa4h{\xb6\x86\xb8\
+\x13\x80D@\x95\xeb\xda\xe7R9\xfec\xca\xf0\xe9\xd9\
+\x06(\xfa\x03\x03P\x89\xb6H*\xbc\xf99\xef\xe4\x7f\
+\x19\xcdG.\x08@\x823w0\x1aF\x94\xe9v$\
+7\xddq!\x0c\xdf\xdf\x5c\xeb\xcc\xfa\xb0\x12\x97\x02\xf0\
+\xdf\xd5@p\xc7U\x88\xca?\x82\x9d\xea\xd2t\x09\x12\
+\xed!\xd18&\x7fD\x12Z\x95\xcd\xeb\xb0ly\xcc\
+\x15\x01(\xaf\x8fUP\x85f\xfcZ1[\x1e\x93\xf5\
+/.$\xb3\x9f]\xe4\xf80\x1b\xdb\x5c\x0b@\x220\
+\xd8\x18\xc4\x15\x0d\xd1k\x15\x8a\xbe\xcf\xd3;\xd9lH\
+\xd7\xbbo\xa26\x9e\x84\x0bV5\xfb\xa6?\xa4\xb7\xaf\
+T\xf6sE\x00\xf6\xad\x02b\xeb\xe1p\x90\xae\xd7s\
+S\xf19\xec\xef\x1a\x1c\xdb\xe6^\x00\x86\x02^\xb9\x99\
+\x15\xfe\xa3;r-\xa4\x12\xbf\x86\xf7\xb2Yi\x0d\xa2\
+\x86\x8d\x13\xf5\x11\x89\x0d=<c\x82\xe3\xfe\xb5\xf3\xf1\
+^\x0dMgl*\x97\x04`~\xc3\x8eS\xfa\xe5x\
+\xda\x17\x8c2&OE\xc7\x89d\xe2\xffl\xf4\x16\xbf\
+\xab\xa2i\xd2&\x96\x11\x80\xfd\xd1\xbb\xfd\xed\xcb0\x93\
+/\x84\x83\x11U\x99\x06\x9eK\xfd\xa0\xaa\xcc_)\x92\
+\x1en\xf1\xcdX\xcd[\x5c\xb9$\x00\x09n\xcb\xeb\x22\
+\x8fS\x8c\xbe\xce\x0f\xcf\xd2\xe3\xe1\x9a\x92\x8c\xef\xd3X\
+R\x00\x86\xc8O\xd4\xd3\xeb\xc2}\xcb\x88\x8c\x961L\
+5?'\xcd\xcf 'G\x02\xef\x84\x1b\xa1\xdc\xd9\xaf\
+\x1b\x97:L-\xb02\x16O\xb9&\x00\xbc\x15\x16M\
+p\x0f5+Nzqif\x05m,-\x00\xfbO\
+\xbc\xc1\xe5\x19\x8d\xcf\x87\xb2_\xf3\xe1\x11A\x97\xab\x93\
+|\x08\x02\xdb\x86\xb0\xada*&\xeb\xacP\x06=\xd7\
+\x04`\xdf*\xa0\xf5\x97\x14^\xa9\xf21\x1f\x06\xf7\xc9\
+\xeaZjK/\xc8\x04O\xce\x08\xc0\xfe\xc1\x9f\xb3\xb6\
+\xe3\x0b\x036y\x1e\x14\x7f\x9c\x0fUy\xaa(\xbc\x07\
+\xcb\x84\x1c\x1e\xfa@5\x1e\xca\x10z\x05\x8a\x904\x8e\
+\x8b\xa3u\xcf/+y\x9f\x07\x5cj1\xe4\xa2\x00T\
+>\xd5\xed\x8a\xdb:?\xe1\xa9\x08\x0cF\x18\x12\xa08\
+\xd3\xde\x9f\xc8I\x01\xd8\x7fr^\xfe\xc8k\xf6\x8f\xa6\
+|\xe1\x14\x8c\xe3\xa7(\x0a>\x85 \xf9\xabp\xd0\xe8\
+P\xb5\x13\xd8\xe8vC_xF\xf0+6I\xda6\
+I\x99\xf6\x0a\x9c\xda\x1b0\x1a\x87V\xferQ\x00\x06\
+W\x01\xf5\x91\xdb\xa8\x82\x0c+\xe1\x95j<\xe0G\xa2\
+\xbe\xa5\xc6\xe5M\xd5\xee\xc0\xbf\xe7\xbc\x00$#\xe4\xfc\
+\xba\xdd\x87wJ\xf1S$\x86\xbe\xaa0\xe5\x8b\x98\x91\
+\xd9\x94\xb0\xd9P\x13p\xd8%\xa5t\xc9L\xb7=\xa8\
+v7b\xca;pJ\xefm&\x91w\x08Fo\x1f\
+\xc4J^\xb3\xf2\x17\xfe@\x0erU\x00.\x7f\x8d\x15\
+}\xf0A\xe4\x13\x18\xc3\xe9\xe9\x8e\xbb^\xed\x19\xb1\x9f\
+\xd2\xe2\x9d\x9eV\xc9\xf3\xbc\x14\x80\xa4\x03\xc0\x18qo\
+\xe8\x9cm\xa7}\xb3\xe3\x0a\x9a\xcd\x10M\x08\xc2lx\
+\x84\x98\x06\x95q\x8a\xe0\xcar\x11\x88D\x11\x9c\xc0*\
+\xa2\x98\x15\xc1\xdfl\xc9\xec@\x85\xd7~(0\xdaK\
+\x10\xeb\x85\xab\xa4]\x8c)1Dp\x0c\xda\xc60\xb6\
+\xc5\x10\x85\x7fm86\x8e\xb2\xf7\xd2\xc9[\xaf\xd7\xa4\
+\xd1\xdbn\xae\x0a\xc0\xbeU@\xec{p8\xc8\xd0r\
+\xdec\x8e\x17\xc6~H Z\x9b\xce\x98\x0a\x01H\x87\
+\xad\xfd\xda&\xb2\x1aO\xb0\xa3\xa2]\x13v\x14\x15v\
+\xc0\xd39\x9a\xd8\x0b\xab\xb0\xdez\xafW\xc9\xd0dN\
+v\xcbe\x01H\x0cX\x99?\xf6\x01F\xf4\x08^\x06\
+/\xddl\xc8\x9eg\x22\x0f\xc1\x0e\xd9\x95F\xe2\x1f\x91\
+\x0f\xc0H\xe7\xc2\x97\xb1\x0c\xe4\xbe\x00D/\xc5\x88\xfd\
+\xdaXVG\xf7\x06\xab\xcfgZj\x1c\xcb\xd4\xe2)\
+\x0bD\xef\x87\xd5\xecJ\xb5\xed\xb5h'\x04@\x0b\x16\
+-b#\xd7\x05 1\x0c\xee@\xeb\xeb\xf0\xa8x\x12\
+/CR0\x1e\xce\x05,Tw.\xa0\x22\xd0z\xaf\
+\xc2\xf0\xd5Fb\x17\x02`$\xdb&\xfb\xca\x07\x01(\
+\xf3\xb7Uc\xa4\x04M\xa6\xfas\xf7\x0c?\x1d\xaeu\
+.W\x83\xc7\x1d\x88\xdc\x0398\xbe\xa7\xa6\xadVm\
+\x84\x00h\xc5\xa4\x05\xec\xe4\x83\x00\xec[\x05D[\xe0\
+D\xce\x5c^\x86d<\x22'<_\xe3x;\x15\x1e\
+w v\x17bT\x93\xe4\x22\xa9|\x0d\xfd\x1d^u\
+w\x1b\xfa\xbaM-0\xd1N{\x06\xf2E\x00x\xbb\
+.\xac\xb6\xbc8\x9cj\xfc)\x9cj\xd4-)l\xb2\
+\x19%\x04@\xfb\xef\x19\xb7\x16\xf3E\x00>\xdb\x0b\xd8\
+\x00{\x01\xe7\xf32\x18\xe3\xd0\xc4\xe3^\xa8)\xfe\xdb\
+Xx<\x81\xb6\x1f\xc3\xab\xea\x1b\x8d\xc4,\x04\xc0H\
+\xb6M\xf6\x95O\x020\xffY\xb8\x8f\xd2\xc7\xcfua\
+\xb8\x1e\xfeh\xa8\xd6y\xc9XS\xa0\x22\x10Y\xa50\
+t\x8b\x91\xd3D\x08\x80\x91l\x9b\xec+\x9f\x04 A\
+5o\xd7\x85'\x90)Gn\xf2\x8e\xfb`\xb4i\x00\
+{\x007\xc1\x1e\xc0mFN\x13!\x00F\xb2m\xb2\
+\xaf|\x13\x00\xde\xae\x0b\xc3\x97\xed\xc1\xe6\x1a\xe7\xa8\xef\
+\xf9=\xc1\xe8\x0f\x19ew\x189M\x84\x00\x18\xc9\xb6\
+\xc9\xbe\xf2M\x00\xf6\xad\x02\xa2p]\x98qs]x\
+*\xb1\x1f2\xda\xd5\xf1\xf2`\xf4;\x942\xa8\x86l\
+\xdcG\x08\x80q\x5c\x9b\xee)\x1f\x05\xa0r\x1d\x5c\x17\
+\x8ew\xc1E!j7}\x00\x12\x000\xb9\x1bJ\xbe\
+_\x97\x0cKE\xb0\xfdr\x85\xca\x8f\x18\x89S\x08\x80\
+\x91l\x9b\xec+\x1f\x05`p\x15P\x1f\x83\xeb\xc2\x94\
+\x8b\xeb\xc2\x89jB\x85\x13\x8a\x5c/\x9c;y\xf7\x81\
+\xd3\xa12\xd8\xba\x5c\xa6\xf8I#\xa7\x89\x10\x00#\xd9\
+6\xd9W\xbe\x0a\xc0\xf2'\xd9\x84O\x0b\x22\x1f\xf3r\
+]X\xc2\x08j\x0a\xbaV\x1d8\x1d\xcc(z\x22\x04\
+\xc0\xe4/\xa5\x91\xee\xf3U\x00\x12\x1cC\x81\x9b\xef\xc9\
+q\x99\x8b\xeb\xc2\x90\x12k\xf7\xe9\xbd}\xa5\xab.\x9e\
+5\xac\xb2\xb0\xbb\xbe\xfd\x5c\xa4\xc8\xcf\x199'\x84\x00\
+\x18\xc9\xb6\xc9\xbe\xca\xea\x22+0F\x8f\x19\x0d\x03\xdb\
+H\x95\x99\x05Q\x86\xe2\xf5\xd4E?d\x98}\xc1\xe8\
+\xf8\x93\xf9#\x12\xba\xae\xb9\xdau\xf7\xfe\x7f\xab\xaa\xdb\
+\xee\x8ec)d$>!\x00F\xb2m\xb2\xaf\xbc\x17\
+\x80@\xf42H\xda\xb9\xc6\xe4a\xd8\xe7\x1e\x93Oa\
+3\xf0\x90\xfd\xb1T\xd4\xc5NS0}\xd5H|B\
+\x00\x8cd\xdbd_\xf9.\x00\x09\xfa=u\xado@\
+a\xd6\x13M\x1e\x8aA\xf7\x12\xa2\xdfn\xaa9\xf8\x81\
+!,\xf36\xb6\x9d8\xd0\xab\xbca$6!\x00F\
+\xb2m\xb2/!\x00 \x00\x81\x88\x971\x140y(\
+\x06\xdd\x13D\xdeo\xaeq\x1c5\x84\xc5\x8c\x83KB\
+\x00x\x98\x09\x06a\x10\x02\xb0\x8fh\x8f?\xba\x15j\
+6~\xcd \xda\xc7t#a\xe9\x92&_\xc9\xa3\x89\
+F\xf3_\xe8\x9d\xd9\xdf\xd9\xf1\xb1\x91\xb8\x84\x00\x18\xc9\
+\xb6\xc9\xbe\x84\x00|&\x00\x0d\xb1J&\xd3-&\x0f\
+\xc7\xa0{\xd8\x94|\xbb\xc5WzB\xe2\xff\x175v\
+\x96\xec\xdd\xdd\x95HZk\xd8G\x08\x80aT\x9b\xef\
+H\x08\xc0\xe7c\xe0\xf1\xb7>\x0b5)\x16\x9a?*\
+\x89\xd2\xf1\xc8\x17\xf2\xb9\x82\x0b~\xd7^\xdc\xbd]6\
+\xb4\x90\xac\x10\x00\x1ef\x80A\x18\x84\x00\xec/\x00Q\
+(J\xc3\xfe`\x10\xf5c\xba\x81\xe4\xa1\xbf\x87\xe4\xa1\
+\xa7o\xdd\xcal\xb7\xc7\xa2\x90\xd5\xda\xb8\x8f\x10\x00\xe3\
+\xb86\xdd\x93\x10\x80\xe1C\x00\x1b\x82O\xc0\x86\xe0E\
+\xa6\x0f\x0c\x00 \x12\xa9l\xaev4\xb9\xfd\x11(,\
+d\xdcG\x08\x80q\x5c\x9b\xeeI\x08\xc0\x01\x02\xb0~\
+\xc71l \xfe\xae\xe9\x033\xb8\x19@\x9a\xc3\xb5\x8e\
+\x0a!\x00\x5c\x8cFn\x82\x10\x020r\x5c\xcd\xc8\xc5\
+?\xfa\xec*\x9a\x83POZ\xe5\xc4\xb2\x9d\xa9b\x05\
+\x90-\x83\x16\xea/\x04`\xe4`-\xd8\xd8^\xda\xd5\
+\xa7|2Zy9C\x87\x97\xa1\x06\x84\xd1R#}\
+\x0a\x010\x92m\x93}\x09\x01H>\x00f$\xe3\x1c\
+m*\xc0)E\xd9H1\x12\x02`\xf2\x97\xd2H\xf7\
+B\x00\x92\xb3\x9d\xb8.\x1c\xb1G?\x81z\xd4\xd3\x8c\
+\x1c\x0f\x1e|\x09\x01\xe0a\x14\x0c\xc2 \x04`t\xa2\
+=\x81\xd8\xf7\x19\xa3?3h(\xb8q#\x04\x80\x9b\
+\xa1\xd0\x1f\x88\x10\x80\xb19\xf6\xf8c\x1fB)z.\
+\xae\x0b\xeb?\x1b\xf6y\x10\x02`\x14\xd3\x1c\xf8\x11\x02\
+\x90B\x00x\xba.l\xd0|\x11\x02`\x10\xd1<\xb8\
+\x11\x02\x90z\x14<\xfe\xc8\x1bp\x12\x87\x8b\xeb\xc2\xa9\
+\xd1f\xdfB\x08@\xf6\x1cZ\xc6\x82\x10\x80\xd4C\x05\
+o\x04\xe0\xba\xb0\xc2\xc5u\xe1\xd4h\xb3o!\x04 \
+{\x0e-cA\x08\x80\xba\xa1\xe2\xe9\xba\xb0:\xc4\x99\
+\xb7\x12\x02\x909w\x96\xeb)\x04@\xdd\x90y8\xba\
+.\xac\x0eq\xe6\xad\x84\x00d\xce\x9d\xe5z\x0a\x01P\
+?d<]\x17V\x8f:\xfd\x96B\x00\xd2\xe7\xcc\xb2\
+=\x84\x00\xa8\x1f:\x8f\x7f\x0f\x5c\x17\xee\xe1\xe2\xba\xb0\
+z\xd4\xe9\xb7\x14\x02\x90>g\x96\xed!\x04 \xbd\xa1\
++\xf3G\x9e\xc4\x08-O\xaf\x97\xb5Z\x0b\x01\xb0\xd6\
+xe\x85V\x08@z\xf4yx\xba.\x9c\x1et\xd5\
+\xad\x85\x00\xa8\xa6\xca\xfa\x0d\x85\x00\xa4?\x86\xe5\xfe\xe8\
+\x03\x14\xb1\xab\xd2\xefi\x8d\x1eB\x00\xac1N\x9a\xa0\
+\x14\x02\x90>\x8d\xd5\xc1\x1d\x07\xeff\xf2'PPD\
+J\xbf7\xff=\x84\x00\xf0?F\x9a!\x14\x02\x90\x19\
+\x95\x15\xfe\xb6\xdb\x15\xa4\xdc\x90Yo\xbe{\x09\x01\xe0\
+{|4E'\x04 3:\xab\x83l\xe2n\x06\xd7\
+\x85\x19\x9a\x9a\x99\x05~{\x09\x01\xe0wl4G&\
+\x04 sJ+\x82\x91k\x15\x8a\x86\x15\xf3\xcc\xdc\x1a\
+?=\x85\x00\xf03\x16\xba#\xc9\xe7\xf2\xe0Z\x90\xeb\
+\x09D?\x82\xbd\x80YZ\xd8\xe2\xc5\x86\x10\x00^F\
+\xc2\x00\x1cB\x00\xb2#\xb9\x22\xd8~\xb9B\xe5G\xb2\
+\xb3\xc2Wo!\x00|\x8d\x87\xaeh\x84\x00dO\xaf\
+'\xd0\xfa&cx\xb0\x94W.|\x84\x00\xe4\xc2(\
+\xaa\x8cA\x08\x80J\xa2\xc6h\xe6\x0e\xb6\xf9\x10U\xfc\
+\xd9[\xe2\xc3\x82\x10\x00>\xc6\xc1\x10\x14B\x00\xb4\xa1\
+\x196S_\x82z~gkc\xcd\x5c+B\x00\xcc\
+\xe5\xdfP\xefB\x00\xb4\xa1\xdb\x1dl\xadB\x14\xbf\xa8\
+\x8d5s\xad\x08\x010\x97\x7fC\xbd\x0b\x01\xd0\x8e\xee\
+\xb2\xba\xd8F\x8c\xe9\x02\xed,\x9acI\x08\x809\xbc\
+\x9b\xe2U\x08\x80v\xb4W\xd4\xc5NS0}U;\
+\x8b\xe6X\x12\x02`\x0e\xef\xa6x\x15\x02\xa0-\xedP\
+K\xe0i\xa8%\xb0L[\xab\xc6Z\x13\x02`,\xdf\
+\xa6z\x13\x02\xa0-\xfd\x9e`\xf48F\xd9;\xdaZ\
+5\xd6\x1aF\xb8\x1br\x1e\x88O>0 \x04@\xfb\
+Qv\x07b\xab\x11\xa3Who\xd9\x18\x8bB\x00\x8c\
+\xe1\x99\x0b/B\x00\xb4\x1f\x86\xf3\x82\x1d\xb3zh\xef\
+G\xda[6\xc6\xa2\x10\x00cx\xe6\xc2\x8b\x10\x00}\
+\x86\x01V\x01w\xc1*\xe0\x07\xfaX\xd7\xd7\xaa\x10\x00\
+}\xf9\xe5\xca\xba\x10\x00}\x86\x03\xae\x0b\x8f\xdf\xad@\
+]A\xcc\x5c\xfax\xd0\xcf\xaa\x10\x00\xfd\xb8\xe5\xce\xb2\
+\x10\x00\xfd\x86\x04n\x0a^\x067\x05\xd7\xe8\xe7A\x1f\
+\xcbB\x00\xf4\xe1\x95K\xabB\x00\xf4\x1d\x16\xb7\xbf\xf5\
+\x15\x84\xf0\x99\xfaz\xd1\xd6:\xc3\xa4K\xbc\x05\xd0\x96\
+Sn\xad\x09\x01\xd0wh*\xd7\xb5\xcf\x95\xe3r\x8b\
+\xbe^\xb4\xb5\x0eY\x8e>\x11\x02\xa0-\xa7\xdcZ\x13\
+\x02\xa0\xff\xd0T\x04\xda\xeeU\x98r\xb5\xfe\x9e4\xf2\
+\x80\xd9\x1bB\x004\xe2\x92w3B\x00\x8c\x19!+\
+\xe5\x0c\x80=\x80\x80\x10\x00c\xe6\x85\xe9^\x84\x00\x18\
+3\x04\x95umg\xcaX\x81\xfd\x00\xfe?\x98\xe0e\
+B\x00\xf8\x1f'M\x10\x0a\x01\xd0\x84FUF*\xea\
+[oT\x14\xfccU\x8dMj\xc40\x96'\x1e,\
+M\x15\x02`\xd2\x00\x18\xedV\x08\x80\xb1\x8cW\xd4G\
+A\x04\x18\xb7\x22 atk\x93\xcf\xb5J\x08\x80\xb1\
+\xf3\xc24opy\xe5\x02\xb8\xbc\xb2\xd6h\x006\xbb\
+\xbd\xbcq\xc9\xf4\x90\xd1~y\xf0\xc7\xad\x08`\xf6\xe9\
+\x8d%\xae\xc3\xe7\xce\xc5\xb2\x10\x00\x1ef\x8a\x01\x18j\
+\x9f\xdb;\xbd\xad\xbb\xbb\xdd\x00W\xc3\x5cL\x9a2\xd1\
+\xb1\xa1\xb2\xb8\xcdh\xbf\xbc\xf8+\xf7\xb7_\x01\x95\x85\
+\x1e\xc0\x88\xd9y\xc0\x841\xd9\xc3\xd8\xb8\xf2p\xcdA\
+\x7fI\xe0\x11\x02\xc0\xc3\xa8\x18\x84\xa1\xcc\x1f{\x15#\
+z\x9aA\xee`r\xb15\xa1\x9aR\xcb\xde\x96\xd3\x8a\
+\xa7D\xa5a<\xa0@\xa1Q\xea\xd6\xcaf&v0\
+\x22\x1f\x15\xda\xe9\xa5/,qm\x1d\xea/\x04 \x13\
+&-\xda\xe7\xfc\xc7vO\xee\x1a\xdf\xf3\x14C\xe4\x5c\
+\xbdC \x12\xb9\xab\xb9\xda\xf1C\xbd\xfdX\xc9~e\
+\xb0u\xb9\xc2\xd0E\x90Z\xdcc4n\x86\xa4\xf5\xd3\
+\xc8\x8c\xcb\xea\xbdx\xd7\xfe\xbe\x85\x00\x18=\x12\x1c\xf8\
+s\xfbc\x90\xc9\x06{\x18\x93=\x18\xe3C\xb4\x82\xc4\
+\x10\xfe\x13!t+\xa3\x05\xeb\xc35\xd3\x07\x97\x98\xe2\
+3\x92\x81\x85\xc1\xcec\xfbPw\xb9\x8c\xe8q\x98\xe1\
+\xe3\x11b\xc7\x83(\x14j\xc9U\x22\xdb\x8f\x82\xd0\x1f\
+\x11A[')l\xed\xb3\xb5\xae\x8f\x93\xd9\x17\x02\xa0\
+%\xeb\x16\xb4\xe5\x09\xee:\x0c\xe1\xbe\xaf`$\xcdR\
+\xa84\x19Se\x0a\xc3t\x12\x82\x09I0-L\xfc\
+\xcb$\x22a\x85\x0d`\xcc\xfa\x15\xc6\xfa\x09\x22\xbd\x8c\
+\xb0\xdd\x12\xc1\x1d2S:\x08\x1a\xff\xd6\x19\xdd{^\
+[u\xf1\xac>\x0bR\xc0\x05\xe4\xcb_cE\xdb?\
+\xfax\x12!\x13\x8a\xbb\xfb\xe5I\xe3\x0b3{<\xb7\
+\xd3\xc2\x9en\x84\xbbB\xde\xa9\xffV\x13\xd8\xff\x07\xa6\
+_\x9d\x96\x06\x08\xbcE\x00\x00\x00\x00IEND\xae\
+B`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x08\
+\x05\xe2A\xff\
+\x00l\
+\x00o\x00g\x00o\x00.\x00i\x00c\x00o\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x90\xbd\xecS \
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()